@@ -1,10 +1,19 @@
 
 from manim import *
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from herramientas import SegmentCacheCamera
 
 
 
 
 class Coor_esfericas(ThreeDScene):
+    def __init__(self, **kwargs):
+        # Cámara que reutiliza geometría y frames cuando solo se mueve la cámara
+        super().__init__(camera_class=SegmentCacheCamera, **kwargs)
+
     def construct(self):
 
         # ========================
@@ -1,6 +1,15 @@
 from manim import *
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from herramientas import DepthSortCamera
 
 class EsferaAEsferoideOblata(ThreeDScene):
+    def __init__(self, **kwargs):
+        # Orden de profundidad incremental: no reordena todas las caras en cada frame
+        super().__init__(camera_class=DepthSortCamera, **kwargs)
+
     def construct(self):
 
         # Cámara
@@ -48,6 +57,10 @@ class EsferaAEsferoideOblata(ThreeDScene):
 
 
 class SphereToOblate(ThreeDScene):
+    def __init__(self, **kwargs):
+        # Orden de profundidad incremental: no reordena todas las caras en cada frame
+        super().__init__(camera_class=DepthSortCamera, **kwargs)
+
     def construct(self):
         
         axes = ThreeDAxes(
@@ -1,7 +1,16 @@
 from manim import *
 import numpy as np
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from herramientas import DepthSortCamera
 
 class SurfacesAnimation(ThreeDScene):
+    def __init__(self, **kwargs):
+        # Orden de profundidad incremental: no reordena todas las caras en cada frame
+        super().__init__(camera_class=DepthSortCamera, **kwargs)
+
     def construct(self):
 
         axes = ThreeDAxes()
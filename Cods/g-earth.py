@@ -1,7 +1,16 @@
 from manim import *
 import numpy as np
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from herramientas import SegmentCacheCamera
 
 class CampoGravitacional(ThreeDScene):
+    def __init__(self, **kwargs):
+        # Cámara que reutiliza geometría y frames cuando solo se mueve la cámara
+        super().__init__(camera_class=SegmentCacheCamera, **kwargs)
+
     def construct(self):
         
         # -------------------- EARTH IMAGE --------------------
@@ -55,6 +64,9 @@ class CampoGravitacional(ThreeDScene):
                     )
                     
                     arrows.add(arrow)
+
+        # Las flechas comparten color: se dibujan en lotes por grosor en lugar de una por una
+        self.camera.enable_batching(arrows)
         
         # -------------------- ANIMATION --------------------
         # Fondo negro
@@ -1,5 +1,13 @@
 from manim import *
 import numpy as np
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from herramientas import install_tex_cache
+
+# Fórmulas compiladas una sola vez y compartidas con las demás escenas
+install_tex_cache()
 
 class Plot1(Scene):
     def construct(self):
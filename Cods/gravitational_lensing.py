@@ -0,0 +1,64 @@
+from manim import *
+import numpy as np
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from herramientas import LensingRenderer
+
+BACKGROUND_IMAGE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "cumulojoyero2.jpg")
+
+
+class GravitationalLensing(Scene):
+    """
+    Un agujero negro cruza delante del cúmulo Joyero: sombra, anillo de
+    Einstein e imágenes dobles de las estrellas. La imagen se calcula en cada
+    frame con LensingRenderer (tabla de deflexión precalculada y un solo
+    remapeo vectorizado), a la resolución del render.
+    """
+    def construct(self):
+        height, width = config.pixel_height, config.pixel_width
+        lens = LensingRenderer(
+            BACKGROUND_IMAGE,
+            (height, width),
+            observer_distance=100.0,
+            source_distance=100.0,
+            fov=30 * DEGREES,
+        )
+
+        # Posición del agujero negro (en píxeles) y desplazamiento del fondo
+        # (la cámara se mueve respecto del cúmulo)
+        travel = ValueTracker(0)
+        pan = ValueTracker(0)
+
+        def lens_center():
+            t = travel.get_value()
+            return (
+                height * (0.5 + 0.12 * np.sin(PI * t)),
+                width * interpolate(0.2, 0.8, t),
+            )
+
+        sky = ImageMobject(lens.render(lens_center()).copy())
+        sky.set_resampling_algorithm(RESAMPLING_ALGORITHMS["nearest"])
+        sky.stretch_to_fit_height(config.frame_height)
+        sky.stretch_to_fit_width(config.frame_width)
+
+        def update_sky(mob):
+            # Escribe directamente en el pixel_array de la imagen (sin copias)
+            lens.render(lens_center(), offset=(0, pan.get_value()), out=mob.pixel_array)
+
+        sky.add_updater(update_sky)
+
+        title = Text("Lente gravitacional", font_size=40, color=WHITE).to_corner(UL)
+        subtitle = MathTex(
+            r"\alpha(b) \approx \frac{4GM}{c^2 b}",
+            font_size=36,
+            color=WHITE
+        ).next_to(title, DOWN, aligned_edge=LEFT)
+
+        self.add(sky)
+        self.play(Write(title), Write(subtitle), run_time=1.5)
+        self.play(travel.animate.set_value(0.5), run_time=5, rate_func=smooth)
+        self.play(pan.animate.set_value(-0.15 * width), run_time=4, rate_func=smooth)
+        self.play(travel.animate.set_value(1), run_time=5, rate_func=smooth)
+        self.wait(1)
@@ -0,0 +1,244 @@
+from manim import *
+import numpy as np
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from herramientas import GeometryResolution, LiveNumberLabel, Polyline, cached_array
+from herramientas.kerr import (
+    bound_orbit_initial_conditions,
+    horizon_radius,
+    integrate_kerr_geodesics,
+    to_cartesian,
+    zamo_initial_conditions,
+)
+
+# Agujero negro de Kerr (unidades de M)
+SPIN = 0.9
+MASS = 1.0
+
+
+@cached_array
+def bound_orbit_positions(p, e, inclination, a, M, t_max, num_samples):
+    """Trayectoria (S, 3) de una órbita ligada, guardada en la caché de arreglos"""
+    state, E, L = bound_orbit_initial_conditions(p, e, inclination, a, M)
+    solution = integrate_kerr_geodesics(state, E, L, a, M, t_max=t_max, num_samples=num_samples)
+    if not solution.reliable()[0]:
+        raise RuntimeError(f"bound_orbit_positions: la órbita p={p}, e={e} no es ligada o se integró mal")
+    return solution.positions[0]
+
+
+@cached_array
+def infall_positions(r0, num_particles, a, M, t_max, num_samples):
+    """
+    Trayectorias (N, S, 3) de partículas soltadas desde el reposo (respecto
+    del ZAMO) sobre una esfera de radio r0. Después de cruzar el margen del
+    horizonte cada una queda en su última posición (en tiempo coordenado no
+    llegan a cruzarlo).
+    """
+    # Puntos repartidos de forma pareja sobre la esfera (espiral de Fibonacci)
+    k = np.arange(num_particles) + 0.5
+    theta = np.arccos(1 - 2 * k / num_particles)
+    phi = np.pi * (1 + np.sqrt(5)) * k
+    state, E, L = zamo_initial_conditions(r0, theta, np.zeros((num_particles, 3)), a, M, phi=phi)
+    solution = integrate_kerr_geodesics(state, E, L, a, M, t_max=t_max, num_samples=num_samples)
+
+    # Después de su final (NaN) cada partícula queda en el punto donde terminó
+    end = solution.end_coords
+    final = to_cartesian(end[:, 0], end[:, 1], end[:, 2], a)
+    positions = solution.positions
+    return np.where(np.isnan(positions), final[:, None, :], positions)
+
+
+def to_scene(axes, coords):
+    """Coordenadas (..., 3) de la órbita a puntos de la escena según los ejes"""
+    origin = axes.c2p(0, 0, 0)
+    basis = np.array([axes.c2p(1, 0, 0), axes.c2p(0, 1, 0), axes.c2p(0, 0, 1)]) - origin
+    return origin + coords @ basis
+
+
+def create_black_hole(axes, a, M):
+    """Horizonte exterior r_+ y eje de giro"""
+    unit = axes.c2p(1, 0, 0)[0] - axes.c2p(0, 0, 0)[0]
+    horizon = Sphere(
+        radius=horizon_radius(a, M) * unit,
+        resolution=GeometryResolution()["sphere_resolution"],
+        fill_color=BLACK,
+        fill_opacity=1,
+        stroke_width=0
+    ).move_to(axes.c2p(0, 0, 0))
+    spin_axis = Arrow3D(
+        start=axes.c2p(0, 0, 0),
+        end=axes.c2p(0, 0, 6),
+        color=WHITE,
+        thickness=0.01
+    )
+    return VGroup(horizon, spin_axis)
+
+
+class LenseThirringPrecession(ThreeDScene):
+    """
+    Órbita inclinada alrededor de un agujero negro de Kerr comparada con la
+    misma órbita en Schwarzschild: con espín el plano orbital precesa y la
+    línea de nodos avanza en cada vuelta (Lense-Thirring).
+    """
+    def construct(self):
+        p, e, inclination = 10.0, 0.3, 45 * DEGREES
+        t_max, num_samples = 6000.0, 3000
+
+        axes = ThreeDAxes(
+            x_range=[-16, 16, 4],
+            y_range=[-16, 16, 4],
+            z_range=[-10, 10, 5],
+            x_length=7,
+            y_length=7,
+            z_length=4.4,
+            axis_config={"color": GRAY_C, "include_ticks": False}
+        )
+        self.set_camera_orientation(phi=70 * DEGREES, theta=-50 * DEGREES, zoom=0.9)
+
+        # Misma órbita (p, e, ι) con a = SPIN y con a = 0
+        kerr_orbit = bound_orbit_positions(p, e, inclination, SPIN, MASS, t_max, num_samples)
+        kerr = to_scene(axes, kerr_orbit)
+        schwarzschild = to_scene(axes, bound_orbit_positions(p, e, inclination, 0.0, MASS, t_max, num_samples))
+
+        # Nodos ascendentes (z pasa a positivo) en la grilla de t y longitud de cada uno
+        z = kerr_orbit[:, 2]
+        node_indices = np.flatnonzero((z[:-1] < 0) & (z[1:] >= 0)) + 1
+        node_angles = np.unwrap(np.arctan2(kerr_orbit[node_indices, 1], kerr_orbit[node_indices, 0]))
+
+        progress = ValueTracker(1)
+
+        def current_index():
+            return int(np.clip(progress.get_value(), 1, num_samples - 1))
+
+        kerr_trace = Polyline(color=ORANGE, stroke_width=2)
+        kerr_trace.set_points_as_corners(kerr[:2])
+        schwarzschild_trace = Polyline(color=GRAY_B, stroke_width=1.5, stroke_opacity=0.6)
+        schwarzschild_trace.set_points_as_corners(schwarzschild[:2])
+        particle = Dot3D(kerr[0], radius=0.06, color=YELLOW)
+
+        kerr_trace.add_updater(lambda mob: mob.set_points_as_corners(kerr[:current_index() + 1]))
+        schwarzschild_trace.add_updater(lambda mob: mob.set_points_as_corners(schwarzschild[:current_index() + 1]))
+        particle.add_updater(lambda mob: mob.move_to(kerr[current_index()]))
+
+        # Línea de nodos: del centro al último nodo ascendente alcanzado
+        node_line = Polyline(color=RED, stroke_width=3)
+        node_line.set_points_as_corners([axes.c2p(0, 0, 0), axes.c2p(0, 0, 0)])
+
+        def update_node_line(mob):
+            reached = np.searchsorted(node_indices, current_index(), side="right")
+            end = kerr[node_indices[reached - 1]] if reached else axes.c2p(0, 0, 0)
+            mob.set_points_as_corners([axes.c2p(0, 0, 0), end])
+
+        node_line.add_updater(update_node_line)
+
+        def node_advance():
+            reached = np.searchsorted(node_indices, current_index(), side="right")
+            return np.degrees(node_angles[reached - 1] - node_angles[0]) if reached else 0.0
+
+        title = Text("Precesión de Lense-Thirring", font_size=36, color=WHITE).to_corner(UL)
+        params = MathTex(
+            f"a = {SPIN}M,\\; p = {p:g}M,\\; e = {e},\\; \\iota = 45^\\circ",
+            font_size=28,
+            color=GRAY_A
+        ).next_to(title, DOWN, aligned_edge=LEFT)
+        readout = LiveNumberLabel(
+            r"\Delta\Omega =",
+            node_advance,
+            num_decimal_places=1,
+            suffix=r"^\circ",
+            font_size=32,
+            color=RED
+        ).to_corner(UR)
+        legend = VGroup(
+            Text("Kerr", font_size=24, color=ORANGE),
+            Text("Schwarzschild", font_size=24, color=GRAY_B),
+        ).arrange(DOWN, aligned_edge=LEFT).to_corner(DR)
+        self.add_fixed_in_frame_mobjects(title, params, readout, legend)
+
+        self.play(Create(axes), FadeIn(create_black_hole(axes, SPIN, MASS)), Write(title), Write(params))
+        self.add(schwarzschild_trace, kerr_trace, node_line, particle)
+        self.play(FadeIn(readout), FadeIn(legend))
+        self.begin_ambient_camera_rotation(rate=0.05)
+        self.play(progress.animate.set_value(num_samples - 1), run_time=24, rate_func=linear)
+        self.wait(2)
+
+
+class FrameDragging(ThreeDScene):
+    """
+    Cientos de partículas soltadas desde el reposo sobre una esfera alrededor
+    de un agujero negro de Kerr: no tienen momento angular (L = 0) y aun así
+    giran en el sentido del espín al caer (arrastre de marcos).
+    """
+    def construct(self):
+        r0, num_particles = 8.0, 240
+        t_max, num_samples = 120.0, 480
+        trail_length = 40
+
+        axes = ThreeDAxes(
+            x_range=[-9, 9, 3],
+            y_range=[-9, 9, 3],
+            z_range=[-9, 9, 3],
+            x_length=6,
+            y_length=6,
+            z_length=6,
+            axis_config={"color": GRAY_C, "include_ticks": False}
+        )
+        self.set_camera_orientation(phi=60 * DEGREES, theta=-60 * DEGREES)
+
+        positions = infall_positions(r0, num_particles, SPIN, MASS, t_max, num_samples)
+        paths = to_scene(axes, positions)
+        # Color según la latitud de partida: las del ecuador son las más arrastradas
+        colors = [interpolate_color(YELLOW, BLUE, abs(z) / r0) for z in positions[:, 0, 2]]
+
+        progress = ValueTracker(0)
+
+        def current_index():
+            return int(np.clip(progress.get_value(), 0, num_samples - 1))
+
+        # Todas las partículas en un solo PMobject: por frame solo se copian sus posiciones
+        particles = PMobject(stroke_width=4)
+        particles.add_points(paths[:, 0], rgbas=np.array([color_to_rgba(color) for color in colors]))
+
+        def update_particles(mob):
+            mob.points[:] = paths[:, current_index()]
+
+        particles.add_updater(update_particles)
+
+        # Estelas cortas: las últimas trail_length muestras de cada partícula
+        trails = VGroup(*(
+            Polyline(color=color, stroke_width=1, stroke_opacity=0.5).set_points_as_corners(path[:2])
+            for path, color in zip(paths, colors)
+        ))
+
+        def update_trails(mob):
+            k = current_index()
+            start = max(k - trail_length, 0)
+            for trail, path in zip(mob, paths):
+                trail.set_points_as_corners(path[start:k + 1] if k > start else path[:2])
+
+        trails.add_updater(update_trails)
+
+        title = Text("Arrastre de marcos", font_size=36, color=WHITE).to_corner(UL)
+        subtitle = MathTex(
+            f"a = {SPIN}M,\\; L = 0,\\; r_0 = {r0:g}M",
+            font_size=28,
+            color=GRAY_A
+        ).next_to(title, DOWN, aligned_edge=LEFT)
+        # Tiempo coordenado de la muestra actual
+        clock = LiveNumberLabel(
+            "t =",
+            lambda: current_index() * t_max / (num_samples - 1),
+            num_decimal_places=0,
+            suffix="M",
+            font_size=30
+        ).to_corner(UR)
+        self.add_fixed_in_frame_mobjects(title, subtitle, clock)
+
+        self.play(Create(axes), FadeIn(create_black_hole(axes, SPIN, MASS)), Write(title), Write(subtitle))
+        self.play(FadeIn(particles), FadeIn(clock))
+        self.add(trails)
+        self.play(progress.animate.set_value(num_samples - 1), run_time=14, rate_func=linear)
+        self.move_camera(phi=5 * DEGREES, theta=-90 * DEGREES, run_time=3)
+        self.wait(2)
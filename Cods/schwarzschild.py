@@ -1,8 +1,20 @@
 from manim import *
 import numpy as np
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from herramientas import DepthSortCamera, GeometryResolution, LiveNumberLabel
 
 class SchwarzschildPresentation(ThreeDScene):
+    def __init__(self, **kwargs):
+        # Orden de profundidad incremental: no reordena todas las caras en cada frame
+        super().__init__(camera_class=DepthSortCamera, **kwargs)
+
     def construct(self):
+        # Resolución de las esferas según la calidad del render
+        res = GeometryResolution()
+
         # ==================================================
         # 1️⃣ TÍTULO
         # ==================================================
@@ -36,7 +48,7 @@ class SchwarzschildPresentation(ThreeDScene):
         matter = always_redraw(
             lambda: Sphere(
                 radius=R.get_value(),
-                resolution=(24, 48),
+                resolution=res["sphere_resolution"],
                 fill_color=BLUE_D,
                 fill_opacity=0.7,
                 stroke_width=0
@@ -45,7 +57,7 @@ class SchwarzschildPresentation(ThreeDScene):
 
         horizon = Sphere(
             radius=R_h,
-            resolution=(24, 48),
+            resolution=res["sphere_resolution"],
             fill_color=RED,
             fill_opacity=0.2,
             stroke_width=1,
@@ -212,13 +224,14 @@ class SchwarzschildPresentation(ThreeDScene):
         # ==================================================
         # 7️⃣ INDICADOR DE RADIO ACTUAL
         # ==================================================
-        radius_label = always_redraw(
-            lambda: MathTex(
-                f"r = {R.get_value():.2f}M",
-                font_size=32,
-                color=BLUE_B
-            ).to_corner(UR).shift(LEFT*0.5 + DOWN*0.5)
-        )
+        radius_label = LiveNumberLabel(
+            "r =",
+            R,
+            num_decimal_places=2,
+            suffix="M",
+            font_size=32,
+            color=BLUE_B
+        ).to_corner(UR).shift(LEFT*0.5 + DOWN*0.5)
         
         radius_bg = always_redraw(
             lambda: BackgroundRectangle(
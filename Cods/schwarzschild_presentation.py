@@ -1,8 +1,20 @@
 from manim import *
 import numpy as np
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from herramientas import DepthSortCamera, GeometryResolution
 
 class SchwarzschildPresentation(ThreeDScene):
+    def __init__(self, **kwargs):
+        # Orden de profundidad incremental: no reordena todas las caras en cada frame
+        super().__init__(camera_class=DepthSortCamera, **kwargs)
+
     def construct(self):
+        # Resolución de las esferas según la calidad del render
+        res = GeometryResolution()
+
         # ==================================================
         # 1️⃣ TÍTULO
         # ==================================================
@@ -35,7 +47,7 @@ class SchwarzschildPresentation(ThreeDScene):
         matter = always_redraw(
             lambda: Sphere(
                 radius=R.get_value(),
-                resolution=(24, 48),
+                resolution=res["sphere_resolution"],
                 fill_color=BLUE_D,
                 fill_opacity=0.6,
                 stroke_width=0
@@ -44,7 +56,7 @@ class SchwarzschildPresentation(ThreeDScene):
 
         horizon = Sphere(
             radius=R_h,
-            resolution=(24, 48),
+            resolution=res["sphere_resolution"],
             fill_color=RED,
             fill_opacity=0.18,
             stroke_width=0
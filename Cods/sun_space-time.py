@@ -1,7 +1,16 @@
 from manim import *
 import numpy as np
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from herramientas import DepthSortCamera, GeometryResolution, Polyline, adaptive_line_samples
 
 class SpacetimeDeformation(ThreeDScene):
+    def __init__(self, **kwargs):
+        # Orden de profundidad incremental: no reordena todas las caras en cada frame
+        super().__init__(camera_class=DepthSortCamera, **kwargs)
+
     def construct(self):
         # Configurar la cámara en perspectiva inclinada
         self.set_camera_orientation(phi=80 * DEGREES, theta=-60 * DEGREES, distance=9)
@@ -10,6 +19,8 @@ class SpacetimeDeformation(ThreeDScene):
         r_V = 2.5  # Radio de Schwarzschild (rojo)
         r_T = 4.5  # Radio exterior (amarillo)
         grid_size = 15
+        # Densidad de muestreo según la calidad del render (herramientas/resolution.py)
+        res = GeometryResolution(shadow_resolution=35)
         
         GRID_STROKE_WIDTH = 0.6
         CIRCLE_STROKE_WIDTH = 6
@@ -68,7 +79,8 @@ class SpacetimeDeformation(ThreeDScene):
                 dist_from_center_i = abs(i) / grid_size
                 opacity_i = 1.0 - (dist_from_center_i ** 1.5) * 0.7
                 
-                for j in np.linspace(-grid_size, grid_size, 120):
+                # Muestras densas solo dentro del pozo; cada tramo plano es un solo segmento
+                for j in adaptive_line_samples(i, grid_size, res["grid_samples"], r_T):
                     r = np.sqrt(i**2 + j**2)
                     z = deformation_function(r, depth_factor)
                     points1.append([i, j, z])
@@ -77,11 +89,11 @@ class SpacetimeDeformation(ThreeDScene):
                     z = deformation_function(r, depth_factor)
                     points2.append([j, i, z])
                 
-                line1 = VMobject(color=GRID_COLOR, stroke_width=GRID_STROKE_WIDTH)
+                line1 = Polyline(color=GRID_COLOR, stroke_width=GRID_STROKE_WIDTH)
                 line1.set_points_as_corners(points1)
                 line1.set_stroke(opacity=opacity_i)
                 
-                line2 = VMobject(color=GRID_COLOR, stroke_width=GRID_STROKE_WIDTH)
+                line2 = Polyline(color=GRID_COLOR, stroke_width=GRID_STROKE_WIDTH)
                 line2.set_points_as_corners(points2)
                 line2.set_stroke(opacity=opacity_i)
                 
@@ -94,7 +106,7 @@ class SpacetimeDeformation(ThreeDScene):
                 return VGroup()
             
             surfaces = VGroup()
-            resolution = 35
+            resolution = res["shadow_resolution"]
             
             for i in range(resolution):
                 for j in range(resolution):
@@ -145,7 +157,7 @@ class SpacetimeDeformation(ThreeDScene):
                 z = deformation_function(radius, depth_factor)
                 points.append([x, y, z])
             
-            circle = VMobject(color=color, stroke_width=CIRCLE_STROKE_WIDTH)
+            circle = Polyline(color=color, stroke_width=CIRCLE_STROKE_WIDTH)
             circle.set_points_as_corners(points)
             circle.set_stroke(opacity=1.0)
             return circle
@@ -292,7 +304,7 @@ class SpacetimeDeformation(ThreeDScene):
                 z = deformation_function(r, depth_factor)
                 points.append([x, y, z])
             
-            line = VMobject(color=WHITE, stroke_width=4)
+            line = Polyline(color=WHITE, stroke_width=4)
             line.set_points_as_corners(points)
             return line
         
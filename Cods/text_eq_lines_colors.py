@@ -1,4 +1,12 @@
 from manim import *
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from herramientas import install_tex_cache
+
+# Fórmulas compiladas una sola vez y compartidas con las demás escenas
+install_tex_cache()
 
 #primera clase: escribir texto y formulas 
 
@@ -1,43 +1,68 @@
 from manim import *
 import numpy as np
-from scipy.special import ellipkinc
+from scipy.special import ellipk, ellipkinc
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from herramientas import GeometryResolution, LiveNumberLabel, Polyline, frame_parallel
+from herramientas.geodesics import (
+    APOAPSIS,
+    HORIZON,
+    PERIAPSIS,
+    integrate_geodesics,
+    null_initial_conditions,
+    timelike_initial_conditions,
+)
+from herramientas.atlas import PrecessionAtlas
+from herramientas.orbits import (
+    EllipticTable,
+    LiveOrbit,
+    PotentialPanel,
+    orbit_samples,
+    precession_per_revolution,
+    separatrix,
+)
 
 class SchwarzschildGeodesic(Scene):
     """Clase base para geodésicas de Schwarzschild"""
     
-    def __init__(self, e, l, M, color, **kwargs):
+    def __init__(self, e, l, M, color, show_potential=False, **kwargs):
         super().__init__(**kwargs)
         self.e = e
         self.l = l
         self.M = M
         self.color = color
+        # Panel opcional con el potencial efectivo, sincronizado con el trazo
+        self.show_potential = show_potential
         
     def compute_phi(self, chi, mu):
         """
         Calcula φ usando la fórmula:
-        φ = 2/sqrt(1-6μ+2μe) * F(π/2 - χ/2, k)
-        donde F es la integral elíptica incompleta de primer tipo
+        φ = 2/sqrt(1-6μ+2μe) * [K(k) - F(π/2 - χ/2, k)]
+        donde F es la integral elíptica incompleta de primer tipo y K la
+        completa (φ = 0 en el periapsis, como en el integrador)
         """
         denominator = 1 - 6*mu + 2*mu*self.e
         if denominator <= 0:
             return None
         
+        # k² >= 1 equivale a l <= (6 + 2e) M: la partícula cae
         k_squared = self.compute_k_squared(mu)
-        if k_squared < 0 or k_squared > 1:
+        if k_squared >= 1:
             return None
             
-        k = np.sqrt(k_squared)
         psi = np.pi/2 - chi/2
         
         # F(ψ, k) es la integral elíptica incompleta
         F_value = ellipkinc(psi, k_squared)
         
-        phi = 2 * F_value / np.sqrt(denominator)
+        phi = 2 * (ellipk(k_squared) - F_value) / np.sqrt(denominator)
         return phi
     
     def compute_k_squared(self, mu):
         """Calcula k^2 para la integral elíptica"""
-        numerator = 3*mu*(1-self.e)
+        numerator = 4*mu*self.e
         denominator = 1 - 6*mu + 2*mu*self.e
         if denominator == 0:
             return None
@@ -49,34 +74,72 @@ class SchwarzschildGeodesic(Scene):
         r = M / (mu * (1 + self.e * np.cos(chi)))
         return r
     
-    def generate_orbit_points(self, num_revolutions=3, points_per_rev=300):
-        """Genera puntos de la órbita"""
-        mu = self.M / self.l
-        
-        chi_values = np.linspace(0, num_revolutions * 2 * np.pi, 
-                                 num_revolutions * points_per_rev)
-        
-        points = []
-        chi_list = []
-        for chi in chi_values:
-            phi = self.compute_phi(chi, mu)
-            if phi is None:
-                continue
-                
-            r = self.compute_r(chi, mu)
-            
-            # Convertir a coordenadas cartesianas
-            x = r * np.cos(phi)
-            y = r * np.sin(phi)
-            
-            points.append([x, y, 0])
-            chi_list.append(chi)
-        
-        return points, chi_list
+    def has_elliptic_solution(self):
+        """
+        La fórmula con F(ψ, k) vale para todas las órbitas ligadas: solo falla
+        cuando la partícula cae, por debajo de la separatriz l = (6 + 2e) M
+        """
+        return self.l > separatrix(self.e, self.M)
+    
+    def integrate_orbit(self, num_revolutions=3, points_per_rev=None):
+        """
+        Órbita por integración numérica (caídas al horizonte, órbitas cerca de
+        la circular inestable), empezando en χ = 0 como la fórmula elíptica.
+        """
+        if points_per_rev is None:
+            points_per_rev = GeometryResolution()["orbit_points_per_rev"]
+        u0, w0, A = timelike_initial_conditions(self.l, self.e, self.M)
+        return integrate_geodesics(
+            u0, w0, A, self.M,
+            phi_max=num_revolutions * 2 * np.pi,
+            num_samples=num_revolutions * points_per_rev,
+        )
+    
+    def generate_numeric_orbit_points(self, num_revolutions=3, points_per_rev=None):
+        """Puntos de la órbita integrada; χ se interpola entre ápsides (χ = kπ en cada uno)"""
+        solution = self.integrate_orbit(num_revolutions, points_per_rev)
+        points = solution.points(0)
+        phi = np.arctan2(points[:, 1], points[:, 0])
+        phi = np.unwrap(phi)
+        apsis_phi, _ = solution.apsides(0)
+        apsis_chi = np.pi * np.arange(1, len(apsis_phi) + 1)
+        chi_list = np.interp(phi, np.concatenate([[0], apsis_phi]), np.concatenate([[0], apsis_chi]))
+        return points.tolist(), chi_list.tolist()
+    
+    def generate_orbit_points(self, num_revolutions=3, points_per_rev=None, axes=None):
+        """
+        Genera puntos de la órbita. Con axes, los χ se eligen según el error en
+        pantalla (herramientas/orbits.py); si no, points_per_rev parejos por
+        vuelta (por defecto, según la calidad del render).
+        """
+        if points_per_rev is None:
+            points_per_rev = GeometryResolution()["orbit_points_per_rev"]
+        if not self.has_elliptic_solution():
+            return self.generate_numeric_orbit_points(num_revolutions, points_per_rev)
+        
+        pixels_per_unit = None
+        if axes is not None:
+            # Píxeles por unidad de la órbita con la escala de los ejes
+            unit = axes.c2p(1, 0)[0] - axes.c2p(0, 0)[0]
+            pixels_per_unit = abs(unit) * config.pixel_width / config.frame_width
+        
+        # Toda la órbita en una sola evaluación vectorizada, guardada en la caché
+        # de arreglos en disco (herramientas/orbits.py, herramientas/array_cache.py)
+        samples = orbit_samples(self.e, self.l, self.M, num_revolutions, points_per_rev, pixels_per_unit)
+        return samples[:, 1:].tolist(), samples[:, 0].tolist()
     
     def find_perihelion_aphelion(self, num_revolutions=3):
         """Encuentra los puntos de perihelio (χ=0, 2π, 4π...) y afelio (χ=π, 3π, 5π...)"""
         mu = self.M / self.l
+        if not self.has_elliptic_solution():
+            # Ápsides detectados por el integrador (el punto inicial es un perihelio)
+            solution = self.integrate_orbit(num_revolutions)
+            perihelion_points = [[1 / solution.u[0, 0], 0, 0]]
+            aphelion_points = []
+            for kind, found in ((PERIAPSIS, perihelion_points), (APOAPSIS, aphelion_points)):
+                phi, u = solution.apsides(0, kind)
+                found.extend([np.cos(a) / b, np.sin(a) / b, 0] for a, b in zip(phi, u))
+            return perihelion_points, aphelion_points
         
         perihelion_points = []
         aphelion_points = []
@@ -138,6 +201,9 @@ class SchwarzschildGeodesic(Scene):
                 "tick_size": 0.05,
             }
         )
+        # Con el panel del potencial la órbita se corre a la izquierda
+        if self.show_potential:
+            axes.shift(LEFT * 3.2)
         
         x_label = axes.get_x_axis_label("x/M", direction=DOWN, buff=0.3)
         y_label = axes.get_y_axis_label("y/M", direction=LEFT, buff=0.3)
@@ -190,7 +256,7 @@ class SchwarzschildGeodesic(Scene):
         ).next_to(black_hole, DOWN, buff=0.3)
         
         # Generar puntos de la órbita
-        orbit_points, chi_list = self.generate_orbit_points(num_revolutions=3)
+        orbit_points, chi_list = self.generate_orbit_points(num_revolutions=3, axes=axes)
         
         if len(orbit_points) < 2:
             error_text = Text("Error: No se pueden calcular geodésicas", 
@@ -202,13 +268,20 @@ class SchwarzschildGeodesic(Scene):
         # Escalar puntos para que se ajusten a los ejes
         scaled_points = [axes.c2p(p[0], p[1]) for p in orbit_points]
         
+        # Potencial efectivo: se arma una vez con los mismos r del trazo (solo órbitas ligadas)
+        potential_panel = None
+        if self.show_potential and self.l > (3 + self.e**2) * self.M:
+            radii = np.linalg.norm(np.array(orbit_points)[:, :2], axis=1)
+            potential_panel = PotentialPanel(self.e, self.l, self.M, radii, marker_color=self.color)
+            potential_panel.to_edge(RIGHT, buff=0.6)
+        
         # Encontrar perihelios y afelios
         perihelion_points, aphelion_points = self.find_perihelion_aphelion(num_revolutions=3)
         scaled_perihelion = [axes.c2p(p[0], p[1]) for p in perihelion_points]
         scaled_aphelion = [axes.c2p(p[0], p[1]) for p in aphelion_points]
         
         # Crear la curva que se va trazando
-        traced_path = VMobject(color=self.color, stroke_width=3)
+        traced_path = Polyline(color=self.color, stroke_width=3)
         traced_path.set_points_as_corners([scaled_points[0], scaled_points[0]])
         
         # Punto que se mueve por la órbita
@@ -253,6 +326,8 @@ class SchwarzschildGeodesic(Scene):
             Write(bh_label),
             run_time=0.5
         )
+        if potential_panel is not None:
+            self.play(FadeIn(potential_panel), run_time=1)
         self.wait(0.5)
         
         self.add(traced_path, dot)
@@ -266,13 +341,16 @@ class SchwarzschildGeodesic(Scene):
         for i in range(4):  # 0, 2π, 4π, 6π
             target_chi = i * 2 * np.pi
             idx = np.argmin(np.abs(chi_array - target_chi))
-            perihelion_indices.append(idx)
+            # Las órbitas que caen al horizonte no pasan por todos los ápsides
+            if abs(chi_array[idx] - target_chi) < np.pi / 4:
+                perihelion_indices.append(idx)
         
         # Encontrar índices cercanos a χ = π, 3π, 5π... (afelios)
         for i in range(3):  # π, 3π, 5π
             target_chi = (2*i + 1) * np.pi
             idx = np.argmin(np.abs(chi_array - target_chi))
-            aphelion_indices.append(idx)
+            if abs(chi_array[idx] - target_chi) < np.pi / 4:
+                aphelion_indices.append(idx)
         
         # Variables para controlar qué puntos ya se mostraron
         perihelion_shown = [False] * len(perihelion_indices)
@@ -280,19 +358,34 @@ class SchwarzschildGeodesic(Scene):
         first_perihelion = True
         first_aphelion = True
         
+        # Línea de tiempo: con muestreo adaptativo los puntos no son parejos en χ,
+        # así que el tiempo avanza en χ y el índice sale de una búsqueda (las
+        # órbitas integradas avanzan por muestra)
+        timeline = chi_array if self.has_elliptic_solution() else np.arange(len(scaled_points), dtype=float)
+        scaled_array = np.array(scaled_points)
+        
+        def locate(alpha):
+            """Índice del último punto alcanzado y posición interpolada hasta el siguiente"""
+            target = alpha * timeline[-1]
+            idx = min(int(np.searchsorted(timeline, target, side="right")) - 1, len(timeline) - 1)
+            if idx == len(timeline) - 1:
+                return idx, scaled_array[idx]
+            frac = (target - timeline[idx]) / (timeline[idx + 1] - timeline[idx])
+            return idx, interpolate(scaled_array[idx], scaled_array[idx + 1], frac)
+        
         # Animación del trazo y movimiento con aparición de puntos
         def update_path(mob, alpha):
-            idx = int(alpha * (len(scaled_points) - 1))
-            if idx < len(scaled_points):
-                current_points = scaled_points[:idx+1]
-                if len(current_points) > 1:
-                    mob.set_points_as_corners(current_points)
+            idx, position = locate(alpha)
+            mob.set_points_as_corners(np.vstack([scaled_array[:idx+1], position]))
         
         def update_dot(mob, alpha):
             nonlocal first_perihelion, first_aphelion
-            idx = int(alpha * (len(scaled_points) - 1))
+            idx, position = locate(alpha)
             if idx < len(scaled_points):
-                mob.move_to(scaled_points[idx])
+                mob.move_to(position)
+                # Mismo índice en el panel del potencial: solo una búsqueda
+                if potential_panel is not None:
+                    potential_panel.move_marker(idx)
                 
                 # Verificar si pasamos por un perihelio
                 for i, p_idx in enumerate(perihelion_indices):
@@ -322,13 +415,14 @@ class SchwarzschildGeodesic(Scene):
                             aphelion_label.next_to(new_dot, UP, buff=0.2)
                             self.add(aphelion_label)
         
-        # Animar el trazo de la órbita
-        self.play(
-            UpdateFromAlphaFunc(traced_path, update_path),
-            UpdateFromAlphaFunc(dot, update_dot),
-            run_time=8,
-            rate_func=linear
-        )
+        # Animar el trazo de la órbita (cada frame depende solo de alpha: en paralelo)
+        with frame_parallel(self):
+            self.play(
+                UpdateFromAlphaFunc(traced_path, update_path),
+                UpdateFromAlphaFunc(dot, update_dot),
+                run_time=8,
+                rate_func=linear
+            )
         
         self.wait(2)
 
@@ -351,6 +445,18 @@ class GeodesicC(SchwarzschildGeodesic):
         super().__init__(e=0.5, l=3, M=3/14, color=GREEN, **kwargs)
 
 
+class GeodesicBWithPotential(GeodesicB):
+    """Geodésica B con el panel del potencial efectivo"""
+    def __init__(self, **kwargs):
+        super().__init__(show_potential=True, **kwargs)
+
+
+class GeodesicCWithPotential(GeodesicC):
+    """Geodésica C con el panel del potencial efectivo"""
+    def __init__(self, **kwargs):
+        super().__init__(show_potential=True, **kwargs)
+
+
 class AllGeodesics(Scene):
     """Muestra las tres geodésicas en secuencia de forma continua"""
     def construct(self):
@@ -535,38 +641,18 @@ class AllGeodesics(Scene):
             self.wait(0.5)
             
             # ===== GENERAR Y ANIMAR LA GEODÉSICA =====
-            mu = M / l
-            
-            # Generar puntos
-            chi_values = np.linspace(0, 3 * 2 * np.pi, 3 * 300)
-            points = []
-            chi_list = []
-            
-            for chi in chi_values:
-                denominator = 1 - 6*mu + 2*mu*e
-                if denominator <= 0:
-                    continue
-                
-                k_squared = (3*mu*(1-e)) / denominator
-                if k_squared < 0 or k_squared > 1:
-                    continue
-                    
-                k = np.sqrt(k_squared)
-                psi = np.pi/2 - chi/2
-                F_value = ellipkinc(psi, k_squared)
-                phi = 2 * F_value / np.sqrt(denominator)
-                r = M / (mu * (1 + e * np.cos(chi)))
-                
-                x = r * np.cos(phi)
-                y = r * np.sin(phi)
-                
-                points.append([x, y, 0])
-                chi_list.append(chi)
+            # Órbita vectorizada y guardada en la caché de arreglos: los renders
+            # siguientes la abren del disco (herramientas/orbits.py)
+            samples = orbit_samples(e, l, M, 3, 300)
+            # Donde la fórmula elíptica no vale los puntos son NaN y se descartan
+            samples = samples[~np.isnan(samples[:, 1])]
+            points = samples[:, 1:].tolist()
+            chi_list = samples[:, 0].tolist()
             
             scaled_points = [axes.c2p(p[0], p[1]) for p in points]
             
             # Crear trayectoria y partícula
-            traced_path = VMobject(color=color, stroke_width=3)
+            traced_path = Polyline(color=color, stroke_width=3)
             traced_path.set_points_as_corners([scaled_points[0], scaled_points[0]])
             
             dot = Dot(color=color, radius=0.08)
@@ -665,4 +751,226 @@ class AllGeodesics(Scene):
                 self.wait(0.3)
         
         # Final
-        self.wait(2)
\ No newline at end of file
+        self.wait(2)
+
+class PhotonBundle(Scene):
+    """Haz de fotones paralelos: los de b < 3√3 M caen al horizonte, el resto se desvía"""
+    def construct(self):
+        self.camera.background_color = "#1a1a1a"
+        M = 1.0
+        range_val = 15
+        
+        axes = Axes(
+            x_range=[-range_val, range_val, 5],
+            y_range=[-range_val, range_val, 5],
+            x_length=6,
+            y_length=6,
+            axis_config={
+                "color": GRAY_C,
+                "include_numbers": False,
+                "include_ticks": True,
+                "tick_size": 0.05,
+            }
+        )
+        origin = axes.c2p(0, 0)
+        unit = axes.c2p(1, 0)[0] - origin[0]
+        
+        black_hole = Circle(
+            radius=2 * M * unit,
+            color=BLACK,
+            fill_opacity=1,
+            stroke_width=2,
+            stroke_color=WHITE
+        ).move_to(origin)
+        photon_sphere = DashedVMobject(Circle(radius=3 * M * unit, color=YELLOW, stroke_width=1.5))
+        photon_sphere.move_to(origin)
+        
+        title = MathTex(r"b_c = 3\sqrt{3}\,M", font_size=36, color=WHITE).to_corner(UL)
+        
+        # Todos los fotones en una sola integración: entran desde la izquierda por
+        # debajo del eje (φ crece) y se reflejan para la mitad de arriba
+        impact = np.linspace(0.25, 9, 36)
+        r0 = range_val - 1
+        u0, w0, A = null_initial_conditions(impact, r0, M)
+        solution = integrate_geodesics(u0, w0, A, M, phi_max=3 * np.pi, num_samples=600, r_max=r0 * 1.01)
+        phi0 = np.pi + np.arcsin(impact / r0)
+        
+        rays = VGroup()
+        for i in range(len(impact)):
+            points = solution.points(i, phi0[i])
+            color = RED if solution.fate[i] == HORIZON else BLUE_C
+            for sign in (1, -1):
+                corners = origin + unit * points * [1, sign, 0]
+                rays.add(Polyline(corners, color=color, stroke_width=1.5, stroke_opacity=0.8))
+        
+        self.play(Create(axes), Write(title))
+        self.play(GrowFromCenter(black_hole), Create(photon_sphere), run_time=1)
+        self.play(Create(rays), run_time=5, rate_func=linear)
+        self.wait(2)
+
+
+class OrbitMorph(Scene):
+    """
+    La órbita cambia de forma continua mientras se barren los parámetros:
+    primero l de 11 a 3 (los casos A, B y C) y después M con l fijo hasta
+    cerca de la separatriz l = (6 + 2e) M, donde la precesión se dispara.
+    """
+    def construct(self):
+        self.camera.background_color = "#1a1a1a"
+        range_val = 30
+        
+        axes = Axes(
+            x_range=[-range_val, range_val, 5],
+            y_range=[-range_val, range_val, 5],
+            x_length=6,
+            y_length=6,
+            axis_config={
+                "color": GRAY_C,
+                "include_numbers": False,
+                "include_ticks": True,
+                "tick_size": 0.05,
+            }
+        )
+        unit = axes.c2p(1, 0)[0] - axes.c2p(0, 0)[0]
+        
+        e = ValueTracker(0.5)
+        l = ValueTracker(11)
+        M = ValueTracker(3/14)
+        
+        # Toda la órbita se recalcula en cada frame con la tabla de F(ψ, k)
+        orbit = LiveOrbit(e, l, M, axes, num_revolutions=3, table=EllipticTable(), color=BLUE, stroke_width=3)
+        
+        black_hole = Circle(
+            radius=2 * M.get_value() * unit,
+            color=BLACK,
+            fill_opacity=1,
+            stroke_width=2,
+            stroke_color=WHITE
+        ).move_to(axes.c2p(0, 0))
+        black_hole.add_updater(
+            lambda mob: mob.set_width(4 * M.get_value() * unit).move_to(axes.c2p(0, 0))
+        )
+        
+        readouts = VGroup(
+            LiveNumberLabel("e =", e, font_size=32),
+            LiveNumberLabel("l =", l, font_size=32),
+            LiveNumberLabel("M =", M, num_decimal_places=4, font_size=32),
+            LiveNumberLabel(
+                r"\Delta\varphi =",
+                lambda: np.degrees(precession_per_revolution(e.get_value(), l.get_value(), M.get_value())),
+                num_decimal_places=1,
+                suffix=r"^\circ",
+                font_size=32,
+                color=YELLOW
+            ),
+        ).arrange(DOWN, aligned_edge=LEFT).to_corner(UL)
+        
+        self.play(Create(axes), FadeIn(black_hole), FadeIn(readouts))
+        self.play(Create(orbit), run_time=3, rate_func=linear)
+        self.wait(0.5)
+        
+        # De A a C: la órbita se encoge y la precesión crece
+        self.play(l.animate.set_value(7.5), run_time=3)
+        self.play(l.animate.set_value(3), run_time=3)
+        self.wait(0.5)
+        self.play(l.animate.set_value(11), run_time=2)
+        
+        # Con l fijo el tamaño no cambia (r = l / (1 + e cos χ)): solo crece la precesión
+        M_limit = 0.97 * l.get_value() / separatrix(e.get_value(), 1)
+        self.play(M.animate.set_value(M_limit), run_time=6, rate_func=smooth)
+        self.wait(2)
+
+
+class PerihelionAtlas(Scene):
+    """
+    Mapa de la precesión del perihelio sobre el plano (e, l) con M fijo,
+    calculado de una vez en una grilla densa, y un panel con la órbita del
+    punto marcado. El marcador recorre los casos A, B y C.
+    """
+    def construct(self):
+        self.camera.background_color = "#1a1a1a"
+        M = 3/14
+        
+        # ===== ATLAS (una sola imagen) =====
+        atlas_axes = Axes(
+            x_range=[0, 0.9, 0.1],
+            y_range=[1, 15, 2],
+            x_length=5.5,
+            y_length=5.5,
+            axis_config={
+                "color": GRAY_C,
+                "include_numbers": True,
+                "font_size": 20,
+                "tick_size": 0.05,
+            }
+        ).to_edge(LEFT, buff=0.8)
+        e_label = atlas_axes.get_x_axis_label("e", direction=DOWN, buff=0.3).set_color(GRAY_A)
+        l_label = atlas_axes.get_y_axis_label("l", direction=LEFT, buff=0.3).set_color(GRAY_A)
+        
+        # Cientos de miles de puntos en una pasada vectorizada
+        resolution = 2 * config.pixel_height // 3
+        atlas = PrecessionAtlas(
+            np.linspace(0, 0.9, resolution),
+            np.linspace(1, 15, resolution),
+            M
+        )
+        heatmap = atlas.to_image_mobject(atlas_axes)
+        
+        atlas_title = MathTex(
+            r"\Delta\varphi \text{ por vuelta}, \; M = 3/14",
+            font_size=30,
+            color=WHITE
+        ).next_to(atlas_axes, UP, buff=0.2)
+        
+        # ===== PUNTO MARCADO Y PANEL DE LA ÓRBITA =====
+        e = ValueTracker(0.5)
+        l = ValueTracker(11)
+        
+        marker = Dot(color=WHITE, radius=0.07).set_stroke(BLACK, width=2, background=True)
+        marker.add_updater(lambda mob: mob.move_to(atlas_axes.c2p(e.get_value(), l.get_value())))
+        
+        orbit_axes = Axes(
+            x_range=[-30, 30, 5],
+            y_range=[-30, 30, 5],
+            x_length=5,
+            y_length=5,
+            axis_config={
+                "color": GRAY_C,
+                "include_numbers": False,
+                "include_ticks": True,
+                "tick_size": 0.05,
+            }
+        ).to_edge(RIGHT, buff=0.8)
+        unit = orbit_axes.c2p(1, 0)[0] - orbit_axes.c2p(0, 0)[0]
+        black_hole = Circle(
+            radius=2 * M * unit,
+            color=BLACK,
+            fill_opacity=1,
+            stroke_width=2,
+            stroke_color=WHITE
+        ).move_to(orbit_axes.c2p(0, 0))
+        orbit = LiveOrbit(e, l, M, orbit_axes, num_revolutions=3, table=EllipticTable(), color=YELLOW, stroke_width=2.5)
+        
+        readout = LiveNumberLabel(
+            r"\Delta\varphi =",
+            lambda: np.degrees(precession_per_revolution(e.get_value(), l.get_value(), M)),
+            num_decimal_places=1,
+            suffix=r"^\circ",
+            font_size=30,
+            color=YELLOW
+        ).next_to(orbit_axes, UP, buff=0.2)
+        
+        self.play(Create(atlas_axes), Write(e_label), Write(l_label), Write(atlas_title))
+        self.play(FadeIn(heatmap), run_time=1.5)
+        self.play(Create(orbit_axes), FadeIn(black_hole))
+        self.play(FadeIn(marker), Create(orbit), FadeIn(readout), run_time=2)
+        self.wait(1)
+        
+        # Casos B y C, y después un recorrido por excentricidad y cerca de la separatriz
+        self.play(l.animate.set_value(7.5), run_time=3)
+        self.wait(0.5)
+        self.play(l.animate.set_value(3), run_time=3)
+        self.wait(0.5)
+        self.play(e.animate.set_value(0.8), run_time=3)
+        self.play(l.animate.set_value(1.05 * separatrix(0.8, M)), run_time=3)
+        self.wait(2)
@@ -1,6 +1,11 @@
 from manim import *
 import numpy as np
-from scipy.special import ellipkinc
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from herramientas import GeometryResolution, Polyline
+from herramientas.orbits import orbit_samples
 
 
 class SchwarzschildGeodesicsPresentation(Scene):
@@ -188,38 +193,19 @@ class SchwarzschildGeodesicsPresentation(Scene):
             self.wait(0.5)
             
             # ===== GENERAR Y ANIMAR LA GEODÉSICA =====
-            mu = M / l
-            
-            # Generar puntos
-            chi_values = np.linspace(0, 3 * 2 * np.pi, 3 * 300)
-            points = []
-            chi_list = []
-            
-            for chi in chi_values:
-                denominator = 1 - 6*mu + 2*mu*e
-                if denominator <= 0:
-                    continue
-                
-                k_squared = (3*mu*(1-e)) / denominator
-                if k_squared < 0 or k_squared > 1:
-                    continue
-                    
-                k = np.sqrt(k_squared)
-                psi = np.pi/2 - chi/2
-                F_value = ellipkinc(psi, k_squared)
-                phi = 2 * F_value / np.sqrt(denominator)
-                r = M / (mu * (1 + e * np.cos(chi)))
-                
-                x = r * np.cos(phi)
-                y = r * np.sin(phi)
-                
-                points.append([x, y, 0])
-                chi_list.append(chi)
+            # Puntos por revolución según la calidad del render; la órbita se evalúa
+            # vectorizada y queda en la caché de arreglos (herramientas/orbits.py)
+            points_per_rev = GeometryResolution()["orbit_points_per_rev"]
+            samples = orbit_samples(e, l, M, 3, points_per_rev)
+            # Donde la fórmula elíptica no vale los puntos son NaN y se descartan
+            samples = samples[~np.isnan(samples[:, 1])]
+            points = samples[:, 1:].tolist()
+            chi_list = samples[:, 0].tolist()
             
             scaled_points = [axes.c2p(p[0], p[1]) for p in points]
             
             # Crear trayectoria y partícula
-            traced_path = VMobject(color=color, stroke_width=3)
+            traced_path = Polyline(color=color, stroke_width=3)
             traced_path.set_points_as_corners([scaled_points[0], scaled_points[0]])
             
             dot = Dot(color=color, radius=0.08)
@@ -1,5 +1,6 @@
 from manim import *
 import numpy as np
+from herramientas import GeometryResolution, LiveNumberLabel
 
 class CampoRotacional2D(Scene):
     def construct(self):
@@ -47,10 +48,12 @@ class CampoRotacional2D(Scene):
             return np.tanh(mag)   # satura rápido → colores más vivos
 
         
+        # Separación de las semillas según la calidad del render
+        spacing = GeometryResolution(stream_lines_spacing=0.4)["stream_lines_spacing"]
         stream_lines = StreamLines(
     vector_field,
-    x_range=[-4, 4, 0.4],
-    y_range=[-4, 4, 0.4],
+    x_range=[-4, 4, spacing],
+    y_range=[-4, 4, spacing],
     stroke_width=2.5,          # más presencia visual
     max_anchors_per_line=40,
     color_scheme=color_value,
@@ -98,12 +101,13 @@ class CampoRotacional2D(Scene):
             color=WHITE
         ).scale(0.9).to_corner(UL)
 
-        omega_text = always_redraw(
-            lambda: MathTex(
-                rf"\omega(t)={omega.get_value():.2f}",
-                color=WHITE
-            ).scale(0.8).next_to(title, DOWN, aligned_edge=LEFT)
-        )
+        # El valor se arma con glifos cacheados: no recompila LaTeX por frame
+        omega_text = LiveNumberLabel(
+            r"\omega(t)=",
+            omega,
+            num_decimal_places=2,
+            color=WHITE
+        ).scale(0.8).next_to(title, DOWN, aligned_edge=LEFT)
 
         self.play(Write(title), FadeIn(omega_text))
 
@@ -176,10 +180,12 @@ class CampoRotacionalNoUniforme(Scene):
         # -----------------------
         # StreamLines
         # -----------------------
+        # Separación de las semillas según la calidad del render
+        spacing = GeometryResolution()["stream_lines_spacing"]
         stream_lines = StreamLines(
             vector_field,
-            x_range=[-4.5, 4.5, 0.35],
-            y_range=[-4.5, 4.5, 0.35],
+            x_range=[-4.5, 4.5, spacing],
+            y_range=[-4.5, 4.5, spacing],
             stroke_width=2.5,
             max_anchors_per_line=45,
             color_scheme=color_value,
@@ -288,10 +294,12 @@ class CampoDivergenteRotacional(Scene):
         # -----------------------
         # StreamLines
         # -----------------------
+        # Separación de las semillas según la calidad del render
+        spacing = GeometryResolution(stream_lines_spacing=0.4)["stream_lines_spacing"]
         stream_lines = StreamLines(
             vector_field,
-            x_range=[-4.5, 4.5, 0.4],
-            y_range=[-4.5, 4.5, 0.4],
+            x_range=[-4.5, 4.5, spacing],
+            y_range=[-4.5, 4.5, spacing],
             stroke_width=2.5,
             max_anchors_per_line=45,
             color_scheme=color_value,
@@ -311,12 +319,12 @@ class CampoDivergenteRotacional(Scene):
             color=WHITE
         ).scale(0.85).to_corner(UL)
 
-        alpha_text = always_redraw(
-            lambda: MathTex(
-                rf"\alpha={alpha.get_value():.2f}",
-                color=WHITE
-            ).scale(0.75).next_to(title, DOWN, aligned_edge=LEFT)
-        )
+        alpha_text = LiveNumberLabel(
+            r"\alpha=",
+            alpha,
+            num_decimal_places=2,
+            color=WHITE
+        ).scale(0.75).next_to(title, DOWN, aligned_edge=LEFT)
 
         self.play(Write(title), FadeIn(alpha_text))
 
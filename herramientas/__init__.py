@@ -0,0 +1,30 @@
+"""
+Herramientas compartidas por las escenas del repositorio.
+
+Las escenas de la raíz pueden importar directamente ``from herramientas import ...``.
+Las de ``Cods/`` agregan primero la raíz del repositorio a ``sys.path``.
+
+Al importar el paquete se instala la caché de LaTeX compartida
+(``.manim_cache/tex`` en la raíz del repositorio, sin importar desde qué
+carpeta se renderice).
+"""
+
+from .array_cache import cached_array
+from .billboard import BillboardLabels
+from .depth_sort import DepthSortCamera
+from .file_writer import PipelinedFileWriter
+from .frame_parallel import frame_parallel
+from .geodesics import integrate_geodesics, null_initial_conditions, timelike_initial_conditions
+from .grid import adaptive_line_samples, grid_line_field, split_lines
+from .kerr import bound_orbit_initial_conditions, integrate_kerr_geodesics, zamo_initial_conditions
+from .lensing import LensingRenderer
+from .live_number import LiveNumberLabel, get_digit_glyphs
+from .polyline import Polyline
+from .render_cache import SegmentCacheCamera
+from .resolution import GeometryResolution
+from .state_hash import StateHashRenderer
+from .surface_distance import SurfaceDistance, schwarzschild_proper_distance
+from .tex_cache import install_tex_cache, prewarm
+
+# Toda escena que importe herramientas usa la misma caché de LaTeX
+install_tex_cache()
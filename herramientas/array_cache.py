@@ -0,0 +1,180 @@
+"""
+Caché en disco de arreglos calculados, direccionada por contenido.
+
+Las escenas recalculan en cada render la misma geometría: las órbitas de
+``AllGeodesics`` y ``SchwarzschildGeodesicsPresentation``, la tabla de
+deflexión de la lente, el campo de alturas de la grilla deformada. Con el
+decorador ``cached_array`` el resultado se guarda como ``.npy`` en
+``.manim_cache/arrays`` y las llamadas siguientes (en la misma escena, en
+otra escena o en otro proceso, como los workers de ``frame_parallel``) lo
+abren con memory map: no se lee el archivo entero ni se recalcula nada.
+
+La clave es un hash de:
+
+  * la identidad de la función: módulo, nombre y bytecode, junto con los
+    valores de su closure, las funciones del mismo módulo a las que llama y
+    las constantes del módulo que lee (``state_hash.hash_callable``), así que
+    editar la función o esas constantes invalida sus entradas. Si algún valor
+    del closure no se puede describir, la llamada se calcula sin caché;
+  * los argumentos (con los valores por defecto aplicados): números, cadenas,
+    arreglos, listas, tuplas, diccionarios y funciones (por su código). Un
+    argumento de otro tipo es un error: no se puede saber si cambió.
+
+Los cambios en funciones de otros módulos que la función use no entran en la
+clave; en ese caso basta con borrar ``.manim_cache/arrays``.
+
+Los archivos se escriben en un temporal y se renombran (varios procesos
+pueden calcular la misma entrada a la vez sin dejar archivos a medias) y la
+carpeta se mantiene bajo ``max_bytes`` borrando los menos usados. Con
+``--disable_caching`` siempre se recalcula.
+
+    @cached_array
+    def orbit_samples(e, l, M, num_revolutions, points_per_rev):
+        ...
+        return samples          # np.ndarray
+
+    samples = orbit_samples(0.5, 11, 3 / 14, 3, 300)   # solo lectura (memmap)
+
+Los argumentos que no cambian el resultado (búferes, tablas de
+interpolación) se excluyen con ``ignore``:
+
+    @cached_array(ignore=("table",))
+"""
+
+import functools
+import hashlib
+import inspect
+import os
+import types
+
+import numpy as np
+from manim import config
+
+from .paths import evict_oldest, get_cache_dir
+from .state_hash import UnhashableState, hash_callable
+
+# Tamaño máximo de la caché de arreglos en disco
+ARRAY_CACHE_MAX_BYTES = 1024**3
+
+# Cada cuántas escrituras se revisa el tamaño de la carpeta
+EVICTION_INTERVAL = 20
+
+_arrays_saved = 0
+
+
+def hash_argument(hasher, value):
+    """Agrega un argumento al hasher; TypeError si su tipo no se puede hashear"""
+    if isinstance(value, (bool, int, float, complex, str, bytes, type(None), np.generic)):
+        hasher.update(f"{type(value).__name__}:{value!r}".encode())
+    elif isinstance(value, np.ndarray):
+        if value.dtype.hasobject:
+            raise TypeError("cached_array: los arreglos de objetos no se pueden hashear")
+        hasher.update(repr((value.dtype.str, value.shape)).encode())
+        hasher.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, (list, tuple)):
+        hasher.update(f"{type(value).__name__}[{len(value)}".encode())
+        for item in value:
+            hash_argument(hasher, item)
+    elif isinstance(value, dict):
+        hasher.update(f"dict{{{len(value)}".encode())
+        for key in sorted(value, key=repr):
+            hasher.update(repr(key).encode())
+            hash_argument(hasher, value[key])
+    elif isinstance(value, (types.FunctionType, types.MethodType, functools.partial)):
+        if isinstance(value, functools.partial):
+            hash_callable(hasher, value.func, set())
+            hash_argument(hasher, (value.args, value.keywords))
+        else:
+            hash_callable(hasher, value, set())
+    else:
+        raise TypeError(f"cached_array: no se puede hashear un argumento de tipo {type(value).__name__}")
+
+
+def function_key(function, arguments):
+    """Clave hexadecimal de una llamada: identidad de la función más sus argumentos"""
+    hasher = hashlib.blake2b(digest_size=20)
+    hasher.update(f"{function.__module__}.{function.__qualname__}".encode())
+    hash_callable(hasher, function, set())
+    for name, value in arguments.items():
+        hasher.update(name.encode())
+        hash_argument(hasher, value)
+    return hasher.hexdigest()
+
+
+def load_array(cache_file):
+    """Arreglo guardado abierto con memory map (solo lectura), o None si no está"""
+    try:
+        array = np.load(cache_file, mmap_mode="r", allow_pickle=False)
+        # Marca de uso para el desalojo de los menos usados (el atime no siempre se actualiza)
+        os.utime(cache_file)
+    except (OSError, ValueError):
+        return None
+    return array
+
+
+def save_array(cache_file, array, max_bytes=ARRAY_CACHE_MAX_BYTES):
+    """Escribe el arreglo en un temporal y lo renombra; cada tanto desaloja los menos usados"""
+    global _arrays_saved
+    tmp_file = cache_file.with_name(f"{cache_file.stem}.{os.getpid()}.tmp.npy")
+    try:
+        np.save(tmp_file, array, allow_pickle=False)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        # Sin espacio, o el temporal se desalojó desde otro proceso: queda sin guardar
+        return False
+    _arrays_saved += 1
+    if _arrays_saved % EVICTION_INTERVAL == 1:
+        evict_oldest(cache_file.parent, max_bytes)
+    return True
+
+
+def cached_array(function=None, *, ignore=(), max_bytes=ARRAY_CACHE_MAX_BYTES):
+    """
+    Decorador: la función devuelve un np.ndarray que se guarda en
+    ``.manim_cache/arrays`` según su identidad y sus argumentos. Las llamadas
+    con la misma clave devuelven el arreglo guardado abierto con memory map
+    (solo lectura: copiar antes de modificarlo).
+
+    ignore: nombres de argumentos que no entran en la clave. La función sin
+    caché queda disponible como ``.compute``.
+    """
+    if function is None:
+        return functools.partial(cached_array, ignore=ignore, max_bytes=max_bytes)
+
+    signature = inspect.signature(function)
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        if config.disable_caching:
+            return function(*args, **kwargs)
+        try:
+            cache_file = wrapper.cache_file(*args, **kwargs)
+        except UnhashableState:
+            # Sin clave confiable: se recalcula en lugar de arriesgar una entrada vieja
+            return function(*args, **kwargs)
+        array = load_array(cache_file)
+        if array is not None:
+            return array
+
+        array = function(*args, **kwargs)
+        if not isinstance(array, np.ndarray) or array.dtype.hasobject:
+            raise TypeError(f"cached_array: {function.__qualname__} debe devolver un np.ndarray numérico")
+        # El resultado recién calculado también se devuelve como memmap de solo lectura
+        saved = load_array(cache_file) if save_array(cache_file, array, max_bytes) else None
+        return array if saved is None else saved
+
+    def cache_file(*args, **kwargs):
+        """Archivo .npy de la entrada para estos argumentos"""
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        arguments = {name: value for name, value in bound.arguments.items() if name not in ignore}
+        return get_cache_dir("arrays") / f"{function_key(function, arguments)}.npy"
+
+    wrapper.cache_file = cache_file
+    wrapper.compute = function
+    return wrapper
+
+
+def clear_array_cache():
+    """Borra todas las entradas de la caché de arreglos"""
+    evict_oldest(get_cache_dir("arrays"), 0)
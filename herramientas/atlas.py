@@ -0,0 +1,133 @@
+"""
+Atlas de la precesión del perihelio sobre una grilla (e, l).
+
+``compute_phi`` y ``compute_k_squared`` de las escenas de geodésicas dan la
+precesión por vuelta con la integral elíptica completa, pero se evaluaban
+solo para tres órbitas. ``PrecessionAtlas`` la evalúa en toda una grilla
+densa de (e, l) (cientos de miles de puntos) en una sola pasada vectorizada
+(``precession_per_revolution``), junto con la validez: con k² = 4μe /
+(1 - 6μ + 2μe) la fórmula elíptica vale exactamente por encima de la
+separatriz l = (6 + 2e) M, donde las órbitas ligadas son estables.
+
+``to_image`` convierte la grilla en una sola imagen RGBA (mapa de color en
+escala logarítmica, curvas de nivel marcadas en los píxeles donde cambia el
+nivel, la zona de caída en gris): todo es aritmética de arreglos
+y en la escena es un único ``ImageMobject``, no un mobject por celda.
+
+    atlas = PrecessionAtlas(np.linspace(0, 0.9, 600), np.linspace(1, 15, 600), M=3/14)
+    heatmap = atlas.to_image_mobject(axes)
+
+``python -m herramientas.atlas`` compara la fórmula con ``integrate_geodesics``
+(avance del periapsis integrado numéricamente) en algunos puntos (e, l).
+"""
+
+import sys
+
+import numpy as np
+from manim import *
+
+from .geodesics import PERIAPSIS, integrate_geodesics, timelike_initial_conditions
+from .orbits import orbit_parameters, precession_per_revolution
+
+# Colores del mapa (de menor a mayor precesión, en escala logarítmica)
+COLOR_STOPS = [BLUE_E, BLUE_C, TEAL_C, GREEN_C, YELLOW_C, ORANGE, RED_C]
+
+# Curvas de nivel (grados por vuelta)
+CONTOUR_LEVELS = [5, 10, 20, 45, 90, 180, 360]
+
+# Región sin órbita ligada estable (por debajo de la separatriz)
+INVALID_COLOR = "#2a2a2a"
+CONTOUR_COLOR = WHITE
+
+# Puntos (e, l) con M = 1 y tolerancia relativa de la comparación con el integrador
+CHECK_POINTS = [(0.3, 11), (0.5, 8), (0.2, 7), (0.1, 6.3), (0.7, 9)]
+CHECK_TOLERANCE = 1e-5
+
+
+class PrecessionAtlas:
+    """
+    Precesión por vuelta (grados) y validez (l por encima de la separatriz)
+    sobre la grilla l_values × e_values. Las filas son l (creciente) y las columnas e.
+    """
+
+    def __init__(self, e_values, l_values, M):
+        self.e_values = np.asarray(e_values, dtype=float)
+        self.l_values = np.asarray(l_values, dtype=float)
+        self.M = M
+        e, l = self.e_values[None, :], self.l_values[:, None]
+        self.valid = np.broadcast_to(orbit_parameters(e, l, M)[3], (len(self.l_values), len(self.e_values)))
+        self.precession = np.degrees(precession_per_revolution(e, l, M))
+
+    @property
+    def shape(self):
+        return self.precession.shape
+
+    def value_at(self, e, l):
+        """Precesión (grados) en el punto de la grilla más cercano a (e, l)"""
+        i = np.abs(self.l_values - l).argmin()
+        j = np.abs(self.e_values - e).argmin()
+        return self.precession[i, j]
+
+    def to_image(self, color_stops=COLOR_STOPS, levels=CONTOUR_LEVELS):
+        """Imagen (filas, columnas, 4) uint8 con l creciente hacia arriba"""
+        shown = self.valid
+        values = np.where(shown, self.precession, np.nan)
+
+        # Mapa de color sobre log(precesión), normalizado al rango visible
+        with np.errstate(divide="ignore", invalid="ignore"):
+            log_values = np.log10(np.maximum(values, 1e-3))
+        low, high = np.nanmin(log_values), np.nanmax(log_values)
+        t = np.nan_to_num((log_values - low) / max(high - low, 1e-12))
+        stops = np.array([color_to_rgb(c) for c in color_stops])
+        position = t * (len(stops) - 1)
+        index = np.minimum(position.astype(int), len(stops) - 2)
+        frac = (position - index)[..., None]
+        rgb = stops[index] * (1 - frac) + stops[index + 1] * frac
+
+        # Curvas de nivel: píxeles donde cambia el nivel respecto del vecino
+        bins = np.digitize(np.nan_to_num(values, nan=-1.0), levels)
+        contour = np.zeros(self.shape, dtype=bool)
+        contour[1:] |= (bins[1:] != bins[:-1]) & shown[1:] & shown[:-1]
+        contour[:, 1:] |= (bins[:, 1:] != bins[:, :-1]) & shown[:, 1:] & shown[:, :-1]
+        rgb[contour] = color_to_rgb(CONTOUR_COLOR)
+        rgb[~self.valid] = color_to_rgb(INVALID_COLOR)
+
+        image = np.empty((*self.shape, 4), dtype=np.uint8)
+        image[..., :3] = np.round(rgb * 255)
+        image[..., 3] = 255
+        # Fila 0 de la imagen arriba: l creciente hacia arriba
+        return np.ascontiguousarray(image[::-1])
+
+    def to_image_mobject(self, axes, **kwargs):
+        """ImageMobject de la grilla ajustado al rango (e, l) de ``axes``"""
+        image = ImageMobject(self.to_image(**kwargs))
+        corner_low = axes.c2p(self.e_values[0], self.l_values[0])
+        corner_high = axes.c2p(self.e_values[-1], self.l_values[-1])
+        image.stretch_to_fit_width(corner_high[0] - corner_low[0])
+        image.stretch_to_fit_height(corner_high[1] - corner_low[1])
+        image.move_to((corner_low + corner_high) / 2)
+        return image
+
+
+def integrated_precession(e, l, M):
+    """Avance del periapsis por vuelta (radianes) integrando la geodésica"""
+    u0, w0, A = timelike_initial_conditions(l, e, M)
+    solution = integrate_geodesics(u0, w0, A, M, phi_max=20 * np.pi, rtol=1e-11, atol=1e-13)
+    periapsis_phi, _ = solution.apsides(0, PERIAPSIS)
+    # Empieza en el periapsis (φ = 0): el siguiente llega 2π + Δφ después
+    return periapsis_phi[0] - 2 * np.pi
+
+
+def main():
+    failures = 0
+    for e, l in CHECK_POINTS:
+        formula = float(precession_per_revolution(e, l, 1.0))
+        integrated = integrated_precession(e, l, 1.0)
+        ok = abs(formula - integrated) <= CHECK_TOLERANCE * abs(integrated)
+        failures += not ok
+        print(f"e={e:<4} l={l:<5} fórmula={formula:.6f} rad  integrador={integrated:.6f} rad  {'ok' if ok else 'ERROR'}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,270 @@
+"""
+Benchmark de todas las escenas del repositorio.
+
+Cada escena corre en su propio proceso, a calidad baja fija y sin escribir
+video (``dry_run``), pero rasterizando cada frame. Por escena se guarda:
+
+  * tiempo total (creación de la escena + construct),
+  * percentiles del tiempo por frame (updaters + rasterización),
+  * pico de memoria residente del proceso,
+  * cantidad de mobjects (al final y máximo al inicio de cada play/wait).
+
+Los resultados se guardan en JSON y se pueden comparar contra una línea base:
+
+    python -m herramientas.benchmark                              # todas las escenas
+    python -m herramientas.benchmark Cods/time-like-geodesics5.py -s SchwarzschildGeodesicsPresentation
+    python -m herramientas.benchmark -o base.json                 # guardar línea base
+    python -m herramientas.benchmark --baseline base.json         # marcar regresiones
+"""
+
+import argparse
+import json
+import multiprocessing
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import manim
+from manim import *
+
+from .frame_parallel import register_instrumentation, unregister_instrumentation
+from .paths import REPO_ROOT, get_cache_dir
+from .scene_loader import find_scene_classes, iter_scenes, load_scene_module, scene_id
+
+DEFAULT_QUALITY = "low_quality"
+
+# Métricas comparadas contra la línea base: (ruta en el JSON, mínimo absoluto
+# de diferencia para considerarla; evita falsas alarmas en escenas muy cortas)
+COMPARED_METRICS = (
+    (("wall_time",), 0.5),
+    (("frame_time", "p95"), 0.005),
+    (("peak_rss_mb",), 50.0),
+)
+
+
+# ---------------------------------------------------------------------------
+# Medición de una escena (en el proceso hijo)
+# ---------------------------------------------------------------------------
+
+def _instrument(renderer, stats):
+    """Envuelve render/play/freeze del renderer para medir cada frame"""
+    render, play, freeze = renderer.render, renderer.play, renderer.freeze_current_frame
+
+    def timed_render(scene, *args, **kwargs):
+        render(scene, *args, **kwargs)
+        now = time.perf_counter()
+        stats["frame_times"].append(now - stats["last"])
+        stats["last"] = now
+
+    def counted_play(scene, *args, **kwargs):
+        stats["peak_family"] = max(stats["peak_family"], len(scene.get_mobject_family_members()))
+        stats["plays"] += 1
+        stats["last"] = time.perf_counter()
+        play(scene, *args, **kwargs)
+
+    def counted_freeze(duration):
+        stats["frozen_frames"] += int(duration * config.frame_rate)
+        freeze(duration)
+
+    renderer.render = timed_render
+    renderer.play = counted_play
+    renderer.freeze_current_frame = counted_freeze
+
+
+def _percentiles(values):
+    if not values:
+        return None
+    values = np.asarray(values)
+    p50, p90, p95, p99 = np.percentile(values, [50, 90, 95, 99])
+    return {
+        "mean": float(values.mean()), "p50": float(p50), "p90": float(p90),
+        "p95": float(p95), "p99": float(p99), "max": float(values.max()),
+    }
+
+
+def run_scene(path, scene_name, quality=DEFAULT_QUALITY):
+    """Renderiza una escena sin escribir video y devuelve sus métricas"""
+    stats = {"frame_times": [], "last": 0.0, "plays": 0, "frozen_frames": 0, "peak_family": 0}
+    result = {"file": str(path), "scene": scene_name}
+    with tempfile.TemporaryDirectory() as media_dir, tempconfig({
+        "quality": quality,
+        "media_dir": media_dir,
+        "input_file": str(path),
+        "disable_caching": True,
+        "dry_run": True,
+        "progress_bar": "none",
+        "verbosity": "WARNING",
+    }):
+        # Los tiempos por frame se miden en este proceso: frame_parallel no reparte frames
+        register_instrumentation(run_scene)
+        try:
+            module = load_scene_module(path)
+            scene_class = {c.__name__: c for c in find_scene_classes(module)}[scene_name]
+            start = time.perf_counter()
+            scene = scene_class()
+            _instrument(scene.renderer, stats)
+            scene.render()
+            result["wall_time"] = time.perf_counter() - start
+        except Exception:
+            result["error"] = traceback.format_exc(limit=5)
+            return result
+        finally:
+            unregister_instrumentation(run_scene)
+
+        result["resolution"] = [config.pixel_width, config.pixel_height]
+        result["frame_rate"] = config.frame_rate
+
+    result["frames"] = len(stats["frame_times"])
+    result["frozen_frames"] = stats["frozen_frames"]
+    result["plays"] = stats["plays"]
+    result["frame_time"] = _percentiles(stats["frame_times"])
+    # ru_maxrss está en KiB en Linux
+    result["peak_rss_mb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    result["mobjects"] = {
+        "final_top_level": len(scene.mobjects),
+        "final_family": len(scene.get_mobject_family_members()),
+        "peak_family": max(stats["peak_family"], len(scene.get_mobject_family_members())),
+    }
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Suite completa y comparación
+# ---------------------------------------------------------------------------
+
+def _git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(paths=None, names=None, quality=DEFAULT_QUALITY):
+    scenes = list(iter_scenes(paths, names))
+    results = {}
+    # Un proceso nuevo por escena: el pico de memoria es solo de esa escena
+    # y la configuración global de manim no se arrastra de una a otra.
+    # Las escenas corren de a una para que no compitan por la CPU.
+    context = multiprocessing.get_context("spawn")
+    for path, scene_name in scenes:
+        key = scene_id(path, scene_name)
+        print(f"{key} ...", flush=True)
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            results[key] = pool.submit(run_scene, str(path), scene_name, quality).result()
+
+    return {
+        "meta": {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "revision": _git_revision(),
+            "quality": quality,
+            "manim": manim.__version__,
+            "python": platform.python_version(),
+            "machine": platform.platform(),
+        },
+        "scenes": results,
+    }
+
+
+def _metric(result, path):
+    value = result
+    for key in path:
+        if not isinstance(value, dict) or value.get(key) is None:
+            return None
+        value = value[key]
+    return value
+
+
+def compare(current, baseline, threshold=0.10):
+    """
+    Compara dos corridas. Devuelve las regresiones como tuplas
+    (escena, métrica, valor base, valor actual).
+    """
+    regressions = []
+    for key, result in current["scenes"].items():
+        base = baseline["scenes"].get(key)
+        if base is None or "error" in result or "error" in base:
+            continue
+        for path, min_delta in COMPARED_METRICS:
+            old, new = _metric(base, path), _metric(result, path)
+            if old is None or new is None:
+                continue
+            if new > old * (1 + threshold) and new - old > min_delta:
+                regressions.append((key, ".".join(path), old, new))
+    return regressions
+
+
+def print_summary(report, baseline=None):
+    rows = []
+    for key, result in report["scenes"].items():
+        if "error" in result:
+            rows.append((key, "ERROR", "", "", "", ""))
+            continue
+        frame_time = result["frame_time"] or {}
+        base = (baseline or {}).get("scenes", {}).get(key, {})
+        change = ""
+        if base.get("wall_time"):
+            change = f"{100 * (result['wall_time'] / base['wall_time'] - 1):+.1f}%"
+        rows.append((
+            key,
+            f"{result['wall_time']:.2f}s",
+            f"{1000 * frame_time.get('p50', 0):.1f}/{1000 * frame_time.get('p95', 0):.1f}ms",
+            f"{result['peak_rss_mb']:.0f}MB",
+            str(result["mobjects"]["peak_family"]),
+            change,
+        ))
+
+    header = ("escena", "total", "frame p50/p95", "RSS", "mobjects", "vs base")
+    widths = [max(len(row[i]) for row in rows + [header]) for i in range(len(header))]
+    for row in [header] + rows:
+        print("  ".join(cell.ljust(width) for cell, width in zip(row, widths)))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark de las escenas del repositorio")
+    parser.add_argument("paths", nargs="*", help="archivos de escenas (por defecto, todos)")
+    parser.add_argument("-s", "--scene", action="append", dest="scenes", help="solo estas escenas")
+    parser.add_argument("-o", "--output", help="archivo JSON de resultados")
+    parser.add_argument("--baseline", help="JSON de una corrida anterior para comparar")
+    parser.add_argument("--threshold", type=float, default=0.10, help="aumento relativo tolerado")
+    parser.add_argument("--quality", default=DEFAULT_QUALITY, help="calidad de manim (low_quality, ...)")
+    args = parser.parse_args(argv)
+
+    report = run_suite(args.paths, args.scenes, args.quality)
+    output = Path(args.output) if args.output else (
+        get_cache_dir("benchmarks") / f"{time.strftime('%Y%m%d-%H%M%S')}.json"
+    )
+    output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    baseline = None
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+    print()
+    print_summary(report, baseline)
+    print(f"\nResultados en {output}")
+
+    errors = [key for key, result in report["scenes"].items() if "error" in result]
+    for key in errors:
+        print(f"\n{key} falló:\n{report['scenes'][key]['error']}")
+
+    if baseline is None:
+        return 1 if errors else 0
+    regressions = compare(report, baseline, args.threshold)
+    if regressions:
+        print(f"\nRegresiones (> {100 * args.threshold:.0f}%):")
+        for key, metric, old, new in regressions:
+            print(f"  {key}  {metric}: {old:.4g} -> {new:.4g}")
+    return 1 if regressions or errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+from manim import *
+import numpy as np
+
+
+class BillboardLabels(Mobject):
+    """
+    Etiquetas fijas en el frame que siguen puntos 3D de la escena.
+
+    Cada etiqueta se registra con una función de anclaje que devuelve su punto
+    3D. Una vez por frame se evalúan todos los anclajes, se proyectan juntos
+    con una sola multiplicación de matrices contra la cámara actual y cada
+    etiqueta se mueve a su punto proyectado.
+
+    Es un mobject sin puntos (como el ``dummy`` de los updaters): hay que
+    agregarlo a la escena con ``add_foreground_mobject`` para que se
+    actualice después de los trackers y updaters normales.
+    """
+
+    def __init__(self, camera, **kwargs):
+        super().__init__(**kwargs)
+        self.camera = camera
+        # Cada entrada: (etiquetas, función de anclaje, devuelve varios puntos)
+        self.entries = []
+        self._anchors = np.zeros((0, 3))
+        self.add_updater(lambda m: m.update_labels())
+
+    def register(self, label, anchor_func):
+        """anchor_func() -> punto 3D de la etiqueta"""
+        self.entries.append(([label], anchor_func, False))
+        self._resize_buffer()
+        return self
+
+    def register_many(self, labels, anchors_func):
+        """anchors_func() -> arreglo (len(labels), 3), evaluado de una vez"""
+        self.entries.append((list(labels), anchors_func, True))
+        self._resize_buffer()
+        return self
+
+    def unregister(self, *labels):
+        """Deja de mover las etiquetas dadas (p. ej. después de un FadeOut)"""
+        labels = set(labels)
+        entries = []
+        for entry_labels, func, many in self.entries:
+            if many:
+                if labels.isdisjoint(entry_labels):
+                    entries.append((entry_labels, func, many))
+            elif entry_labels[0] not in labels:
+                entries.append((entry_labels, func, many))
+        self.entries = entries
+        self._resize_buffer()
+        return self
+
+    def _resize_buffer(self):
+        count = sum(len(labels) for labels, _, _ in self.entries)
+        self._anchors = np.zeros((count, 3))
+
+    def get_anchor_points(self):
+        """Evalúa todos los anclajes en el búfer preasignado (N, 3)"""
+        i = 0
+        for labels, func, many in self.entries:
+            n = len(labels)
+            self._anchors[i:i + n] = func() if many else [func()]
+            i += n
+        return self._anchors
+
+    def update_labels(self):
+        if not self.entries:
+            return self
+        anchors = self.get_anchor_points()
+        # Matriz de la cámara del frame actual (no la del frame anterior)
+        self.camera.reset_rotation_matrix()
+        projected = self.camera.project_points(anchors)
+        i = 0
+        for labels, _, _ in self.entries:
+            for label in labels:
+                label.move_to(projected[i])
+                i += 1
+        return self
@@ -0,0 +1,113 @@
+"""
+Orden de profundidad incremental para mallas 3D.
+
+``ThreeDCamera`` ordena en cada frame los mobjects con ``shade_in_3d`` (las
+caras de ``Sphere`` y ``Surface``) llamando por cada cara a
+``get_z_index_reference_point`` (centro de su caja) y a ``sorted`` con una
+clave en Python. Con varias esferas traslúcidas eso domina el frame, incluso
+cuando la cámara apenas gira con ``begin_ambient_camera_rotation``.
+
+``DepthSorter`` calcula los centros de todas las caras en lote (apilando las
+caras con igual cantidad de puntos) y ordena con ``np.argsort``:
+
+  * Si las caras y sus centros no cambiaron y la cámara giró menos de
+    ``resort_angle`` desde el último orden, reutiliza ese orden.
+  * Si hay que reordenar y las caras son las mismas, parte del orden anterior:
+    el argsort estable (timsort) sobre datos casi ordenados es casi lineal.
+
+El resultado es el mismo que el de ``ThreeDCamera`` salvo dentro de esa
+tolerancia de giro. Uso en una escena:
+
+    class MiEscena(ThreeDScene):
+        def __init__(self, **kwargs):
+            super().__init__(camera_class=DepthSortCamera, **kwargs)
+"""
+
+import numpy as np
+from manim import *
+from manim.camera.camera import Camera
+
+# Giro de la cámara (radianes) por debajo del cual se reutiliza el orden anterior
+RESORT_ANGLE = 0.5 * DEGREES
+
+
+def reference_centers(mobjects):
+    """Centros (F, 3) de los puntos de referencia de profundidad de ``mobjects``"""
+    references = [getattr(mob, "z_index_group", mob) for mob in mobjects]
+    centers = np.empty((len(references), 3))
+    # Caras sin submobjects agrupadas por cantidad de puntos: un min/max por grupo
+    by_length = {}
+    for i, ref in enumerate(references):
+        if ref.submobjects or len(ref.points) == 0:
+            centers[i] = ref.get_center()
+        else:
+            by_length.setdefault(len(ref.points), []).append(i)
+    for indices in by_length.values():
+        stacked = np.stack([references[i].points for i in indices])
+        centers[indices] = (stacked.min(axis=1) + stacked.max(axis=1)) / 2
+    return centers
+
+
+def rotation_angle(rotation, previous):
+    """Ángulo de la rotación que lleva ``previous`` a ``rotation``"""
+    cos_angle = (np.trace(rotation @ previous.T) - 1) / 2
+    return np.arccos(np.clip(cos_angle, -1, 1))
+
+
+class DepthSorter:
+    def __init__(self, resort_angle=RESORT_ANGLE):
+        self.resort_angle = resort_angle
+        self._ids = None
+        self._centers = None
+        self._rotation = None
+        self._order = None
+        self.resorts = 0
+        self.reuses = 0
+
+    def sort(self, mobjects, rotation_matrix):
+        """
+        Mismo orden que ThreeDCamera.get_mobjects_to_display: primero los
+        mobjects con shade_in_3d del más lejano al más cercano, después el
+        resto en su orden original.
+        """
+        shaded, others = [], []
+        for mob in mobjects:
+            (shaded if getattr(mob, "shade_in_3d", False) else others).append(mob)
+        if len(shaded) < 2:
+            return shaded + others
+
+        ids = [id(mob) for mob in shaded]
+        centers = reference_centers(shaded)
+        same_faces = ids == self._ids
+        if (
+            same_faces
+            and np.array_equal(centers, self._centers)
+            and rotation_angle(rotation_matrix, self._rotation) < self.resort_angle
+        ):
+            self.reuses += 1
+            return [shaded[i] for i in self._order] + others
+
+        depths = centers @ rotation_matrix[2]
+        if same_faces:
+            # Reparación: el orden anterior ya está casi ordenado
+            previous = self._order
+            order = previous[np.argsort(depths[previous], kind="stable")]
+        else:
+            order = np.argsort(depths, kind="stable")
+
+        self._ids = ids
+        self._centers = centers
+        self._rotation = np.array(rotation_matrix)
+        self._order = order
+        self.resorts += 1
+        return [shaded[i] for i in order] + others
+
+
+class DepthSortCamera(ThreeDCamera):
+    def __init__(self, resort_angle=RESORT_ANGLE, **kwargs):
+        super().__init__(**kwargs)
+        self.depth_sorter = DepthSorter(resort_angle)
+
+    def get_mobjects_to_display(self, *args, **kwargs):
+        mobjects = Camera.get_mobjects_to_display(self, *args, **kwargs)
+        return self.depth_sorter.sort(mobjects, self.get_rotation_matrix())
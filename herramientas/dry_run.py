@@ -0,0 +1,202 @@
+"""
+Ejecución en seco "solo geometría" de las escenas.
+
+Corre ``construct`` y avanza animaciones y updaters frame a frame igual que
+un render normal, pero nunca rasteriza (la cámara no dibuja) ni codifica
+video. Así se mide solo el costo en Python de la geometría
+(``create_deformed_grid``, ``generate_orbit_points``, updaters de partículas,
+...) separado del costo de Cairo/ffmpeg, y en CI se verifica en segundos que
+la lógica de las escenas no falla.
+
+Por cada play/wait se reporta el tiempo total del segmento, el tiempo dentro
+de ``update_to_time`` (animaciones + updaters), los frames avanzados y la
+rotación de objetos: mobjects creados, copiados, agregados y quitados de la
+escena.
+
+    python -m herramientas.dry_run                               # todas las escenas
+    python -m herramientas.dry_run space-time_deformation_bh.py -o seco.json
+"""
+
+import argparse
+import functools
+import json
+import sys
+import time
+import traceback
+from pathlib import Path
+
+from manim import *
+
+from .frame_parallel import register_instrumentation, unregister_instrumentation
+from .scene_loader import find_scene_classes, iter_scenes, load_scene_module, scene_id
+
+
+class GeometryDryRun:
+    """Desactiva la rasterización de una escena y junta métricas por segmento"""
+
+    def __init__(self):
+        self.segments = []
+        self.created = 0
+        self.copied = 0
+        self._patches = []
+
+    # -----------------------------------------------------------------
+    # Conteo de mobjects creados y copiados (parches globales)
+    # -----------------------------------------------------------------
+    def install(self):
+        dry_run = self
+        init, copy = Mobject.__init__, Mobject.copy
+
+        @functools.wraps(init)
+        def counted_init(mob, *args, **kwargs):
+            dry_run.created += 1
+            init(mob, *args, **kwargs)
+
+        @functools.wraps(copy)
+        def counted_copy(mob, *args, **kwargs):
+            result = copy(mob, *args, **kwargs)
+            dry_run.copied += len(result.get_family())
+            return result
+
+        self._patches = [(Mobject, "__init__", init), (Mobject, "copy", copy)]
+        Mobject.__init__ = counted_init
+        Mobject.copy = counted_copy
+        # Los conteos viven en este proceso: frame_parallel no reparte frames
+        register_instrumentation(self)
+        return self
+
+    def uninstall(self):
+        for owner, attr, original in self._patches:
+            setattr(owner, attr, original)
+        self._patches = []
+        unregister_instrumentation(self)
+
+    def __enter__(self):
+        return self.install()
+
+    def __exit__(self, *exc_info):
+        self.uninstall()
+
+    # -----------------------------------------------------------------
+    # Renderer sin dibujo
+    # -----------------------------------------------------------------
+    def attach(self, scene):
+        renderer = scene.renderer
+        render, play, freeze = renderer.render, renderer.play, renderer.freeze_current_frame
+        update_to_time = scene.update_to_time
+
+        # La cámara nunca dibuja; add_frame sigue avanzando el tiempo del renderer
+        renderer.update_frame = lambda *args, **kwargs: None
+
+        def counted_render(*args, **kwargs):
+            self.segments[-1]["frames"] += 1
+            render(*args, **kwargs)
+
+        def counted_freeze(duration):
+            self.segments[-1]["frozen_frames"] += int(duration * renderer.camera.frame_rate)
+            freeze(duration)
+
+        def timed_update_to_time(t):
+            start = time.perf_counter()
+            update_to_time(t)
+            self.segments[-1]["update_time"] += time.perf_counter() - start
+
+        def measured_play(scene, *args, **kwargs):
+            before = {id(m) for m in scene.get_mobject_family_members()}
+            created, copied = self.created, self.copied
+            segment = {
+                "index": len(self.segments),
+                "kind": "wait" if args and all(isinstance(a, Wait) for a in args) else "play",
+                "animations": [
+                    "animate" if type(a).__name__ == "_AnimationBuilder" else type(a).__name__
+                    for a in args
+                ],
+                "frames": 0, "frozen_frames": 0, "update_time": 0.0,
+            }
+            self.segments.append(segment)
+            start = time.perf_counter()
+            play(scene, *args, **kwargs)
+            segment["time"] = time.perf_counter() - start
+
+            after = {id(m) for m in scene.get_mobject_family_members()}
+            segment["created"] = self.created - created
+            segment["copied"] = self.copied - copied
+            segment["added"] = len(after - before)
+            segment["removed"] = len(before - after)
+            segment["family_size"] = len(after)
+
+        renderer.render = counted_render
+        renderer.freeze_current_frame = counted_freeze
+        renderer.play = measured_play
+        scene.update_to_time = timed_update_to_time
+        return self
+
+
+def run_scene(path, scene_name):
+    """Ejecuta una escena en seco; devuelve sus segmentos y el tiempo total"""
+    result = {"file": str(path), "scene": scene_name}
+    with tempconfig({"dry_run": True, "disable_caching": True, "progress_bar": "none"}):
+        with GeometryDryRun() as dry_run:
+            try:
+                module = load_scene_module(path)
+                scene_class = {c.__name__: c for c in find_scene_classes(module)}[scene_name]
+                start = time.perf_counter()
+                scene = scene_class()
+                dry_run.attach(scene)
+                scene.render()
+                result["time"] = time.perf_counter() - start
+            except Exception:
+                result["error"] = traceback.format_exc(limit=5)
+    result["segments"] = dry_run.segments
+    return result
+
+
+def print_report(result):
+    print(f"\n{scene_id(result['file'], result['scene'])}")
+    if "error" in result:
+        print(result["error"])
+        return
+    header = ("#", "segmento", "frames", "tiempo", "updaters", "creados", "copiados", "+/-", "familia")
+    rows = [
+        (
+            str(s["index"]),
+            f"{s['kind']} {', '.join(s['animations'])}"[:40],
+            str(s["frames"] or s["frozen_frames"]),
+            f"{s['time']:.3f}s",
+            f"{s['update_time']:.3f}s",
+            str(s["created"]),
+            str(s["copied"]),
+            f"+{s['added']}/-{s['removed']}",
+            str(s["family_size"]),
+        )
+        for s in result["segments"] if "time" in s
+    ]
+    widths = [max(len(row[i]) for row in rows + [header]) for i in range(len(header))]
+    for row in [header] + rows:
+        print("  ".join(cell.ljust(width) for cell, width in zip(row, widths)))
+    print(f"total: {result['time']:.2f}s")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ejecuta escenas sin rasterizar ni codificar")
+    parser.add_argument("paths", nargs="*", help="archivos de escenas (por defecto, todos)")
+    parser.add_argument("-s", "--scene", action="append", dest="scenes", help="solo estas escenas")
+    parser.add_argument("-o", "--output", help="guardar el reporte en JSON")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for path, scene_name in iter_scenes(args.paths, args.scenes):
+        result = run_scene(path, scene_name)
+        results[scene_id(path, scene_name)] = result
+        print_report(result)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2), encoding="utf-8")
+    failed = [key for key, result in results.items() if "error" in result]
+    if failed:
+        print(f"\n{len(failed)} escena(s) fallaron: {', '.join(failed)}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,139 @@
+"""
+Salida en tubería: codificación acotada en segundo plano.
+
+``SceneFileWriter`` ya codifica cada partial movie en un hilo, pero con una
+cola sin límite (si el codificador se atrasa los frames se acumulan en
+memoria) y al terminar cada ``play`` espera a que el codificador vacíe la
+cola y cierre el archivo antes de empezar a calcular el segmento siguiente.
+
+``PipelinedFileWriter``:
+
+  * Usa una cola de ``MAX_QUEUED_FRAMES`` frames: el render y la codificación
+    se solapan y, si el codificador se atrasa, ``write_frame`` se bloquea
+    (contrapresión) en lugar de llenar la memoria.
+  * Cierra cada partial movie en segundo plano (vaciar la cola, los paquetes
+    pendientes del codificador y el contenedor), así el segmento siguiente se
+    calcula mientras se termina de codificar el anterior. Hay a lo sumo
+    ``MAX_PENDING_MOVIES`` partial movies codificándose a la vez; antes de
+    unirlas en el video final se espera a todas.
+
+Uso en una escena:
+
+    class MiEscena(ThreeDScene):
+        def __init__(self, **kwargs):
+            super().__init__(renderer=CairoRenderer(file_writer_class=PipelinedFileWriter), **kwargs)
+"""
+
+from queue import Queue
+from threading import Event, Thread
+
+import av
+from manim import *
+from manim.scene.scene_file_writer import SceneFileWriter
+
+# Frames en cola entre el render y el codificador
+MAX_QUEUED_FRAMES = 8
+
+# Partial movies que se pueden estar codificando a la vez
+MAX_PENDING_MOVIES = 2
+
+
+class PipelinedFileWriter(SceneFileWriter):
+    max_queued_frames = MAX_QUEUED_FRAMES
+    max_pending_movies = MAX_PENDING_MOVIES
+
+    def __init__(self, *args, **kwargs):
+        self._pending_movies = []
+        self._writer_ready = Event()
+        super().__init__(*args, **kwargs)
+
+    # open_partial_movie_stream crea una Queue sin límite: se reemplaza por una acotada
+    @property
+    def queue(self):
+        return self._queue
+
+    @queue.setter
+    def queue(self, queue):
+        self._queue = Queue(maxsize=self.max_queued_frames) if queue.maxsize <= 0 else queue
+
+    def open_partial_movie_stream(self, file_path=None):
+        self._writer_ready.clear()
+        super().open_partial_movie_stream(file_path=file_path)
+        # El hilo toma su cola, stream y contenedor antes de que se abra otro
+        self._writer_ready.wait()
+
+    def listen_and_write(self):
+        queue, stream, container = self.queue, self.video_stream, self.video_container
+        errors = self._writer_errors = []
+        self._writer_ready.set()
+        while True:
+            num_frames, frame_data = queue.get()
+            if frame_data is None:
+                break
+            if errors:
+                # Se sigue vaciando la cola para no bloquear write_frame
+                continue
+            try:
+                for _ in range(num_frames):
+                    av_frame = av.VideoFrame.from_ndarray(frame_data, format="rgba")
+                    for packet in stream.encode(av_frame):
+                        container.mux(packet)
+            except Exception as error:
+                errors.append(error)
+
+    def close_partial_movie_stream(self):
+        self.queue.put((-1, None))
+        movie = PendingMovie(
+            self.writer_thread, self._writer_errors, self.video_stream, self.video_container,
+            self.partial_movie_file_path, self.renderer.num_plays,
+        )
+        self._pending_movies.append(movie)
+        while len(self._pending_movies) > self.max_pending_movies:
+            self._pending_movies.pop(0).join()
+
+    def wait_for_partial_movies(self):
+        while self._pending_movies:
+            self._pending_movies.pop(0).join()
+
+    def combine_to_movie(self):
+        self.wait_for_partial_movies()
+        super().combine_to_movie()
+
+    def finish(self):
+        self.wait_for_partial_movies()
+        super().finish()
+
+
+class PendingMovie:
+    """Partial movie que se termina de codificar y se cierra en un hilo aparte"""
+
+    def __init__(self, writer_thread, errors, stream, container, path, num_play):
+        self.writer_thread = writer_thread
+        self.errors = errors
+        self.stream = stream
+        self.container = container
+        self.path = path
+        self.num_play = num_play
+        self.thread = Thread(target=self._close)
+        self.thread.start()
+
+    def _close(self):
+        self.writer_thread.join()
+        if self.errors:
+            return
+        try:
+            for packet in self.stream.encode():
+                self.container.mux(packet)
+            self.container.close()
+        except Exception as error:
+            self.errors.append(error)
+            return
+        logger.info(
+            f"Animation {self.num_play} : Partial movie file written in %(path)s",
+            {"path": f"'{self.path}'"},
+        )
+
+    def join(self):
+        self.thread.join()
+        if self.errors:
+            raise self.errors[0]
@@ -0,0 +1,202 @@
+"""
+Render en paralelo, por frames, de segmentos que son función pura del tiempo.
+
+En la deformación de las escenas del espacio-tiempo o en el trazo de una
+órbita cada frame se calcula solo a partir del valor del tracker o de
+``alpha``: no depende de los frames anteriores. Esos ``play`` se pueden
+repartir entre varios procesos:
+
+    with frame_parallel(self):
+        self.play(depth_tracker.animate.set_value(1), run_time=4)
+
+Al empezar el segmento (ya con la imagen estática de fondo preparada) se
+crea un pool de procesos con ``fork``: cada proceso hereda una copia de la
+escena tal como está y, para el frame k, la lleva al tiempo t_k, la
+rasteriza y copia los píxeles a un búfer de memoria compartida (un anillo de
+``slots_per_worker`` frames por proceso, sin pickles). El proceso principal
+recibe los frames en orden, los pasa al codificador y al final evalúa una
+sola vez el último tiempo para dejar la escena en el estado final.
+
+Hacer fork de un proceso con hilos puede dejar trabados a los hijos (un
+lock tomado por un hilo que en el hijo no existe). Por eso, justo antes de
+crear el pool, se esperan las partial movies que se están cerrando
+(``PipelinedFileWriter``) y se detiene el hilo que codifica el segmento
+actual; se vuelve a iniciar, con la misma cola y el mismo contenedor,
+apenas existen los procesos.
+
+Cada proceso recibe sus frames en orden creciente, así que los updaters que
+solo "marcan lo que ya pasó" (p. ej. mostrar los perihelios alcanzados)
+también dan el mismo resultado. Si el segmento no se puede paralelizar
+(updaters con ``dt`` como la rotación ambiental, updaters de la escena,
+``wait_until``, renderer OpenGL, sistemas sin ``fork``, segmentos cortos o
+que no se renderizan) se renderiza normalmente.
+
+También se renderiza en serie con ``dry_run`` o con alguna herramienta de
+medición instalada (``dry_run.py``, ``profiler.py``, ``benchmark.py``, que
+se registran con ``register_instrumentation``) o con métodos del renderer,
+de la escena o de ``Mobject`` parcheados: lo que cuentan esos parches
+quedaría en las copias de los procesos hijos y se perdería.
+"""
+
+import multiprocessing as mp
+import os
+from contextlib import contextmanager
+from multiprocessing.shared_memory import SharedMemory
+from threading import Thread
+
+import numpy as np
+from manim import *
+from manim.renderer.cairo_renderer import CairoRenderer
+
+# Frames en vuelo por proceso (tamaño del anillo de memoria compartida)
+SLOTS_PER_WORKER = 2
+
+# Estado heredado por los procesos del pool: (escena, búfer de frames, tiempos)
+_worker_state = None
+
+# Herramientas de medición instaladas (ver register_instrumentation)
+_instrumentation = set()
+
+# Métodos originales: si alguno cambió, hay un parche global instalado
+_MOBJECT_METHODS = {name: Mobject.__dict__[name] for name in ("__init__", "copy", "update")}
+
+# Métodos que las herramientas de medición reemplazan en la instancia
+_PATCHED_RENDERER_METHODS = ("render", "update_frame", "add_frame", "play", "freeze_current_frame")
+
+
+def register_instrumentation(owner):
+    """Mientras ``owner`` esté registrado, los segmentos se renderizan en serie"""
+    _instrumentation.add(owner)
+
+
+def unregister_instrumentation(owner):
+    _instrumentation.discard(owner)
+
+
+@contextmanager
+def frame_parallel(scene, workers=None, slots_per_worker=SLOTS_PER_WORKER):
+    """Los ``play`` dentro del bloque se renderizan en paralelo por frames"""
+    workers = workers or os.cpu_count() or 1
+    previous = scene.__dict__.get("play_internal")
+
+    def play_internal(skip_rendering=False):
+        play_internal_parallel(scene, workers, slots_per_worker, skip_rendering)
+
+    scene.play_internal = play_internal
+    try:
+        yield
+    finally:
+        if previous is None:
+            del scene.play_internal
+        else:
+            scene.play_internal = previous
+
+
+def serial_reason(scene, workers, num_frames, skip_rendering=False):
+    """Motivo por el que el segmento se renderiza en serie, o None"""
+    renderer = scene.renderer
+    if skip_rendering or renderer.skip_animations or scene.skip_animation_preview:
+        return "el segmento no se renderiza"
+    if config.dry_run:
+        return "dry_run"
+    if _instrumentation:
+        return "hay herramientas de medición instaladas"
+    if any(Mobject.__dict__.get(name) is not method for name, method in _MOBJECT_METHODS.items()):
+        return "métodos de Mobject parcheados"
+    if "update_to_time" in vars(scene) or any(name in vars(renderer) for name in _PATCHED_RENDERER_METHODS):
+        return "la escena o el renderer tienen métodos parcheados"
+    if not isinstance(renderer, CairoRenderer):
+        return "solo con el renderer de Cairo"
+    if "fork" not in mp.get_all_start_methods():
+        return "el sistema no admite fork"
+    if workers < 2 or num_frames < 2 * workers:
+        return "segmento demasiado corto"
+    if scene.stop_condition is not None:
+        return "wait_until depende de los frames anteriores"
+    if scene.updaters:
+        return "la escena tiene updaters propios"
+    if any(mob.has_time_based_updater() for mob in scene.get_mobject_family_members()):
+        return "hay updaters que dependen de dt"
+    return None
+
+
+def play_internal_parallel(scene, workers, slots_per_worker=SLOTS_PER_WORKER, skip_rendering=False):
+    """Reemplazo de Scene.play_internal que reparte los frames entre procesos"""
+    global _worker_state
+
+    duration = scene.get_run_time(scene.animations)
+    num_frames = len(np.arange(0, duration, 1 / config.frame_rate))
+    reason = serial_reason(scene, workers, num_frames, skip_rendering)
+    if reason is not None:
+        logger.debug(f"frame_parallel: render en serie ({reason})")
+        return type(scene).play_internal(scene, skip_rendering)
+
+    scene.duration = duration
+    scene.time_progression = scene._get_animation_time_progression(scene.animations, duration)
+    times = np.asarray(scene.time_progression.iterable, dtype=float)
+    renderer = scene.renderer
+    pixel_array = renderer.camera.pixel_array
+    num_slots = min(len(times), workers * slots_per_worker)
+    memory = SharedMemory(create=True, size=num_slots * pixel_array.nbytes)
+    try:
+        frames = np.ndarray((num_slots, *pixel_array.shape), dtype=pixel_array.dtype, buffer=memory.buf)
+        _worker_state = (scene, frames, times)
+        with writer_paused(renderer.file_writer):
+            pool = mp.get_context("fork").Pool(workers)
+        with pool:
+            pending = {k: pool.apply_async(_render_frame, (k,)) for k in range(num_slots)}
+            for k, _ in enumerate(scene.time_progression):
+                pending.pop(k).get()
+                # El escritor puede encolar el frame: se copia antes de liberar el lugar
+                renderer.add_frame(np.array(frames[k % num_slots]))
+                if k + num_slots < len(times):
+                    pending[k + num_slots] = pool.apply_async(_render_frame, (k + num_slots,))
+    finally:
+        # Sin vistas al búfer antes de cerrarlo
+        _worker_state = frames = None
+        memory.close()
+        memory.unlink()
+
+    # Estado final de la escena en el proceso principal
+    scene.last_t = times[-2]
+    scene.update_to_time(times[-1])
+
+    for animation in scene.animations:
+        animation.finish()
+        animation.clean_up_from_scene(scene)
+    if not renderer.skip_animations:
+        scene.update_mobjects(0)
+    renderer.static_image = None
+    scene.time_progression.close()
+
+
+@contextmanager
+def writer_paused(file_writer):
+    """Sin hilos del escritor de video dentro del bloque (para hacer fork)"""
+    wait_for_partial_movies = getattr(file_writer, "wait_for_partial_movies", None)
+    if wait_for_partial_movies is not None:
+        wait_for_partial_movies()
+    thread = getattr(file_writer, "writer_thread", None)
+    running = thread is not None and thread.is_alive()
+    if running:
+        # Todavía no hay frames del segmento: el hilo solo espera en la cola
+        file_writer.queue.put((-1, None))
+        thread.join()
+    try:
+        yield
+    finally:
+        if running:
+            # listen_and_write toma de nuevo la cola, el stream y el contenedor actuales
+            file_writer.writer_thread = Thread(target=file_writer.listen_and_write)
+            file_writer.writer_thread.start()
+
+
+def _render_frame(k):
+    scene, frames, times = _worker_state
+    # dt nominal aunque este proceso no haya calculado el frame anterior
+    if k > 0:
+        scene.last_t = times[k - 1]
+    scene.update_to_time(times[k])
+    scene.renderer.update_frame(scene, scene.moving_mobjects)
+    frames[k % len(frames)] = scene.renderer.camera.pixel_array
+    return k
@@ -0,0 +1,267 @@
+"""
+Geodésicas de Schwarzschild por integración numérica, en lote.
+
+La solución con integrales elípticas de ``SchwarzschildGeodesic`` solo cubre
+órbitas ligadas. Este módulo integra la ecuación de la órbita en la forma
+u = 1/r, con φ como variable independiente,
+
+    u'' = A - u + 3 M u²,     A = M / L²  (tipo tiempo),   A = 0  (nulas)
+
+para muchas condiciones iniciales a la vez: el estado es un arreglo (N, 2)
+con (u, du/dφ) y cada trayectoria avanza con su propio paso de un
+Runge-Kutta adaptativo de Dormand-Prince 5(4), todas en las mismas
+operaciones de NumPy. Así se calculan miles de trayectorias por llamada
+(abanicos de órbitas, haces de fotones), incluidas las que caen al
+horizonte, escapan o quedan cerca de la órbita circular inestable.
+
+Eventos detectados en cada paso:
+
+  * cruce del horizonte (u = 1/2M) y escape (u = 1/r_max): terminan la
+    trayectoria;
+  * ápsides (du/dφ cambia de signo): periapsis (r mínimo) y apoapsis.
+
+Los resultados se muestrean en una grilla común de φ (interpolación de
+Hermite entre pasos), con NaN después del final de cada trayectoria. Si se
+agotan las iteraciones, las trayectorias que seguían activas terminan con
+destino ``UNFINISHED`` en el φ al que llegaron.
+"""
+
+import numpy as np
+
+# Destino de cada trayectoria
+COMPLETE = 0  # llegó a phi_max
+HORIZON = 1  # cruzó el horizonte
+ESCAPE = 2  # se alejó más allá de r_max
+UNFINISHED = 4  # se agotaron las iteraciones antes de phi_max (3 es INVALID en kerr.py)
+
+# Tipo de ápside
+PERIAPSIS = 1
+APOAPSIS = -1
+
+# Tablero de Butcher de Dormand-Prince 5(4)
+DP_C = np.array([0, 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1, 1])
+DP_A = [
+    [],
+    [1 / 5],
+    [3 / 40, 9 / 40],
+    [44 / 45, -56 / 15, 32 / 9],
+    [19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729],
+    [9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656],
+    [35 / 384, 0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84],
+]
+DP_B = np.array([35 / 384, 0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84, 0])
+DP_E = DP_B - np.array([5179 / 57600, 0, 7571 / 16695, 393 / 640, -92097 / 339200, 187 / 2100, 1 / 40])
+
+
+def timelike_initial_conditions(p, e, M, start=PERIAPSIS):
+    """
+    Condiciones (u0, w0, A) de órbitas tipo tiempo con semilatus rectum p y
+    excentricidad e (r = p / (1 + e cos χ) en las ligadas), que empiezan en el
+    periapsis o en el apoapsis. Con p < 6M + 2eM el punto u = (1 + e)/p queda
+    del otro lado del máximo del potencial efectivo: desde ahí cae al horizonte.
+    """
+    p, e = np.broadcast_arrays(np.asarray(p, dtype=float), np.asarray(e, dtype=float))
+    u0 = (1 + e) / p if start == PERIAPSIS else (1 - e) / p
+    # 1/L² = 1/(M p) - (3 + e²)/p² (las raíces u_peri, u_apo del potencial efectivo)
+    A = (p - (3 + e**2) * M) / p**2
+    return u0, np.zeros_like(u0), A
+
+
+def null_initial_conditions(b, r0, M):
+    """
+    Condiciones (u0, w0, A) de fotones con parámetro de impacto b que parten
+    de r0 acercándose al agujero negro. Se captura si b < 3√3 M.
+    """
+    b, r0 = np.broadcast_arrays(np.asarray(b, dtype=float), np.asarray(r0, dtype=float))
+    u0 = 1 / r0
+    w0 = np.sqrt(np.maximum(1 / b**2 - u0**2 * (1 - 2 * M * u0), 0))
+    return u0, w0, np.zeros_like(u0)
+
+
+class GeodesicSolution:
+    """
+    Resultado de ``integrate_geodesics``.
+
+    phi: grilla (S,) de φ; u: (N, S) con NaN después del final; fate: destino
+    de cada trayectoria; end_phi, end_u: dónde terminó; events: ápsides como
+    arreglos planos (trajectory, phi, u, kind).
+    """
+
+    def __init__(self, phi, u, fate, end_phi, end_u, events, M):
+        self.phi = phi
+        self.u = u
+        self.fate = fate
+        self.end_phi = end_phi
+        self.end_u = end_u
+        self.events = events
+        self.M = M
+
+    def __len__(self):
+        return len(self.u)
+
+    def apsides(self, i, kind=None):
+        """(φ, u) de los ápsides de la trayectoria i (solo de un tipo si kind)"""
+        mask = self.events["trajectory"] == i
+        if kind is not None:
+            mask &= self.events["kind"] == kind
+        return self.events["phi"][mask], self.events["u"][mask]
+
+    def points(self, i, phi0=0.0):
+        """Puntos (K, 3) en el plano de la órbita, terminando en el evento final"""
+        valid = np.isfinite(self.u[i]) & (self.phi <= self.end_phi[i])
+        phi = self.phi[valid]
+        u = self.u[i][valid]
+        if self.fate[i] != COMPLETE and self.end_phi[i] > (phi[-1] if len(phi) else -np.inf):
+            phi = np.append(phi, self.end_phi[i])
+            u = np.append(u, self.end_u[i])
+        return polar_points(phi + phi0, u)
+
+    def all_points(self, phi0=0.0):
+        return [self.points(i, phi0) for i in range(len(self))]
+
+
+def polar_points(phi, u):
+    """(K, 3) con x = cos φ / u, y = sin φ / u"""
+    r = 1 / u
+    return np.stack([r * np.cos(phi), r * np.sin(phi), np.zeros_like(r)], axis=1)
+
+
+def hermite(y0, y1, d0, d1, h, theta):
+    """Interpolación cúbica de Hermite en la fracción theta de un paso de largo h"""
+    theta2 = theta * theta
+    theta3 = theta2 * theta
+    return (
+        (2 * theta3 - 3 * theta2 + 1) * y0
+        + (theta3 - 2 * theta2 + theta) * h * d0
+        + (-2 * theta3 + 3 * theta2) * y1
+        + (theta3 - theta2) * h * d1
+    )
+
+
+def integrate_geodesics(
+    u0, w0, A, M, phi_max, num_samples=1000, r_max=None,
+    rtol=1e-8, atol=1e-10, max_step=0.05, max_iterations=100000,
+):
+    """
+    Integra en lote u'' = A - u + 3 M u² desde φ = 0 hasta phi_max.
+
+    u0, w0, A: arreglos (N,) (ver timelike_initial_conditions y
+    null_initial_conditions). r_max: radio de escape (por defecto, u = 0).
+    """
+    u0, w0, A = (np.atleast_1d(np.asarray(x, dtype=float)) for x in np.broadcast_arrays(u0, w0, A))
+    n = len(u0)
+    grid = np.linspace(0, phi_max, num_samples)
+    u_horizon = 1 / (2 * M)
+    u_escape = 0.0 if r_max is None else 1 / r_max
+
+    def deriv(y, A):
+        return np.stack([y[:, 1], A - y[:, 0] + 3 * M * y[:, 0] ** 2], axis=1)
+
+    y = np.stack([u0, w0], axis=1)
+    phi = np.zeros(n)
+    h = np.full(n, min(max_step, 1e-2))
+    k_first = deriv(y, A)
+    out = np.full((n, num_samples), np.nan)
+    out[:, 0] = u0
+
+    fate = np.full(n, COMPLETE)
+    end_phi = np.full(n, float(phi_max))
+    end_u = np.full(n, np.nan)
+    events = {"trajectory": [], "phi": [], "u": [], "kind": []}
+
+    # Los que empiezan fuera del dominio terminan de inmediato
+    active = (u0 < u_horizon) & (u0 > u_escape)
+    fate[~active & (u0 >= u_horizon)] = HORIZON
+    fate[~active & (u0 <= u_escape)] = ESCAPE
+    end_phi[~active] = 0.0
+    end_u[~active] = u0[~active]
+
+    for _ in range(max_iterations):
+        idx = np.flatnonzero(active)
+        if len(idx) == 0:
+            break
+        yi, Ai = y[idx], A[idx]
+        hi = np.minimum(h[idx], phi_max - phi[idx])
+
+        # Etapas de Dormand-Prince (la primera se reutiliza del paso anterior)
+        stages = [k_first[idx]]
+        for c_row in DP_A[1:]:
+            increment = sum(a * k for a, k in zip(c_row, stages))
+            stages.append(deriv(yi + hi[:, None] * increment, Ai))
+        y_new = yi + hi[:, None] * sum(b * k for b, k in zip(DP_B, stages))
+        error = hi[:, None] * sum(c * k for c, k in zip(DP_E, stages))
+        scale = atol + rtol * np.maximum(np.abs(yi), np.abs(y_new))
+        error_norm = np.max(np.abs(error) / scale, axis=1)
+
+        accepted = error_norm <= 1
+        with np.errstate(divide="ignore"):
+            factor = np.clip(0.9 * error_norm ** -0.2, 0.2, 5.0)
+        h[idx] = np.minimum(hi * factor, max_step)
+
+        acc = idx[accepted]
+        if len(acc) == 0:
+            continue
+        step = hi[accepted]
+        old_phi, new_phi = phi[acc], phi[acc] + step
+        old_u, old_w = yi[accepted, 0], yi[accepted, 1]
+        new_u, new_w = y_new[accepted, 0], y_new[accepted, 1]
+        old_du, new_du = stages[0][accepted, 0], stages[6][accepted, 0]
+
+        # Muestras de la grilla que caen dentro del paso (old_phi, new_phi]
+        first = np.searchsorted(grid, old_phi, side="right")
+        last = np.searchsorted(grid, new_phi, side="right")
+        counts = last - first
+        if counts.sum():
+            rows = np.repeat(np.arange(len(acc)), counts)
+            cols = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts) + np.repeat(first, counts)
+            theta = (grid[cols] - old_phi[rows]) / step[rows]
+            out[acc[rows], cols] = hermite(old_u[rows], new_u[rows], old_du[rows], new_du[rows], step[rows], theta)
+
+        # Ápsides: du/dφ cambia de signo
+        turning = ((old_w > 0) & (new_w <= 0)) | ((old_w < 0) & (new_w >= 0))
+        if turning.any():
+            t = np.flatnonzero(turning)
+            theta = old_w[t] / (old_w[t] - new_w[t])
+            events["trajectory"].append(acc[t])
+            events["phi"].append(old_phi[t] + theta * step[t])
+            events["u"].append(hermite(old_u[t], new_u[t], old_du[t], new_du[t], step[t], theta))
+            events["kind"].append(np.where(old_w[t] > 0, PERIAPSIS, APOAPSIS))
+
+        phi[acc] = new_phi
+        y[acc] = y_new[accepted]
+        k_first[acc] = stages[6][accepted]
+
+        # Eventos terminales: horizonte y escape (cruce por interpolación lineal)
+        for crossed, target, code in (
+            (new_u >= u_horizon, u_horizon, HORIZON),
+            (new_u <= u_escape, u_escape, ESCAPE),
+        ):
+            if crossed.any():
+                t = np.flatnonzero(crossed)
+                theta = (target - old_u[t]) / (new_u[t] - old_u[t])
+                fate[acc[t]] = code
+                end_phi[acc[t]] = old_phi[t] + theta * step[t]
+                end_u[acc[t]] = target
+                active[acc[t]] = False
+        active[acc[new_phi >= phi_max]] = False
+
+    # Sin iteraciones para llegar a phi_max: terminan donde quedaron
+    fate[active] = UNFINISHED
+    end_phi[active] = phi[active]
+
+    # Nada después del final de cada trayectoria
+    out[grid[None, :] > end_phi[:, None]] = np.nan
+    finished = (fate == COMPLETE) | (fate == UNFINISHED)
+    end_u[finished] = y[finished, 0]
+
+    if events["trajectory"]:
+        events = {key: np.concatenate(value) for key, value in events.items()}
+        keep = events["phi"] <= end_phi[events["trajectory"]]
+        order = np.lexsort((events["phi"], events["trajectory"]))
+        events = {key: value[order[keep[order]]] for key, value in events.items()}
+    else:
+        events = {
+            "trajectory": np.zeros(0, dtype=int), "phi": np.zeros(0),
+            "u": np.zeros(0), "kind": np.zeros(0, dtype=int),
+        }
+    return GeodesicSolution(grid, out, fate, end_phi, end_u, events, M)
@@ -0,0 +1,59 @@
+import numpy as np
+
+from .array_cache import cached_array
+
+
+def adaptive_line_samples(offset, extent, num_samples, support_radius):
+    """
+    Coordenadas de muestreo a lo largo de una línea de la grilla que pasa a
+    distancia ``offset`` del centro, para una deformación radial que vale
+    exactamente cero desde ``support_radius`` hacia afuera.
+
+    Devuelve un subconjunto de ``np.linspace(-extent, extent, num_samples)``:
+    todas las muestras dentro del soporte, la última muestra plana de cada
+    lado y los extremos. Las muestras descartadas están alineadas sobre un
+    tramo plano, así que la poligonal resultante es idéntica a la original
+    pero cada tramo plano es un solo segmento.
+    """
+    samples = np.linspace(-extent, extent, num_samples)
+    if abs(offset) >= support_radius:
+        return samples[[0, -1]]
+
+    # Mitad de la cuerda de la línea dentro del disco deformado
+    half_chord = np.sqrt(support_radius**2 - offset**2)
+    inside = np.flatnonzero(np.abs(samples) < half_chord)
+    if len(inside) == 0:
+        return samples[[0, -1]]
+
+    first = max(inside[0] - 1, 0)
+    last = min(inside[-1] + 1, num_samples - 1)
+    keep = np.unique(np.concatenate([[0], np.arange(first, last + 1), [num_samples - 1]]))
+    return samples[keep]
+
+
+@cached_array
+def grid_line_field(height, extent, num_lines, num_samples, support_radius):
+    """
+    Campo de la grilla deformada con profundidad 1: arreglo (P, 4) con
+    columnas x, y, h(r), índice de línea. Las líneas 2k van en dirección y
+    (x = offset k) y las 2k + 1 en dirección x, con las muestras de
+    ``adaptive_line_samples``.
+
+    height(r) es la forma de la deformación con profundidad 1 (z = depth *
+    h); se evalúa una sola vez por punto y el campo queda en la caché de
+    arreglos, así cada frame solo escala la columna h.
+    """
+    rows = []
+    for k, offset in enumerate(np.linspace(-extent, extent, num_lines)):
+        samples = adaptive_line_samples(offset, extent, num_samples, support_radius)
+        heights = [height(np.hypot(offset, s)) for s in samples]
+        fixed = np.full_like(samples, offset)
+        rows.append(np.column_stack([fixed, samples, heights, np.full_like(samples, 2 * k)]))
+        rows.append(np.column_stack([samples, fixed, heights, np.full_like(samples, 2 * k + 1)]))
+    return np.concatenate(rows)
+
+
+def split_lines(field):
+    """Separa el campo (P, 4) de ``grid_line_field`` en una vista por línea"""
+    starts = np.flatnonzero(np.diff(field[:, 3])) + 1
+    return np.split(field, starts)
@@ -0,0 +1,497 @@
+"""
+Geodésicas de Kerr (agujero negro en rotación) por integración numérica, en lote.
+
+Las escenas de órbitas solo cubren Schwarzschild (``orbits.py`` con
+``ellipkinc`` y ``geodesics.py`` en el plano). Con espín ``a`` las órbitas
+dejan de ser planas: el plano orbital precesa (Lense-Thirring) y todo lo que
+cae es arrastrado en φ (arrastre de marcos). Este módulo integra las
+geodésicas en coordenadas de Boyer-Lindquist (r, θ, φ, t) para muchas
+condiciones iniciales a la vez, como ``integrate_geodesics``.
+
+Con E = -p_t, L = p_φ (conservadas) y el tiempo de Mino dλ = dτ / Σ, el
+hamiltoniano queda separado:
+
+    F = ½ [Δ p_r² + p_θ² - P² / Δ + (L / sin θ - a E sin θ)² + μ² Σ] = 0
+    Σ = r² + a² cos² θ,   Δ = r² - 2Mr + a²,   P = E (r² + a²) - a L
+
+(μ = 1 tipo tiempo, μ = 0 nulas). Las ecuaciones de Hamilton de F dan
+dr/dλ, dθ/dλ, dφ/dλ, dt/dλ y las fuerzas dp_r/dλ, dp_θ/dλ; se integran con
+el tiempo coordenado t como variable independiente (dividiendo por dt/dλ),
+así todas las trayectorias comparten la misma grilla de t y en cada frame
+las N partículas están en el mismo instante. El estado es (N, 5) con
+(r, θ, φ, p_r, p_θ) y cada trayectoria avanza con su propio paso del mismo
+Dormand-Prince 5(4) de ``geodesics.py``. La forma de segundo orden pasa los
+puntos de retorno (r mínimo y máximo, θ extremos) sin raíces cuadradas.
+
+Cantidades conservadas: E y L son exactas por construcción. En cada paso se
+vigilan la ligadura F = 0 (normalización de la 4-velocidad) y la constante
+de Carter Q = p_θ² + cos² θ (a² (μ² - E²) + L² / sin² θ); la deriva máxima
+de cada trayectoria queda en la solución (``reliable`` marca las que se
+apartaron más de una tolerancia, y tampoco da por confiables las que no
+llegaron a t_max porque se agotaron las iteraciones: ``UNFINISHED``).
+
+Eventos: horizonte exterior r_+ = M + sqrt(M² - a²) y escape (terminan la
+trayectoria), periapsis/apoapsis (p_r cambia de signo) y nodo ascendente
+(z pasa de negativo a positivo), con el que se mide la precesión del plano.
+
+Las salidas son puntos (N, 3) en coordenadas cartesianas de Boyer-Lindquist,
+x = sqrt(r² + a²) sin θ cos φ, y = sqrt(r² + a²) sin θ sin φ, z = r cos θ:
+``points(i)`` (la trayectoria i) y ``frame(k)`` (todas en el instante k).
+
+    state, E, L = bound_orbit_initial_conditions(p=12, e=0.3, inclination=np.radians(45), a=0.9, M=1)
+    solution = integrate_kerr_geodesics(state, E, L, a=0.9, M=1, t_max=3000)
+    trail = solution.points(0)
+"""
+
+import numpy as np
+
+from .geodesics import APOAPSIS, COMPLETE, DP_A, DP_B, DP_E, ESCAPE, HORIZON, PERIAPSIS, UNFINISHED, hermite
+
+# Destino de las trayectorias con condiciones iniciales no válidas (NaN)
+INVALID = 3
+
+# Tipo de evento además de los ápsides: z pasa de negativo a positivo
+ASCENDING_NODE = 2
+
+# Se da por caída al llegar a r_+ + HORIZON_MARGIN * M (en t, llegar a r_+ lleva un tiempo infinito)
+HORIZON_MARGIN = 0.05
+
+# Deriva relativa de F y de Q por encima de la cual una trayectoria no es confiable
+DRIFT_TOLERANCE = 1e-5
+
+# Newton para (E, L, Q) de las órbitas ligadas
+CONSTANTS_TOLERANCE = 1e-12
+CONSTANTS_MAX_ITERATIONS = 50
+
+
+def horizon_radius(a, M):
+    """Horizonte exterior r_+ = M + sqrt(M² - a²)"""
+    if abs(a) > M:
+        raise ValueError(f"horizon_radius: |a| = {abs(a)} > M = {M} no tiene horizonte")
+    return M + np.sqrt(M**2 - a**2)
+
+
+def isco_radius(a, M):
+    """Radio de la órbita circular estable más interna en el ecuador (a < 0: retrógrada)"""
+    chi = np.asarray(a, dtype=float) / M
+    z1 = 1 + np.cbrt(1 - chi**2) * (np.cbrt(1 + chi) + np.cbrt(1 - chi))
+    z2 = np.sqrt(3 * chi**2 + z1**2)
+    return M * (3 + z2 - np.sign(chi) * np.sqrt((3 - z1) * (3 + z1 + 2 * z2)))
+
+
+def to_cartesian(r, theta, phi, a):
+    """Coordenadas cartesianas de Boyer-Lindquist (..., 3)"""
+    rho = np.sqrt(r**2 + a**2) * np.sin(theta)
+    return np.stack([rho * np.cos(phi), rho * np.sin(phi), r * np.cos(theta)], axis=-1)
+
+
+def radial_potential(r, E, L, Q, a, M, mu=1.0):
+    """R(r) = P² - Δ (μ² r² + (L - aE)² + Q), con (dr/dλ)² = R"""
+    delta = r**2 - 2 * M * r + a**2
+    P = E * (r**2 + a**2) - a * L
+    return P**2 - delta * (mu**2 * r**2 + (L - a * E) ** 2 + Q)
+
+
+def radial_potential_derivative(r, E, L, Q, a, M, mu=1.0):
+    """dR/dr"""
+    delta = r**2 - 2 * M * r + a**2
+    P = E * (r**2 + a**2) - a * L
+    return 4 * r * E * P - 2 * (r - M) * (mu**2 * r**2 + (L - a * E) ** 2 + Q) - 2 * delta * mu**2 * r
+
+
+def carter_constant(theta, p_theta, E, L, a, mu=1.0):
+    """Q = p_θ² + cos² θ (a² (μ² - E²) + L² / sin² θ)"""
+    cos, sin = np.cos(theta), np.sin(theta)
+    return p_theta**2 + cos**2 * (a**2 * (mu**2 - E**2) + L**2 / sin**2)
+
+
+def mass_shell(state, E, L, a, M, mu=1.0):
+    """2F / Σ = g^μν p_μ p_ν + μ²: cero sobre la geodésica"""
+    r, theta, _, p_r, p_theta = state.T
+    sin = np.sin(theta)
+    delta = r**2 - 2 * M * r + a**2
+    P = E * (r**2 + a**2) - a * L
+    sigma = r**2 + a**2 * np.cos(theta) ** 2
+    f = L / sin - a * E * sin
+    return (delta * p_r**2 + p_theta**2 - P**2 / delta + f**2 + mu**2 * sigma) / sigma
+
+
+def zamo_initial_conditions(r, theta, velocity, a, M, phi=0.0, mu=1.0):
+    """
+    (estado (N, 5), E, L) de partículas lanzadas desde (r, θ, φ) con
+    velocidad (N, 3) = (v_r, v_θ, v_φ) medida por el observador de momento
+    angular nulo (ZAMO) del lugar. Con μ = 0 la velocidad es solo la
+    dirección del fotón. Con velocidad cero la partícula cae sin momento
+    angular (L = 0) y el arrastre de marcos igual la hace girar en φ.
+    """
+    velocity = np.atleast_2d(np.asarray(velocity, dtype=float))
+    r, theta, phi = (np.asarray(x, dtype=float) for x in np.broadcast_arrays(r, theta, phi))
+    r, theta, phi = (np.broadcast_to(x, (len(velocity),)) if x.ndim == 0 else x for x in (r, theta, phi))
+    sin2 = np.sin(theta) ** 2
+    delta = r**2 - 2 * M * r + a**2
+    if np.any(delta <= 0):
+        raise ValueError("zamo_initial_conditions: hay puntos de lanzamiento dentro del horizonte")
+    sigma = r**2 + a**2 * np.cos(theta) ** 2
+    big_a = (r**2 + a**2) ** 2 - a**2 * delta * sin2
+    lapse = np.sqrt(sigma * delta / big_a)
+    omega = 2 * M * a * r / big_a
+    cylindrical = np.sqrt(big_a / sigma * sin2)
+
+    speed = np.linalg.norm(velocity, axis=1)
+    if mu == 0:
+        energy, momentum = np.ones_like(speed), velocity / speed[:, None]
+    else:
+        if np.any(speed >= 1):
+            raise ValueError("zamo_initial_conditions: una partícula con masa necesita |v| < 1")
+        energy = mu / np.sqrt(1 - speed**2)
+        momentum = energy[:, None] * velocity
+
+    L = cylindrical * momentum[:, 2]
+    E = lapse * energy + omega * L
+    state = np.stack([
+        r, theta, phi,
+        np.sqrt(sigma / delta) * momentum[:, 0],
+        np.sqrt(sigma) * momentum[:, 1],
+    ], axis=1)
+    return state, E, L
+
+
+def bound_orbit_constants(p, e, inclination, a, M):
+    """
+    (E, L, Q, válida) de órbitas ligadas con periapsis p / (1 + e), apoapsis
+    p / (1 - e) e inclinación ι (cos ι = L / sqrt(L² + Q); ι > 90°:
+    retrógradas). Se resuelve R(r_p) = 0, R(r_a) = 0 (R'(r_0) = 0 si e = 0)
+    con Newton en lote, partiendo de la órbita de Schwarzschild.
+
+    Válida: Newton convergió y la órbita es ligada y estable (R < 0 justo
+    afuera de [r_p, r_a]); si no, E, L, Q son NaN.
+    """
+    p, e, inclination = (np.atleast_1d(np.asarray(x, dtype=float)) for x in np.broadcast_arrays(p, e, inclination))
+    r_p, r_a = p / (1 + e), p / (1 - e)
+    cos_i = np.cos(inclination)
+
+    def residual(x):
+        E, L, Q = x[..., 0], x[..., 1], x[..., 2]
+        gap = r_a - r_p
+        circular = gap <= 1e-6 * r_p
+        with np.errstate(divide="ignore", invalid="ignore"):
+            divided = (radial_potential(r_a, E, L, Q, a, M) - radial_potential(r_p, E, L, Q, a, M)) / gap
+        return np.stack([
+            radial_potential(r_p, E, L, Q, a, M),
+            np.where(circular, radial_potential_derivative(r_p, E, L, Q, a, M), divided),
+            L - cos_i * np.sqrt(np.maximum(L**2 + Q, 0)),
+        ], axis=-1)
+
+    # Punto de partida: E y L totales de Schwarzschild (semilatus rectum acotado a la separatriz)
+    p_guess = np.maximum(p, (6 + 2 * e) * M + 0.5 * M)
+    with np.errstate(invalid="ignore"):
+        total = np.sqrt(M * p_guess**2 / (p_guess - (3 + e**2) * M))
+        energy = np.sqrt(((p_guess - 2 * M) ** 2 - 4 * M**2 * e**2) / (p_guess * (p_guess - (3 + e**2) * M)))
+    x = np.stack([energy, total * cos_i, (total * np.sin(inclination)) ** 2], axis=-1)
+
+    converged = np.zeros(len(p), dtype=bool)
+    for _ in range(CONSTANTS_MAX_ITERATIONS):
+        f = residual(x)
+        # Jacobiano por diferencias hacia adelante, en lote
+        jacobian = np.empty(f.shape + (3,))
+        for j in range(3):
+            step = 1e-7 * np.maximum(np.abs(x[:, j]), 1.0)
+            shifted = x.copy()
+            shifted[:, j] += step
+            jacobian[:, :, j] = (residual(shifted) - f) / step[:, None]
+        with np.errstate(invalid="ignore"):
+            solvable = np.isfinite(jacobian).all(axis=(1, 2)) & (np.abs(np.linalg.det(np.nan_to_num(jacobian))) > 1e-300)
+        delta = np.zeros_like(x)
+        if solvable.any():
+            delta[solvable] = np.linalg.solve(jacobian[solvable], -f[solvable][:, :, None])[:, :, 0]
+        x = x + delta
+        x[:, 2] = np.maximum(x[:, 2], 0)
+        converged = solvable & (np.max(np.abs(delta) / np.maximum(np.abs(x), 1.0), axis=1) < CONSTANTS_TOLERANCE)
+        if converged.all():
+            break
+    converged |= np.max(np.abs(residual(x)), axis=1) < 1e-9 * np.maximum(r_p, 1) ** 4
+
+    E, L, Q = x[:, 0], x[:, 1], x[:, 2]
+    margin = 1e-3 * r_p
+    with np.errstate(invalid="ignore"):
+        valid = (
+            converged & np.isfinite(x).all(axis=1) & (E < 1) & (r_p > horizon_radius(a, M))
+            & (radial_potential(r_p - margin, E, L, Q, a, M) < 0)
+            & (radial_potential(r_a + margin, E, L, Q, a, M) < 0)
+        )
+    E, L, Q = (np.where(valid, value, np.nan) for value in (E, L, Q))
+    return E, L, Q, valid
+
+
+def bound_orbit_initial_conditions(p, e, inclination, a, M, phi=0.0):
+    """
+    (estado (N, 5), E, L) de órbitas ligadas que empiezan en el periapsis, en
+    el ecuador y bajando hacia θ > π/2. Las que no son ligadas y estables
+    quedan en NaN (ver ``bound_orbit_constants``).
+    """
+    E, L, Q, _ = bound_orbit_constants(p, e, inclination, a, M)
+    p, e, phi = (np.broadcast_to(np.asarray(x, dtype=float), E.shape) for x in (p, e, phi))
+    state = np.stack([p / (1 + e), np.full_like(E, np.pi / 2), phi, np.zeros_like(E), np.sqrt(Q)], axis=1)
+    state[np.isnan(E)] = np.nan
+    return state, E, L
+
+
+def kerr_derivatives(y, E, L, a, M, mu):
+    """d(r, θ, φ, p_r, p_θ)/dt y dt/dλ para estados (N, 5)"""
+    r, theta, p_r, p_theta = y[:, 0], y[:, 1], y[:, 3], y[:, 4]
+    sin, cos = np.sin(theta), np.cos(theta)
+    delta = r * r - 2 * M * r + a * a
+    P = E * (r * r + a * a) - a * L
+    f = L / sin - a * E * sin
+    dt = (r * r + a * a) * P / delta + a * sin * f
+    derivatives = np.stack([
+        delta * p_r,
+        p_theta,
+        a * P / delta + f / sin,
+        (2 * r * E * P * delta - P * P * (r - M)) / delta**2 - (r - M) * p_r**2 - mu**2 * r,
+        f * (L / sin**2 + a * E) * cos + mu**2 * a * a * cos * sin,
+    ], axis=1)
+    return derivatives / dt[:, None]
+
+
+class KerrSolution:
+    """
+    Resultado de ``integrate_kerr_geodesics``.
+
+    t: grilla (S,) de tiempo coordenado; coords: (N, S, 3) con (r, θ, φ) y
+    NaN después del final; fate: destino de cada trayectoria; end_t,
+    end_coords: dónde terminó; events: ápsides y nodos como arreglos planos
+    (trajectory, t, r, theta, phi, kind); constraint_drift, carter_drift:
+    deriva máxima (relativa) de F = 0 y de Q en cada trayectoria.
+    """
+
+    def __init__(self, t, coords, fate, end_t, end_coords, events, E, L, Q, a, M, constraint_drift, carter_drift):
+        self.t = t
+        self.coords = coords
+        self.fate = fate
+        self.end_t = end_t
+        self.end_coords = end_coords
+        self.events = events
+        self.E = E
+        self.L = L
+        self.Q = Q
+        self.a = a
+        self.M = M
+        self.constraint_drift = constraint_drift
+        self.carter_drift = carter_drift
+
+    def __len__(self):
+        return len(self.coords)
+
+    @property
+    def positions(self):
+        """(N, S, 3) cartesianas, NaN después del final de cada trayectoria"""
+        return to_cartesian(self.coords[..., 0], self.coords[..., 1], self.coords[..., 2], self.a)
+
+    def frame(self, k):
+        """Posiciones (N, 3) de todas las trayectorias en el instante t[k]"""
+        coords = self.coords[:, k]
+        return to_cartesian(coords[:, 0], coords[:, 1], coords[:, 2], self.a)
+
+    def points(self, i):
+        """Puntos (K, 3) de la trayectoria i, terminando en el evento final"""
+        coords = self.coords[i][self.t <= self.end_t[i]]
+        coords = coords[np.isfinite(coords[:, 0])]
+        if self.fate[i] not in (COMPLETE, INVALID) and (len(coords) == 0 or self.end_t[i] > self.t[len(coords) - 1]):
+            coords = np.vstack([coords, self.end_coords[i]])
+        return to_cartesian(coords[:, 0], coords[:, 1], coords[:, 2], self.a)
+
+    def all_points(self):
+        return [self.points(i) for i in range(len(self))]
+
+    def get_events(self, i, kind=None):
+        """(t, puntos (K, 3)) de los eventos de la trayectoria i (solo de un tipo si kind)"""
+        mask = self.events["trajectory"] == i
+        if kind is not None:
+            mask &= self.events["kind"] == kind
+        ev = {key: value[mask] for key, value in self.events.items()}
+        return ev["t"], to_cartesian(ev["r"], ev["theta"], ev["phi"], self.a)
+
+    def node_longitudes(self, i):
+        """φ (sin reducir a [0, 2π)) de los nodos ascendentes sucesivos de la trayectoria i"""
+        mask = (self.events["trajectory"] == i) & (self.events["kind"] == ASCENDING_NODE)
+        return self.events["phi"][mask]
+
+    def reliable(self, tolerance=DRIFT_TOLERANCE):
+        """Trayectorias completas cuya deriva de F y de Q quedó bajo la tolerancia"""
+        return (self.fate != INVALID) & (self.fate != UNFINISHED) & (self.constraint_drift <= tolerance) & (self.carter_drift <= tolerance)
+
+
+def integrate_kerr_geodesics(
+    state, E, L, a, M, t_max, num_samples=1000, mu=1.0, r_max=None,
+    rtol=1e-9, atol=1e-11, max_step=None, max_iterations=200000,
+):
+    """
+    Integra en lote las geodésicas de Kerr desde t = 0 hasta t_max.
+
+    state: (N, 5) con (r, θ, φ, p_r, p_θ); E, L: (N,) (ver
+    ``bound_orbit_initial_conditions`` y ``zamo_initial_conditions``).
+    r_max: radio de escape (por defecto, sin escape). max_step: paso máximo
+    en t (por defecto t_max / 500, para no saltarse ápsides ni nodos).
+    """
+    state = np.atleast_2d(np.asarray(state, dtype=float))
+    n = len(state)
+    E, L = (np.broadcast_to(np.asarray(x, dtype=float), (n,)).copy() for x in (E, L))
+    grid = np.linspace(0, t_max, num_samples)
+    max_step = t_max / 500 if max_step is None else max_step
+    r_horizon = horizon_radius(a, M) + HORIZON_MARGIN * M
+    r_escape = np.inf if r_max is None else r_max
+
+    valid = np.isfinite(state).all(axis=1) & np.isfinite(E) & np.isfinite(L)
+    y = np.where(valid[:, None], state, 0.0)
+    y[~valid, 0] = 2 * r_horizon
+    y[~valid, 1] = np.pi / 2
+    E[~valid], L[~valid] = 0.0, 0.0
+
+    def deriv(y, E, L):
+        return kerr_derivatives(y, E, L, a, M, mu)
+
+    t = np.zeros(n)
+    h = np.full(n, min(max_step, 1e-2 * t_max))
+    k_first = deriv(y, E, L)
+    coords = np.full((n, num_samples, 3), np.nan)
+    coords[:, 0] = y[:, :3]
+
+    Q = carter_constant(y[:, 1], y[:, 4], E, L, a, mu)
+    carter_scale = np.abs(Q) + L**2 + M**2
+    constraint_drift = np.abs(mass_shell(y, E, L, a, M, mu))
+    carter_drift = np.zeros(n)
+
+    fate = np.full(n, COMPLETE)
+    end_t = np.full(n, float(t_max))
+    end_coords = np.full((n, 3), np.nan)
+    events = {"trajectory": [], "t": [], "r": [], "theta": [], "phi": [], "kind": []}
+
+    def record(rows, old_t, step, old_y, new_y, old_d, new_d, theta, kind):
+        values = hermite(old_y[:, :3], new_y[:, :3], old_d[:, :3], new_d[:, :3], step[:, None], theta[:, None])
+        events["trajectory"].append(rows)
+        events["t"].append(old_t + theta * step)
+        events["r"].append(values[:, 0])
+        events["theta"].append(values[:, 1])
+        events["phi"].append(values[:, 2])
+        events["kind"].append(kind)
+
+    # Los que no son válidos o empiezan fuera del dominio terminan de inmediato
+    active = valid & (y[:, 0] > r_horizon) & (y[:, 0] < r_escape)
+    fate[~valid] = INVALID
+    fate[valid & (y[:, 0] <= r_horizon)] = HORIZON
+    fate[valid & (y[:, 0] >= r_escape)] = ESCAPE
+    end_t[~active] = 0.0
+    end_coords[~active] = y[~active, :3]
+    coords[~valid, 0] = np.nan
+    constraint_drift[~valid] = np.nan
+    carter_drift[~valid] = np.nan
+
+    for _ in range(max_iterations):
+        idx = np.flatnonzero(active)
+        if len(idx) == 0:
+            break
+        yi, Ei, Li = y[idx], E[idx], L[idx]
+        hi = np.minimum(h[idx], t_max - t[idx])
+
+        # Etapas de Dormand-Prince (la primera se reutiliza del paso anterior)
+        stages = [k_first[idx]]
+        for c_row in DP_A[1:]:
+            increment = sum(c * k for c, k in zip(c_row, stages))
+            stages.append(deriv(yi + hi[:, None] * increment, Ei, Li))
+        y_new = yi + hi[:, None] * sum(b * k for b, k in zip(DP_B, stages))
+        error = hi[:, None] * sum(c * k for c, k in zip(DP_E, stages))
+        scale = atol + rtol * np.maximum(np.abs(yi), np.abs(y_new))
+        with np.errstate(invalid="ignore"):
+            error_norm = np.nan_to_num(np.max(np.abs(error) / scale, axis=1), nan=np.inf)
+
+        accepted = error_norm <= 1
+        with np.errstate(divide="ignore"):
+            factor = np.clip(0.9 * error_norm ** -0.2, 0.2, 5.0)
+        h[idx] = np.minimum(hi * factor, max_step)
+
+        acc = idx[accepted]
+        if len(acc) == 0:
+            continue
+        step = hi[accepted]
+        old_t, new_t = t[acc], t[acc] + step
+        old_y, new_y = yi[accepted], y_new[accepted]
+        old_d, new_d = stages[0][accepted], stages[6][accepted]
+
+        # Muestras de la grilla que caen dentro del paso (old_t, new_t]
+        first = np.searchsorted(grid, old_t, side="right")
+        last = np.searchsorted(grid, new_t, side="right")
+        counts = last - first
+        if counts.sum():
+            rows = np.repeat(np.arange(len(acc)), counts)
+            cols = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts) + np.repeat(first, counts)
+            theta = ((grid[cols] - old_t[rows]) / step[rows])[:, None]
+            coords[acc[rows], cols] = hermite(
+                old_y[rows, :3], new_y[rows, :3], old_d[rows, :3], new_d[rows, :3], step[rows, None], theta
+            )
+
+        # Ápsides (p_r cambia de signo) y nodos ascendentes (cos θ pasa a positivo)
+        old_p, new_p = old_y[:, 3], new_y[:, 3]
+        turning = ((old_p > 0) & (new_p <= 0)) | ((old_p < 0) & (new_p >= 0))
+        if turning.any():
+            k = np.flatnonzero(turning)
+            record(
+                acc[k], old_t[k], step[k], old_y[k], new_y[k], old_d[k], new_d[k],
+                old_p[k] / (old_p[k] - new_p[k]), np.where(old_p[k] > 0, APOAPSIS, PERIAPSIS),
+            )
+        old_z, new_z = np.cos(old_y[:, 1]), np.cos(new_y[:, 1])
+        ascending = (old_z < 0) & (new_z >= 0)
+        if ascending.any():
+            k = np.flatnonzero(ascending)
+            record(
+                acc[k], old_t[k], step[k], old_y[k], new_y[k], old_d[k], new_d[k],
+                old_z[k] / (old_z[k] - new_z[k]), np.full(len(k), ASCENDING_NODE),
+            )
+
+        t[acc] = new_t
+        y[acc] = new_y
+        k_first[acc] = new_d
+
+        # Cantidades conservadas: deriva máxima de la ligadura y de Carter
+        np.fmax.at(constraint_drift, acc, np.abs(mass_shell(new_y, E[acc], L[acc], a, M, mu)))
+        carter = carter_constant(new_y[:, 1], new_y[:, 4], E[acc], L[acc], a, mu)
+        np.fmax.at(carter_drift, acc, np.abs(carter - Q[acc]) / carter_scale[acc])
+
+        # Eventos terminales: horizonte y escape (cruce por interpolación lineal)
+        old_r, new_r = old_y[:, 0], new_y[:, 0]
+        for crossed, target, code in (
+            (new_r <= r_horizon, r_horizon, HORIZON),
+            (new_r >= r_escape, r_escape, ESCAPE),
+        ):
+            if crossed.any():
+                k = np.flatnonzero(crossed)
+                theta = (target - old_r[k]) / (new_r[k] - old_r[k])
+                fate[acc[k]] = code
+                end_t[acc[k]] = old_t[k] + theta * step[k]
+                end_coords[acc[k]] = old_y[k, :3] + theta[:, None] * (new_y[k, :3] - old_y[k, :3])
+                active[acc[k]] = False
+        active[acc[new_t >= t_max]] = False
+
+    # Sin iteraciones para llegar a t_max: terminan donde quedaron
+    fate[active] = UNFINISHED
+    end_t[active] = t[active]
+
+    # Nada después del final de cada trayectoria
+    coords[grid[None, :] > end_t[:, None]] = np.nan
+    finished = (fate == COMPLETE) | (fate == UNFINISHED)
+    end_coords[finished] = y[finished, :3]
+
+    if events["trajectory"]:
+        events = {key: np.concatenate(value) for key, value in events.items()}
+        keep = events["t"] <= end_t[events["trajectory"]]
+        order = np.lexsort((events["t"], events["trajectory"]))
+        events = {key: value[order[keep[order]]] for key, value in events.items()}
+    else:
+        events = {key: np.zeros(0) for key in ("t", "r", "theta", "phi")}
+        events["trajectory"] = np.zeros(0, dtype=int)
+        events["kind"] = np.zeros(0, dtype=int)
+    Q[~valid] = np.nan
+    E[~valid], L[~valid] = np.nan, np.nan
+    return KerrSolution(
+        grid, coords, fate, end_t, end_coords, events, E, L, Q, a, M, constraint_drift, carter_drift,
+    )
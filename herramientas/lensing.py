@@ -0,0 +1,220 @@
+"""
+Lente gravitacional de Schwarzschild sobre una imagen de fondo.
+
+Integrar un rayo por píxel en cada frame es imposible a 30 fps en 1080p,
+pero en Schwarzschild el ángulo de deflexión solo depende del parámetro de
+impacto b, y con la cámara apuntando al agujero negro b solo depende de la
+distancia ρ del píxel al centro de la lente. Entonces:
+
+  1. ``deflection_table``: tabla α(b / M) calculada una sola vez integrando
+     en lote (``integrate_geodesics``) fotones que vienen del infinito, y
+     guardada en la caché de arreglos (``array_cache``). Para b grande se
+     usa el desarrollo de campo débil α ≈ 4M/b + 15πM²/4b².
+  2. ``LensingRenderer``: con la geometría (distancias, campo de visión,
+     resolución) convierte la tabla en un campo fijo de desplazamientos
+     enteros (píxel relativo al centro de la lente → píxel de la textura), de
+     dos veces el tamaño de la imagen para que la lente pueda estar en
+     cualquier punto de la pantalla.
+  3. En cada frame: recortar el campo según la posición de la lente, sumar el
+     desplazamiento del fondo y leer la textura (índices con reflejo en los
+     bordes). Son unas pocas operaciones de NumPy sobre búferes reservados de
+     antemano, sin integrar nada: mover el agujero negro o la cámara
+     (desplazar el fondo) es solo cambiar dos enteros.
+
+La geometría es la de lente delgada: el observador está a
+``observer_distance`` del agujero negro y el plano de la imagen de fondo a
+``source_distance`` detrás de él (``np.inf`` para un fondo en el infinito).
+Los rayos con b < 3√3 M caen al horizonte (sombra) y los que salen hacia
+atrás (deflexión de más de 90° respecto del fondo) se dibujan negros.
+
+Uso:
+
+    lens = LensingRenderer("cumulojoyero2.jpg", (1080, 1920))
+    frame = lens.render((540, 960), offset=(0, 0))   # (H, W, 4) uint8
+"""
+
+import numpy as np
+from PIL import Image
+
+from .array_cache import cached_array
+from .geodesics import ESCAPE, integrate_geodesics, null_initial_conditions
+
+# Parámetro de impacto crítico (captura) en unidades de M
+CRITICAL_IMPACT = 3 * np.sqrt(3)
+
+# Muestras de la tabla: b = b_c (1 + ε), ε en escala logarítmica
+TABLE_SAMPLES = 2048
+TABLE_EPSILON = (1e-6, 1e3)
+
+# Paso (en píxeles) de la tabla radial ρ → ρ de la textura
+RADIAL_STEP = 0.25
+
+
+@cached_array
+def deflection_table(num_samples=TABLE_SAMPLES, epsilon_range=TABLE_EPSILON):
+    """
+    Tabla (log ε, α) de la deflexión α(b) con M = 1 y b = b_c (1 + ε).
+    Se calcula una vez y queda en la caché de arreglos (``.manim_cache/arrays``).
+    """
+    epsilon = np.geomspace(*epsilon_range, num_samples)
+    b = CRITICAL_IMPACT * (1 + epsilon)
+    # Fotones desde (casi) el infinito: u0 ≈ 0, escapan al volver a u = 0
+    u0, w0, A = null_initial_conditions(b, 1e9 * b, 1.0)
+    solution = integrate_geodesics(u0, w0, A, 1.0, phi_max=12 * np.pi, num_samples=2, rtol=1e-10, atol=1e-12)
+    if np.any(solution.fate != ESCAPE):
+        # Los que no terminaron (UNFINISHED) tampoco sirven: su end_phi no es el de salida
+        raise RuntimeError("deflection_table: hay fotones de la tabla que no escaparon")
+    return np.stack([np.log(epsilon), solution.end_phi - np.pi])
+
+
+def deflection_angle(b, table=None):
+    """α(b) con M = 1 (NaN si b ≤ b_c: el fotón cae al horizonte)"""
+    table = deflection_table() if table is None else table
+    b = np.asarray(b, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_epsilon = np.log(b / CRITICAL_IMPACT - 1)
+        weak = 4 / b + 15 * np.pi / (4 * b**2)
+    alpha = np.interp(log_epsilon, table[0], table[1])
+    alpha = np.where(log_epsilon > table[0, -1], weak, alpha)
+    return np.where(b > CRITICAL_IMPACT, alpha, np.nan)
+
+
+def load_texture(image, size):
+    """
+    Textura RGBA empaquetada en uint32 (th, tw) que cubre ``size`` = (H, W)
+    conservando la proporción de la imagen.
+    """
+    if not isinstance(image, Image.Image):
+        image = Image.open(image)
+    height, width = size
+    scale = max(height / image.height, width / image.width)
+    new_size = (max(width, round(image.width * scale)), max(height, round(image.height * scale)))
+    image = image.convert("RGBA").resize(new_size, Image.LANCZOS)
+    return np.ascontiguousarray(np.asarray(image, dtype=np.uint8)).view(np.uint32)[..., 0]
+
+
+def mirror_table(length, scale=1):
+    """Índice reflejado (período 2 * length) de cada resto, multiplicado por scale"""
+    m = np.arange(2 * length)
+    return (np.where(m < length, m, 2 * length - 1 - m) * scale).astype(np.int32)
+
+
+class LensingRenderer:
+    """
+    Imágenes con lente gravitacional de una textura de fondo.
+
+    image: ruta o imagen PIL; size: (H, W) en píxeles; M: masa (en las mismas
+    unidades que las distancias); fov: campo de visión horizontal.
+    """
+
+    def __init__(
+        self, image, size, M=1.0, observer_distance=100.0, source_distance=100.0,
+        fov=30 * np.pi / 180, table=None,
+    ):
+        self.size = height, width = size
+        self.M = M
+        self.observer_distance = observer_distance
+        self.source_distance = source_distance
+        self.fov = fov
+        self.table = deflection_table() if table is None else table
+
+        self.texture = load_texture(image, size)
+        texture_height, texture_width = self.texture.shape
+        self._texture_flat = self.texture.ravel()
+        self._rows = mirror_table(texture_height, texture_width)
+        self._cols = mirror_table(texture_width)
+
+        self._build_field()
+
+        # Búferes de trabajo: nada se reserva en render()
+        self._index_y = np.empty(size, dtype=np.int32)
+        self._index_x = np.empty(size, dtype=np.int32)
+        self._flat = np.empty(size, dtype=np.int32)
+        self._frame = np.empty(size, dtype=np.uint32)
+
+    # -----------------------------------------------------------------
+    # Geometría (una vez)
+    # -----------------------------------------------------------------
+    def radial_map(self, rho):
+        """
+        ρ (píxeles desde el centro de la lente) → ρ de la textura sin lente.
+        NaN donde el rayo cae al horizonte o no llega al plano del fondo.
+        """
+        width = self.size[1]
+        focal = (width / 2) / np.tan(self.fov / 2)
+        D_o, D_ls = self.observer_distance, self.source_distance
+        theta = np.arctan(rho / focal)
+        # Observador estático a distancia finita: sen θ = (b / r) √(1 - 2M/r)
+        b = D_o * np.sin(theta) / np.sqrt(1 - 2 * self.M / D_o)
+        alpha = deflection_angle(b / self.M, self.table)
+        psi = theta - alpha
+        reaches = np.cos(psi) > 0
+        with np.errstate(invalid="ignore"):
+            if np.isinf(D_ls):
+                source = focal * np.tan(psi)
+            else:
+                # Pasa el plano de la lente a altura D_o tan θ y sigue con ángulo ψ
+                source = focal * (D_o * np.tan(theta) + D_ls * np.tan(psi)) / (D_o + D_ls)
+        return np.where(reaches, source, np.nan)
+
+    def _build_field(self):
+        """Campo (2H - 1, 2W - 1) de posiciones en la textura relativas al centro de la lente"""
+        height, width = self.size
+        rho_max = np.hypot(height, width)
+        rho = np.arange(0, rho_max + 2 * RADIAL_STEP, RADIAL_STEP)
+        source = self.radial_map(rho)
+        dark = np.isnan(source)
+        # Radio dentro del cual todo es negro (sombra y rayos hacia atrás)
+        self.dark_radius = rho[np.flatnonzero(dark)[-1] + 1] if dark.any() else 0.0
+
+        dy = np.arange(-(height - 1), height, dtype=float)[:, None]
+        dx = np.arange(-(width - 1), width, dtype=float)[None, :]
+        radius = np.hypot(dy, dx)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            gain = np.interp(radius, rho, np.where(dark, 0.0, source)) / radius
+        gain[height - 1, width - 1] = 0.0
+        # Lejos del anillo los desplazamientos son enormes: se acotan a un tamaño de pantalla
+        self._field_y = np.clip(np.rint(dy * gain), -height, height).astype(np.int32)
+        self._field_x = np.clip(np.rint(dx * gain), -width, width).astype(np.int32)
+
+        # Máscara de la zona oscura, en un recorte cuadrado alrededor del centro
+        half = int(np.ceil(self.dark_radius))
+        cy, cx = height - 1, width - 1
+        box = radius[max(cy - half, 0):cy + half + 1, max(cx - half, 0):cx + half + 1]
+        self._dark_half = half
+        self._dark_mask = box <= self.dark_radius
+
+    # -----------------------------------------------------------------
+    # Por frame
+    # -----------------------------------------------------------------
+    def render(self, center, offset=(0, 0), out=None):
+        """
+        Imagen (H, W, 4) uint8 con la lente centrada en el píxel ``center`` =
+        (fila, columna), dentro de la imagen, y el fondo desplazado ``offset``
+        píxeles (cámara que se mueve respecto del fondo).
+        """
+        height, width = self.size
+        cy, cx = (int(round(c)) for c in center)
+        if not (0 <= cy < height and 0 <= cx < width):
+            raise ValueError(f"LensingRenderer: el centro {center} está fuera de la imagen {self.size}")
+        oy, ox = (int(round(o)) for o in offset)
+        y0, x0 = height - 1 - cy, width - 1 - cx
+        field_y = self._field_y[y0:y0 + height, x0:x0 + width]
+        field_x = self._field_x[y0:y0 + height, x0:x0 + width]
+
+        # Posición en la textura = centro + desplazamiento del fondo + campo; las
+        # tablas de reflejo tienen el período de la textura reflejada ("wrap")
+        np.add(field_y, cy + oy, out=self._index_y)
+        np.add(field_x, cx + ox, out=self._index_x)
+        np.take(self._rows, self._index_y, out=self._flat, mode="wrap")
+        self._flat += np.take(self._cols, self._index_x, out=self._index_x, mode="wrap")
+        frame = self._frame if out is None else out.view(np.uint32).reshape(self.size)
+        np.take(self._texture_flat, self._flat, out=frame, mode="clip")
+
+        half = self._dark_half
+        if half:
+            top, left = max(cy - half, 0), max(cx - half, 0)
+            region = frame[top:cy + half + 1, left:cx + half + 1]
+            mask = self._dark_mask[top - (cy - half):, left - (cx - half):][:region.shape[0], :region.shape[1]]
+            region[mask] = np.array([0, 0, 0, 255], dtype=np.uint8).view(np.uint32)[0]
+        return frame.view(np.uint8).reshape(height, width, 4)
@@ -0,0 +1,147 @@
+from manim import *
+import numpy as np
+
+# Caracteres que puede mostrar una lectura numérica
+GLYPH_CHARS = "0123456789.-"
+
+# Caché de glifos compartida por todas las etiquetas (se llena una sola vez)
+_GLYPH_CACHE = {}
+
+
+def get_digit_glyphs():
+    """
+    Devuelve los glifos de GLYPH_CHARS compilados una sola vez con LaTeX.
+    Cada glifo se guarda como arreglo de puntos a DEFAULT_FONT_SIZE, relativo
+    a su borde izquierdo y a la línea base (la base del "0").
+    """
+    if "glyphs" in _GLYPH_CACHE:
+        return _GLYPH_CACHE
+
+    tex = MathTex(GLYPH_CHARS, font_size=DEFAULT_FONT_SIZE)
+    parts = sorted(tex.family_members_with_points(), key=lambda m: m.get_left()[0])
+    if len(parts) != len(GLYPH_CHARS):
+        raise ValueError(
+            f"Se esperaban {len(GLYPH_CHARS)} glifos y LaTeX produjo {len(parts)}"
+        )
+
+    baseline = parts[0].get_bottom()[1]
+    glyphs = {}
+    widths = {}
+    for char, part in zip(GLYPH_CHARS, parts):
+        origin = np.array([part.get_left()[0], baseline, 0.0])
+        glyphs[char] = part.points - origin
+        widths[char] = part.width
+
+    # En TeX todos los dígitos tienen el mismo avance; lo medimos entre "0" y "9"
+    digit_advance = (parts[9].get_left()[0] - parts[0].get_left()[0]) / 9
+    mean_digit_width = np.mean([widths[c] for c in "0123456789"])
+
+    _GLYPH_CACHE["glyphs"] = glyphs
+    _GLYPH_CACHE["widths"] = widths
+    _GLYPH_CACHE["digit_advance"] = digit_advance
+    _GLYPH_CACHE["gap"] = digit_advance - mean_digit_width
+    return _GLYPH_CACHE
+
+
+class LiveNumberLabel(VGroup):
+    """
+    Lectura numérica en vivo del tipo "prefijo + valor (+ sufijo)".
+
+    El prefijo y el sufijo se compilan con LaTeX una sola vez; el valor se
+    arma en cada frame copiando puntos de glifos cacheados a un número fijo
+    de ranuras, sin crear mobjects ni llamar a LaTeX. Los dígitos usan ancho
+    fijo para que la lectura no "tiemble" al cambiar el valor.
+
+    value puede ser un ValueTracker o cualquier función sin argumentos.
+    """
+
+    def __init__(
+        self,
+        prefix,
+        value,
+        num_decimal_places=2,
+        suffix=None,
+        max_chars=8,
+        font_size=DEFAULT_FONT_SIZE,
+        color=WHITE,
+        **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.get_number = value.get_value if hasattr(value, "get_value") else value
+        self.num_decimal_places = num_decimal_places
+        self.max_chars = max_chars
+
+        # Compilar prefijo, un "0" de referencia y el sufijo en una sola fórmula:
+        # así el espaciado entre ellos es el que produce TeX
+        strings = [prefix, "0"] + ([suffix] if suffix else [])
+        reference = MathTex(*strings, font_size=font_size, color=color)
+        self.prefix = reference[0]
+        digit_ref = reference[1]
+
+        prefix_corner = self.prefix.get_corner(DL)
+        self._ref_prefix_width = self.prefix.width
+        self._digit_origin = np.array(
+            [digit_ref.get_left()[0], digit_ref.get_bottom()[1], 0.0]
+        ) - prefix_corner
+        self._glyph_scale = font_size / DEFAULT_FONT_SIZE
+
+        self.digits = VGroup(*[
+            VMobject(fill_color=color, fill_opacity=1, stroke_width=0)
+            for _ in range(max_chars)
+        ])
+        self.add(self.prefix, self.digits)
+
+        self.suffix = None
+        if suffix:
+            self.suffix = reference[2]
+            self._suffix_gap = self.suffix.get_left()[0] - digit_ref.get_right()[0]
+            self._suffix_dy = self.suffix.get_bottom()[1] - digit_ref.get_bottom()[1]
+            self.add(self.suffix)
+
+        self._shown_key = None
+        self.update_number()
+        self.add_updater(lambda m: m.update_number())
+
+    def format_value(self, number):
+        return f"{number:.{self.num_decimal_places}f}"
+
+    def update_number(self):
+        """Reescribe las ranuras de dígitos solo si el texto o la posición cambian"""
+        text = self.format_value(self.get_number())
+        if len(text) > self.max_chars:
+            raise ValueError(
+                f"'{text}' excede max_chars={self.max_chars} de LiveNumberLabel"
+            )
+
+        # Escala y origen actuales, derivados del prefijo (sigue a scale/shift)
+        scale = self.prefix.width / self._ref_prefix_width
+        origin = self.prefix.get_corner(DL) + self._digit_origin * scale
+        key = (text, scale, origin[0], origin[1], origin[2])
+        if key == self._shown_key:
+            return self
+        self._shown_key = key
+
+        cache = get_digit_glyphs()
+        s = scale * self._glyph_scale
+        advance = cache["digit_advance"] * s
+        gap = cache["gap"] * s
+
+        x = 0.0
+        for slot, char in zip(self.digits, text):
+            width = cache["widths"][char] * s
+            if char.isdigit():
+                left = x + (advance - width) / 2
+                x += advance
+            else:
+                left = x + gap / 2
+                x += width + gap
+            slot.set_points(cache["glyphs"][char] * s + origin + [left, 0.0, 0.0])
+        for slot in self.digits[len(text):]:
+            slot.clear_points()
+
+        if self.suffix is not None:
+            self.suffix.move_to(
+                origin + [x + self._suffix_gap * scale, self._suffix_dy * scale, 0.0],
+                aligned_edge=DL,
+            )
+        return self
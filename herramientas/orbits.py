@@ -0,0 +1,363 @@
+"""
+Órbitas tipo tiempo de Schwarzschild evaluadas en lote.
+
+Las escenas de geodésicas (``Cods/time-like-geodesics4.py`` y ``5``) usan la
+solución con la integral elíptica incompleta F(ψ, k):
+
+    r = l / (1 + e cos χ),     φ = 2 [K(k) - F(π/2 - χ/2, k)] / sqrt(1 - 6μ + 2μe)
+    k² = 4μe / (1 - 6μ + 2μe),     μ = M / l
+
+La fórmula vale para las órbitas ligadas por encima de la separatriz,
+l > (6 + 2e) M (ahí 0 <= k² < 1); por debajo la partícula cae. Con K(k)
+la órbita empieza en φ = 0 en el periapsis y avanza con φ creciente, igual
+que las trayectorias de ``integrate_geodesics``.
+
+``orbit_points`` evalúa la órbita completa para todos los χ en una sola
+llamada vectorizada y escribe el resultado en un búfer (N, 3) reservado de
+antemano. Con ``EllipticTable`` la integral sale de una tabla precalculada
+de F(ψ, m) (interpolación bilineal) en lugar de ``ellipkinc``.
+
+``LiveOrbit`` es una poligonal cuyos parámetros (e, l, M) son ValueTrackers:
+recalcula la órbita entera en cada frame, así se puede barrer l o M de forma
+continua y ver cómo crece la precesión.
+
+    orbit = LiveOrbit(e_tracker, l_tracker, M_tracker, axes, table=EllipticTable())
+    self.play(l_tracker.animate.set_value(separatrix(0.5, M)))
+
+``adaptive_chi_samples`` elige los χ según el error en pantalla: refina donde
+la curva proyectada se dobla más y deja pocos puntos en los tramos casi
+rectos (cerca del afelio), hasta que la poligonal se aparta de la curva
+menos de una tolerancia en píxeles. ``orbit_samples`` junta ambos
+muestreos y guarda el resultado en la caché de arreglos en disco.
+
+``PotentialPanel`` dibuja el potencial efectivo de la órbita con el nivel de
+energía y un marcador en el r de la partícula; se arma una vez por conjunto
+de parámetros y en cada frame solo se busca la posición por índice.
+"""
+
+import numpy as np
+from manim import *
+from scipy.special import ellipk, ellipkinc
+
+from .array_cache import cached_array
+from .polyline import Polyline
+from .resolution import GeometryResolution
+
+# Tabla de F(ψ, m): muestras en ψ ∈ [0, π/2] y en m ∈ [0, TABLE_M_MAX], espaciadas
+# uniformemente en log(1 - m) (más densas cerca de la singularidad de K en m = 1)
+TABLE_PSI_SAMPLES = 256
+TABLE_M_SAMPLES = 256
+TABLE_M_MAX = 0.999
+
+# Muestreo adaptativo: error máximo en píxeles, grilla inicial (por vuelta) y
+# cantidad máxima de subdivisiones
+ADAPTIVE_TOLERANCE = 0.5
+ADAPTIVE_INITIAL_PER_REV = 8
+ADAPTIVE_MAX_DEPTH = 16
+
+
+def orbit_parameters(e, l, M):
+    """
+    (μ, 1 - 6μ + 2μe, k², válida) para arreglos de parámetros. La fórmula
+    elíptica vale por encima de la separatriz, l > (6 + 2e) M: denominador
+    positivo y k² < 1 (con k² = 4μe / denominador ambas condiciones juntas
+    equivalen a la separatriz).
+    """
+    e, l, M = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (e, l, M)))
+    mu = M / l
+    denominator = 1 - 6 * mu + 2 * mu * e
+    with np.errstate(divide="ignore", invalid="ignore"):
+        k_squared = 4 * mu * e / denominator
+    valid = (denominator > 0) & (k_squared < 1)
+    return mu, denominator, k_squared, valid
+
+
+def precession_per_revolution(e, l, M):
+    """
+    Avance del perihelio por vuelta (radianes): entre χ = 0 y χ = 2π el
+    ángulo φ cambia 4 K(k) / sqrt(1 - 6μ + 2μe). NaN donde la fórmula no vale.
+    """
+    _, denominator, k_squared, valid = orbit_parameters(e, l, M)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        shift = 4 * ellipk(np.where(valid, k_squared, 0)) / np.sqrt(np.where(valid, denominator, 1)) - 2 * np.pi
+    return np.where(valid, shift, np.nan)
+
+
+def separatrix(e, M):
+    """Semilatus rectum de la separatriz, l = (6 + 2e) M: por debajo la partícula cae"""
+    return (6 + 2 * np.asarray(e, dtype=float)) * M
+
+
+class EllipticTable:
+    """
+    F(ψ, m) = ellipkinc(ψ, m) tabulada en [0, π/2] × [0, m_max], con las
+    muestras de m espaciadas uniformemente en log(1 - m).
+
+    Para cualquier ψ se usa F(ψ + nπ, m) = 2nK(m) + F(ψ, m) y que F es impar
+    en ψ; fuera de la tabla (m > m_max, cerca de la singularidad de K) se
+    calcula con ``ellipkinc``.
+    """
+
+    def __init__(self, num_psi=TABLE_PSI_SAMPLES, num_m=TABLE_M_SAMPLES, m_max=TABLE_M_MAX):
+        self.psi = np.linspace(0, np.pi / 2, num_psi)
+        self._log_span = np.log1p(-m_max)
+        self.m = -np.expm1(np.linspace(0, self._log_span, num_m))
+        self.values = ellipkinc(self.psi[:, None], self.m[None, :])
+        self.complete = ellipk(self.m)
+
+    def __call__(self, psi, m):
+        psi, m = np.broadcast_arrays(np.asarray(psi, dtype=float), np.asarray(m, dtype=float))
+        # ψ = nπ + ψ', con |ψ'| <= π/2
+        n = np.round(psi / np.pi)
+        reduced = psi - n * np.pi
+        sign = np.sign(reduced)
+        reduced = np.abs(reduced)
+
+        # Posición fraccionaria en la grilla (interpolación bilineal)
+        i = np.clip(reduced / self.psi[-1] * (len(self.psi) - 1), 0, len(self.psi) - 1 - 1e-9)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            j = np.log1p(-np.minimum(m, 1)) / self._log_span * (len(self.m) - 1)
+        j = np.clip(np.nan_to_num(j, nan=0.0), 0, len(self.m) - 1 - 1e-9)
+        i0, j0 = i.astype(int), j.astype(int)
+        di, dj = i - i0, j - j0
+        values = self.values
+        partial = (
+            (values[i0, j0] * (1 - dj) + values[i0, j0 + 1] * dj) * (1 - di)
+            + (values[i0 + 1, j0] * (1 - dj) + values[i0 + 1, j0 + 1] * dj) * di
+        )
+        complete = self.complete[j0] * (1 - dj) + self.complete[j0 + 1] * dj
+        result = 2 * n * complete + sign * partial
+
+        outside = m > self.m[-1]
+        if np.any(outside):
+            result = np.where(outside, ellipkinc(psi, np.minimum(m, 1)), result)
+        return result
+
+
+def orbit_points(chi, e, l, M, out=None, table=None):
+    """
+    Puntos (N, 3) de la órbita en el plano para los χ dados, en una sola
+    llamada. e, l, M son escalares; si la fórmula elíptica no vale el
+    resultado es NaN. table: EllipticTable opcional en lugar de ellipkinc.
+    """
+    chi = np.asarray(chi, dtype=float)
+    out = np.empty((len(chi), 3)) if out is None else out
+    _, denominator, k_squared, valid = orbit_parameters(e, l, M)
+    if not valid:
+        out[:] = np.nan
+        return out
+    psi = np.pi / 2 - chi / 2
+    if table is None:
+        F, K = ellipkinc(psi, k_squared), ellipk(k_squared)
+    else:
+        F, K = table(psi, k_squared), table(np.pi / 2, k_squared)
+    phi = 2 * (K - F) / np.sqrt(denominator)
+    r = l / (1 + e * np.cos(chi))
+    np.multiply(r, np.cos(phi), out=out[:, 0])
+    np.multiply(r, np.sin(phi), out=out[:, 1])
+    out[:, 2] = 0
+    return out
+
+
+def adaptive_chi_samples(
+    evaluate, num_revolutions, pixels_per_unit, tolerance=ADAPTIVE_TOLERANCE,
+    initial_per_rev=ADAPTIVE_INITIAL_PER_REV, max_depth=ADAPTIVE_MAX_DEPTH,
+):
+    """
+    (χ, puntos) con la menor cantidad de muestras tal que cada segmento se
+    aparta de la curva menos de ``tolerance`` píxeles.
+
+    evaluate(chi) -> puntos (N, 3) de la curva, en las unidades de los ejes;
+    pixels_per_unit: escala de los ejes en píxeles (de axes.c2p y del ancho
+    del frame). Se parte de una grilla gruesa que incluye los ápsides
+    (χ = kπ) y en cada pasada se evalúan en lote los puntos medios de todos
+    los intervalos: se subdividen solo aquellos cuyo punto medio queda a más
+    de la tolerancia del punto medio de la cuerda.
+    """
+    chi = np.linspace(0, num_revolutions * 2 * np.pi, num_revolutions * initial_per_rev + 1)
+    points = evaluate(chi)
+    for _ in range(max_depth):
+        middle = (chi[:-1] + chi[1:]) / 2
+        middle_points = evaluate(middle)
+        error = np.linalg.norm(middle_points - (points[:-1] + points[1:]) / 2, axis=1) * pixels_per_unit
+        refine = np.flatnonzero(error > tolerance)
+        if len(refine) == 0:
+            break
+        chi = np.insert(chi, refine + 1, middle[refine])
+        points = np.insert(points, refine + 1, middle_points[refine], axis=0)
+    return chi, points
+
+
+@cached_array
+def orbit_samples(e, l, M, num_revolutions, points_per_rev=None, pixels_per_unit=None):
+    """
+    Muestras (N, 4) de la órbita: columnas χ, x, y, z. Con pixels_per_unit
+    los χ salen de ``adaptive_chi_samples``; si no, points_per_rev parejos
+    por vuelta. Se guarda en la caché de arreglos: otro render (u otra
+    escena) con los mismos parámetros la abre sin recalcularla.
+    """
+    if pixels_per_unit is not None:
+        chi, points = adaptive_chi_samples(lambda chi: orbit_points(chi, e, l, M), num_revolutions, pixels_per_unit)
+    else:
+        chi = np.linspace(0, num_revolutions * 2 * np.pi, num_revolutions * points_per_rev)
+        points = orbit_points(chi, e, l, M)
+    return np.column_stack([chi, points])
+
+
+def angular_momentum_squared(e, l, M):
+    """L² de la órbita ligada con semilatus rectum l y excentricidad e"""
+    return M * l**2 / (l - (3 + e**2) * M)
+
+
+def energy_squared(e, l, M):
+    """E² de la órbita ligada con semilatus rectum l y excentricidad e"""
+    return ((l - 2 * M) ** 2 - 4 * M**2 * e**2) / (l * (l - (3 + e**2) * M))
+
+
+def effective_potential(r, L_squared, M):
+    """V(r) = (1 - 2M/r)(1 + L²/r²), con (dr/dτ)² = E² - V(r)"""
+    r = np.asarray(r, dtype=float)
+    return (1 - 2 * M / r) * (1 + L_squared / r**2)
+
+
+def get_value(value):
+    """Valor de un ValueTracker o de un número"""
+    return value.get_value() if hasattr(value, "get_value") else value
+
+
+class LiveOrbit(Polyline):
+    """
+    Órbita que se recalcula en cada frame a partir de los trackers (e, l, M).
+
+    Los χ son fijos (num_revolutions vueltas) y la órbita se escribe en un
+    búfer reservado de antemano y de ahí, con la escala de ``axes``, en los
+    puntos de la poligonal. Si con los parámetros actuales no hay solución
+    elíptica se deja la última órbita válida.
+    """
+
+    def __init__(self, e, l, M, axes, num_revolutions=3, points_per_rev=None, table=None, **kwargs):
+        super().__init__(**kwargs)
+        if points_per_rev is None:
+            points_per_rev = GeometryResolution()["orbit_points_per_rev"]
+        self.e, self.l, self.M = e, l, M
+        self.axes = axes
+        self.table = table
+        self.chi = np.linspace(0, num_revolutions * 2 * np.pi, num_revolutions * points_per_rev)
+        self._orbit = np.empty((len(self.chi), 3))
+        self._basis = np.zeros((2, 3))
+        self._shown_key = None
+        self.update_orbit()
+        self.add_updater(lambda m: m.update_orbit())
+
+    def get_parameters(self):
+        return get_value(self.e), get_value(self.l), get_value(self.M)
+
+    def is_valid(self):
+        return bool(orbit_parameters(*self.get_parameters())[3])
+
+    def update_orbit(self):
+        """Reescribe los puntos solo si cambiaron los parámetros o los ejes"""
+        e, l, M = self.get_parameters()
+        origin = self.axes.c2p(0, 0)
+        self._basis[0] = self.axes.c2p(1, 0) - origin
+        self._basis[1] = self.axes.c2p(0, 1) - origin
+        key = (e, l, M, *origin, *self._basis.ravel())
+        if key == self._shown_key:
+            return self
+        orbit_points(self.chi, e, l, M, out=self._orbit, table=self.table)
+        if np.isnan(self._orbit[0, 0]):
+            return self
+        self._shown_key = key
+
+        if self.points.shape != self._orbit.shape:
+            self.points = np.empty_like(self._orbit)
+        np.matmul(self._orbit[:, :2], self._basis, out=self.points)
+        self.points += origin
+        return self
+
+
+class PotentialPanel(VGroup):
+    """
+    Panel con el potencial efectivo V(r) de la órbita (e, l, M), el nivel E²
+    y un marcador en el r actual de la partícula (sobre el nivel de energía,
+    con un segmento hasta la curva: su largo es (dr/dτ)²).
+
+    radii: r de cada punto de la órbita (los mismos arreglos que el trazo).
+    La curva se evalúa una sola vez en lote; ``move_marker(k)`` solo busca
+    la posición precalculada del punto k.
+    """
+
+    def __init__(
+        self, e, l, M, radii, x_length=5, y_length=3.2, num_samples=400,
+        color=WHITE, marker_color=YELLOW, **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.L_squared = angular_momentum_squared(e, l, M)
+        self.E_squared = energy_squared(e, l, M)
+        self.radii = np.asarray(radii, dtype=float)
+
+        r_end = 1.25 * np.max(self.radii)
+        r_values = np.linspace(2 * M, r_end, num_samples)
+        V = effective_potential(r_values, self.L_squared, M)
+        # Rango vertical alrededor del pozo: del mínimo al nivel de energía
+        V_min = np.min(V[r_values >= np.min(self.radii)])
+        span = max(self.E_squared - V_min, 1e-4)
+        self.y_range = (V_min - 0.5 * span, self.E_squared + span)
+
+        self.axes = Axes(
+            x_range=[0, r_end, r_end / 5],
+            y_range=[*self.y_range, span / 2],
+            x_length=x_length,
+            y_length=y_length,
+            tips=False,
+            axis_config={"color": GRAY_C, "include_ticks": False},
+        )
+        self._values = np.stack([r_values, np.clip(V, *self.y_range)], axis=1)
+        self.curve = Polyline(color=color, stroke_width=2.5)
+        self.energy_line = DashedLine(color=marker_color, stroke_width=1.5)
+        self.gap = Line(color=marker_color, stroke_width=2, stroke_opacity=0.6)
+        self.marker = Dot(color=marker_color, radius=0.07)
+        self.r_label = MathTex("r", font_size=28, color=GRAY_A)
+        self.V_label = MathTex(r"V_{\text{ef}}(r)", font_size=28, color=color)
+        self.E_label = MathTex("E^2", font_size=28, color=marker_color)
+        self.add(self.axes, self.curve, self.energy_line, self.gap, self.marker, self.r_label, self.V_label, self.E_label)
+
+        self._marker_coords = np.stack([self.radii, np.full(len(self.radii), self.E_squared)], axis=1)
+        self._curve_coords = np.stack(
+            [self.radii, np.clip(effective_potential(self.radii, self.L_squared, M), *self.y_range)], axis=1
+        )
+        self._origin = None
+        self.move_marker(0)
+
+    def _to_points(self, coords):
+        """(r, V) -> puntos de la escena con la escala actual de los ejes (afín)"""
+        origin = self.axes.c2p(0, self.y_range[0])
+        unit_r = self.axes.c2p(1, self.y_range[0]) - origin
+        unit_V = self.axes.c2p(0, self.y_range[0] + 1) - origin
+        return origin + coords[:, :1] * unit_r + (coords[:, 1:] - self.y_range[0]) * unit_V
+
+    def _layout(self):
+        """Recalcula las posiciones si el panel se movió (to_edge, shift...)"""
+        origin = self.axes.get_origin()
+        if self._origin is not None and np.array_equal(origin, self._origin):
+            return
+        self._origin = origin
+        axes = self.axes
+        self.curve.set_points_as_corners(self._to_points(self._values))
+        self.energy_line.become(DashedLine(
+            axes.c2p(0, self.E_squared), axes.c2p(axes.x_range[1], self.E_squared),
+            color=self.energy_line.get_color(), stroke_width=1.5,
+        ))
+        self.r_label.next_to(axes.x_axis.get_end(), DOWN, buff=0.15)
+        self.V_label.next_to(axes.y_axis.get_end(), UP, buff=0.15)
+        self.E_label.next_to(self.energy_line.get_end(), RIGHT, buff=0.1)
+        self._marker_points = self._to_points(self._marker_coords)
+        self._curve_points = self._to_points(self._curve_coords)
+
+    def move_marker(self, k):
+        """Lleva el marcador al punto k de la órbita"""
+        self._layout()
+        self.marker.move_to(self._marker_points[k])
+        # En los ápsides el segmento tiene largo cero
+        self.gap.set_points_as_corners([self._curve_points[k], self._marker_points[k]])
+        return self
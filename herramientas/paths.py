@@ -0,0 +1,41 @@
+import os
+from pathlib import Path
+
+# Raíz del repositorio y carpeta común para todas las cachés en disco
+REPO_ROOT = Path(__file__).resolve().parent.parent
+CACHE_ROOT = REPO_ROOT / ".manim_cache"
+
+# Carpetas que contienen módulos de escenas
+SCENE_DIRS = [REPO_ROOT, REPO_ROOT / "Cods"]
+
+
+def get_cache_dir(name):
+    """Devuelve (y crea si hace falta) la subcarpeta de caché ``name``"""
+    path = CACHE_ROOT / name
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def evict_oldest(folder, max_bytes):
+    """Borra los archivos menos usados de ``folder`` hasta quedar bajo max_bytes"""
+    files = []
+    for entry in os.scandir(folder):
+        if entry.is_file():
+            stat = entry.stat()
+            files.append((max(stat.st_atime, stat.st_mtime), stat.st_size, entry.path))
+    total = sum(size for _, size, _ in files)
+    for _, size, path in sorted(files):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except OSError:  # ya borrado, o abierto (memory map) en Windows
+            pass
+        total -= size
+
+
+def iter_scene_files():
+    """Recorre los archivos .py con escenas (raíz del repositorio y Cods/)"""
+    for folder in SCENE_DIRS:
+        for path in sorted(folder.glob("*.py")):
+            yield path
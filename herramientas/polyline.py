@@ -0,0 +1,143 @@
+from manim import *
+import numpy as np
+
+
+class Polyline(VMobject):
+    """
+    Poligonal que guarda solo sus esquinas.
+
+    ``points`` es un arreglo (N, 3) de esquinas en lugar de las 4 * (N - 1)
+    anclas y manijas que genera ``VMobject.set_points_as_corners``: ocupa
+    ~4 veces menos memoria y reconstruirla en cada frame no calcula manijas.
+    Se dibuja como segmentos rectos y admite ``Create`` (dibujo parcial),
+    ``become`` y ``Transform`` entre poligonales.
+
+    Es una sola subtrayectoria; se cierra si la primera y la última esquina
+    coinciden (como en los círculos deformados).
+    """
+
+    def __init__(self, corners=None, **kwargs):
+        super().__init__(**kwargs)
+        if corners is not None:
+            self.set_points_as_corners(corners)
+
+    # -----------------------------------------------------------------
+    # Esquinas
+    # -----------------------------------------------------------------
+    def set_points_as_corners(self, points):
+        self.points = np.array(points, dtype=float).reshape(-1, self.dim)
+        return self
+
+    def add_points_as_corners(self, points):
+        points = np.asarray(points, dtype=float).reshape(-1, self.dim)
+        self.points = np.concatenate([self.points.reshape(-1, self.dim), points])
+        return self
+
+    def get_anchors(self):
+        return self.points
+
+    def get_num_curves(self):
+        return max(len(self.points) - 1, 0)
+
+    def get_nth_curve_points(self, n):
+        start, end = self.points[n], self.points[n + 1]
+        return np.array([start, start, end, end])
+
+    def has_new_path_started(self):
+        return False
+
+    def get_subpaths(self):
+        return [self.points] if len(self.points) else []
+
+    def to_vmobject(self):
+        """VMobject equivalente (con manijas), para mezclar con otros VMobjects"""
+        vmob = VMobject().match_style(self)
+        vmob.set_points_as_corners(self.points)
+        return vmob
+
+    # -----------------------------------------------------------------
+    # Dibujo con la cámara de Cairo: segmentos rectos
+    # -----------------------------------------------------------------
+    def gen_subpaths_from_points_2d(self, points):
+        return [points]
+
+    def gen_cubic_bezier_tuples_from_points(self, points):
+        # Curvas con las manijas sobre los extremos: Cairo las traza como rectas
+        return zip(points[:-1], points[:-1], points[1:], points[1:])
+
+    # -----------------------------------------------------------------
+    # Animaciones
+    # -----------------------------------------------------------------
+    @staticmethod
+    def _proportions(corners):
+        """Fracción de la longitud total en cada esquina (0 en la primera, 1 en la última)"""
+        lengths = np.linalg.norm(np.diff(corners, axis=0), axis=1)
+        cumulative = np.concatenate([[0.0], np.cumsum(lengths)])
+        if cumulative[-1] <= 0:
+            return np.linspace(0, 1, len(corners))
+        return cumulative / cumulative[-1]
+
+    @staticmethod
+    def _point_at(corners, proportions, alpha):
+        i = int(np.clip(np.searchsorted(proportions, alpha, side="right") - 1, 0, len(corners) - 2))
+        span = proportions[i + 1] - proportions[i]
+        frac = (alpha - proportions[i]) / span if span > 0 else 0.0
+        return interpolate(corners[i], corners[i + 1], frac)
+
+    def point_from_proportion(self, alpha):
+        corners = self.points
+        if len(corners) < 2:
+            return np.array(corners[0]) if len(corners) else self.get_center()
+        return self._point_at(corners, self._proportions(corners), np.clip(alpha, 0, 1))
+
+    def pointwise_become_partial(self, polyline, a, b):
+        """
+        Tramo [a, b] (por longitud de arco) de ``polyline``, con la misma
+        cantidad de esquinas: las que quedan fuera se colapsan sobre los
+        extremos. Por longitud y no por segmento, así una línea con muestreo
+        adaptativo se dibuja a velocidad pareja con ``Create``.
+        """
+        corners = polyline.points
+        if len(corners) < 2 or (a <= 0 and b >= 1):
+            self.points = np.array(corners)
+            return self
+        proportions = self._proportions(corners)
+        points = np.array(corners)
+        points[proportions <= a] = self._point_at(corners, proportions, a)
+        points[proportions >= b] = self._point_at(corners, proportions, b)
+        self.points = points
+        return self
+
+    def insert_corners(self, n):
+        """Agrega n esquinas subdividiendo los segmentos de manera pareja"""
+        corners = self.points
+        if n <= 0:
+            return self
+        if len(corners) < 2:
+            center = corners[0] if len(corners) else self.get_center()
+            self.points = np.repeat([center], len(corners) + n, axis=0)
+            return self
+        num_segments = len(corners) - 1
+        target = num_segments + n
+        # Cuántas partes le tocan a cada segmento (misma regla que VMobject.insert_n_curves)
+        repeat_indices = (np.arange(target) * num_segments) // target
+        split_factors = np.bincount(repeat_indices, minlength=num_segments)
+        new_points = []
+        for start, end, factor in zip(corners[:-1], corners[1:], split_factors):
+            alphas = np.linspace(0, 1, factor + 1)[:-1]
+            new_points.append(interpolate(start, end, alphas[:, None]))
+        new_points.append(corners[-1:])
+        self.points = np.concatenate(new_points)
+        return self
+
+    def align_points(self, mobject):
+        if not isinstance(mobject, Polyline):
+            raise TypeError(
+                f"Polyline solo se alinea con otra Polyline, no con {type(mobject).__name__}; "
+                "usar to_vmobject() para mezclarla con otros VMobjects"
+            )
+        self.align_rgbas(mobject)
+        n = max(len(self.points), len(mobject.points))
+        for mob in self, mobject:
+            mob.insert_corners(n - len(mob.points))
+        return self
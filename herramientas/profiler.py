@@ -0,0 +1,286 @@
+"""
+Perfilado opcional de una escena: cuánto cuesta cada updater, cada
+``play``/``wait``, la construcción de mobjects y, por frame, la
+actualización, la rasterización y la codificación.
+
+Los tiempos se exportan como traza de Chrome (se abre en
+https://ui.perfetto.dev o en chrome://tracing) y al final se imprime una
+tabla con lo que más tiempo consumió:
+
+    python -m herramientas.profiler space-time_deformation_bh.py SpacetimeDeformation_bh
+    python -m herramientas.profiler Cods/g-earth.py CampoGravitacional --top 30 -o traza.json
+
+Desde código:
+
+    with SceneProfiler() as profiler:
+        scene = MiEscena()
+        profiler.attach(scene)
+        scene.render()
+    profiler.export_chrome_trace("traza.json")
+    profiler.print_summary()
+"""
+
+import argparse
+import functools
+import inspect
+import json
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from manim import *
+
+from .frame_parallel import register_instrumentation, unregister_instrumentation
+from .paths import get_cache_dir
+from .scene_loader import find_scene_classes, load_scene_module
+
+
+def _all_subclasses(cls):
+    for subclass in cls.__subclasses__():
+        yield subclass
+        yield from _all_subclasses(subclass)
+
+
+def describe_callable(func):
+    """Nombre corto para un updater: sin el prefijo ``construct.<locals>.``"""
+    func = getattr(func, "__func__", func)
+    name = getattr(func, "__qualname__", type(func).__qualname__).split("<locals>.")[-1]
+    code = getattr(func, "__code__", None)
+    if name == "<lambda>" and code is not None:
+        name = f"<lambda> {Path(code.co_filename).name}:{code.co_firstlineno}"
+    return name
+
+
+class SceneProfiler:
+    """
+    Registra intervalos (nombre, categoría, inicio, duración) mientras está
+    instalado. Los parches sobre Mobject y Scene se quitan al salir.
+
+    min_event_us descarta de la traza (no del resumen) los intervalos muy
+    cortos, para que escenas con miles de mobjects no generen archivos enormes.
+    """
+
+    def __init__(self, min_event_us=0):
+        self.min_event_ns = int(min_event_us * 1000)
+        self.events = []
+        self.totals = {}
+        self._origin = time.perf_counter_ns()
+        self._patches = []
+        self._construct_depth = 0
+        self._names = {}
+
+    # -----------------------------------------------------------------
+    # Registro
+    # -----------------------------------------------------------------
+    def record(self, name, category, start, end, args=None):
+        duration = end - start
+        total = self.totals.get((name, category))
+        if total is None:
+            self.totals[(name, category)] = [1, duration, duration]
+        else:
+            total[0] += 1
+            total[1] += duration
+            total[2] = max(total[2], duration)
+        if duration >= self.min_event_ns:
+            self.events.append((name, category, start, duration, args))
+
+    @contextmanager
+    def span(self, name, category, args=None):
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.record(name, category, start, time.perf_counter_ns(), args)
+
+    def _updater_name(self, func):
+        key = getattr(func, "__code__", None) or id(func)
+        name = self._names.get(key)
+        if name is None:
+            name = self._names[key] = describe_callable(func)
+        return name
+
+    # -----------------------------------------------------------------
+    # Parches globales (updaters y construcción de mobjects)
+    # -----------------------------------------------------------------
+    def _patch(self, owner, attr, value):
+        self._patches.append((owner, attr, owner.__dict__[attr]))
+        setattr(owner, attr, value)
+
+    def install(self):
+        profiler = self
+
+        # Mismo cuerpo que Mobject.update, midiendo cada updater: con la
+        # actualización suspendida no corre nada, tampoco en los submobjects
+        def update(mob, dt=0, recursive=True):
+            if mob.updating_suspended:
+                return mob
+            for updater in mob.updaters:
+                start = time.perf_counter_ns()
+                if "dt" in inspect.signature(updater).parameters:
+                    updater(mob, dt)
+                else:
+                    updater(mob)
+                profiler.record(profiler._updater_name(updater), "updater", start, time.perf_counter_ns())
+            if recursive:
+                for submob in mob.submobjects:
+                    submob.update(dt, recursive=recursive)
+            return mob
+
+        def update_self(scene, dt):
+            for func in scene.updaters:
+                start = time.perf_counter_ns()
+                func(dt)
+                profiler.record(profiler._updater_name(func), "updater", start, time.perf_counter_ns())
+
+        self._patch(Mobject, "update", update)
+        self._patch(Scene, "update_self", update_self)
+
+        # Construcción: solo se mide el __init__ más externo de cada mobject
+        for cls in [Mobject, *_all_subclasses(Mobject)]:
+            if "__init__" in cls.__dict__:
+                self._patch(cls, "__init__", self._timed_init(cls.__dict__["__init__"]))
+        # La traza vive en este proceso: frame_parallel no reparte frames
+        register_instrumentation(self)
+        return self
+
+    def _timed_init(self, init):
+        profiler = self
+
+        @functools.wraps(init)
+        def timed_init(mob, *args, **kwargs):
+            if profiler._construct_depth:
+                return init(mob, *args, **kwargs)
+            profiler._construct_depth += 1
+            start = time.perf_counter_ns()
+            try:
+                return init(mob, *args, **kwargs)
+            finally:
+                profiler._construct_depth -= 1
+                profiler.record(type(mob).__name__, "construction", start, time.perf_counter_ns())
+
+        return timed_init
+
+    def uninstall(self):
+        for owner, attr, original in reversed(self._patches):
+            setattr(owner, attr, original)
+        self._patches = []
+        unregister_instrumentation(self)
+
+    def __enter__(self):
+        return self.install()
+
+    def __exit__(self, *exc_info):
+        self.uninstall()
+
+    # -----------------------------------------------------------------
+    # Instrumentación de una escena concreta
+    # -----------------------------------------------------------------
+    def attach(self, scene):
+        """Mide construct, cada play/wait y las etapas de cada frame"""
+        renderer = scene.renderer
+        scene.construct = self._wrap(scene.construct, "construct", "scene")
+        scene.update_to_time = self._wrap(scene.update_to_time, "actualizar frame", "frame")
+        renderer.update_frame = self._wrap(renderer.update_frame, "rasterizar", "frame")
+        renderer.add_frame = self._wrap(renderer.add_frame, "codificar", "frame")
+
+        play = renderer.play
+
+        def timed_play(scene, *args, **kwargs):
+            kind = "wait" if args and all(isinstance(a, Wait) for a in args) else "play"
+            name = f"{kind} {renderer.num_plays}"
+            contents = ", ".join(
+                "animate" if type(a).__name__ == "_AnimationBuilder" else type(a).__name__
+                for a in args
+            )
+            with self.span(name, "segment", {"animaciones": contents}):
+                play(scene, *args, **kwargs)
+
+        renderer.play = timed_play
+        return self
+
+    def _wrap(self, func, name, category):
+        @functools.wraps(func)
+        def wrapped(*args, **kwargs):
+            with self.span(name, category):
+                return func(*args, **kwargs)
+
+        return wrapped
+
+    # -----------------------------------------------------------------
+    # Exportación
+    # -----------------------------------------------------------------
+    def to_chrome_trace(self):
+        events = [
+            {
+                "name": name, "cat": category, "ph": "X", "pid": 1, "tid": 1,
+                "ts": (start - self._origin) / 1000, "dur": duration / 1000,
+                **({"args": args} if args else {}),
+            }
+            for name, category, start, duration, args in self.events
+        ]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path):
+        Path(path).write_text(json.dumps(self.to_chrome_trace()), encoding="utf-8")
+        return path
+
+    def summary(self, top=20, categories=("updater", "construction", "frame", "segment")):
+        """Filas (nombre, categoría, llamadas, total s, promedio ms, máximo ms)"""
+        rows = [
+            (name, category, calls, total / 1e9, total / calls / 1e6, longest / 1e6)
+            for (name, category), (calls, total, longest) in self.totals.items()
+            if category in categories
+        ]
+        rows.sort(key=lambda row: row[3], reverse=True)
+        return rows[:top]
+
+    def print_summary(self, top=20):
+        header = ("nombre", "categoría", "llamadas", "total", "promedio", "máximo")
+        rows = [
+            (name, category, str(calls), f"{total:.3f}s", f"{mean:.3f}ms", f"{longest:.3f}ms")
+            for name, category, calls, total, mean, longest in self.summary(top)
+        ]
+        widths = [max(len(row[i]) for row in rows + [header]) for i in range(len(header))]
+        for row in [header] + rows:
+            print("  ".join(cell.ljust(width) for cell, width in zip(row, widths)))
+
+
+def profile_scene(path, scene_name, output=None, top=20, quality="low_quality", encode=False, min_event_us=0):
+    """Renderiza una escena con el perfilador instalado y exporta la traza"""
+    options = {"quality": quality, "disable_caching": True, "progress_bar": "none"}
+    if not encode:
+        options["dry_run"] = True
+
+    with tempconfig(options):
+        module = load_scene_module(path)
+        scene_class = {c.__name__: c for c in find_scene_classes(module)}[scene_name]
+        with SceneProfiler(min_event_us) as profiler:
+            with profiler.span("crear escena", "scene"):
+                scene = scene_class()
+            profiler.attach(scene)
+            scene.render()
+
+    output = output or get_cache_dir("traces") / f"{scene_name}.json"
+    profiler.export_chrome_trace(output)
+    profiler.print_summary(top)
+    print(f"\nTraza en {output}")
+    return profiler
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Perfila updaters, segmentos y frames de una escena")
+    parser.add_argument("path", help="archivo de la escena")
+    parser.add_argument("scene", help="nombre de la clase de la escena")
+    parser.add_argument("-o", "--output", help="archivo de la traza (JSON de Chrome/Perfetto)")
+    parser.add_argument("--top", type=int, default=20, help="filas del resumen")
+    parser.add_argument("--quality", default="low_quality", help="calidad de manim (low_quality, ...)")
+    parser.add_argument("--encode", action="store_true", help="escribir también el video")
+    parser.add_argument("--min-event-us", type=float, default=0, help="duración mínima en la traza")
+    args = parser.parse_args(argv)
+    profile_scene(args.path, args.scene, args.output, args.top, args.quality, args.encode, args.min_event_us)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
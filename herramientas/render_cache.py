@@ -0,0 +1,603 @@
+"""
+Caché de render para segmentos donde solo se mueve la cámara.
+
+Al final de las escenas de deformación del espacio-tiempo la grilla ya no
+cambia y solo se mueve la cámara (move_camera, rotación ambiental). La
+cámara ``SegmentCacheCamera`` detecta esos segmentos comparando un digest del
+contenido de la escena entre frames:
+
+  * Si el contenido no cambió, reutiliza la geometría ya preparada (curvas
+    separadas en subtrayectorias y concatenadas en un solo arreglo) y por
+    frame solo hace una proyección en lote y el dibujo con Cairo.
+  * Los frames de segmentos estáticos se guardan comprimidos (``.npz``) en
+    ``.manim_cache/frames`` con clave (digest del contenido, estado de la
+    cámara, resolución), así al volver a renderizar ajustando la
+    coreografía de la cámara los frames que coinciden no se recalculan. Con
+    ``--disable_caching`` (y en los benchmarks) esta caché no se usa.
+
+Además, para grillas grandes que salen del encuadre, la cámara puede
+recortar (``enable_culling``) los mobjects indicados: en cada frame descarta
+los tramos de curva fuera del encuadre y los mobjects casi transparentes, y
+los tramos que proyectados miden menos de ``lod_pixels`` se dibujan como
+rectas, uniendo los consecutivos. Se reevalúa en cada frame, así que sigue
+a los movimientos de la cámara.
+
+"Casi transparente" se mide con la opacidad efectiva de cada píxel: la del
+relleno, o la del trazo por su ancho en píxeles (hasta 1), así un trazo
+más fino que un píxel cuenta solo con la fracción que cubre. En las grillas
+del espacio-tiempo (opacidad >= 0.3, trazos de ~4 px a 1080p) ninguna línea
+queda por debajo del umbral: ahí solo actúan el recorte por encuadre y el
+nivel de detalle.
+
+Los grupos con muchos miembros de igual estilo (líneas de la grilla, caras de
+la sombra, flechas de un campo) se pueden dibujar en lotes
+(``enable_batching``): los miembros consecutivos del grupo se juntan por
+estilo, con la opacidad redondeada a ``opacity_levels`` niveles y el grosor a
+múltiplos de ``width_step``, y cada lote se rellena y traza con una sola
+llamada de Cairo en lugar de una por mobject. Dentro de un grupo los lotes se
+dibujan uno tras otro, así que el orden entre sus miembros no debe importar
+(p. ej. mismo color con distintas opacidades); donde los caminos de un mismo
+lote se superponen la opacidad no se acumula.
+
+Uso en una escena:
+
+    class MiEscena(ThreeDScene):
+        def __init__(self, **kwargs):
+            super().__init__(camera_class=SegmentCacheCamera, **kwargs)
+
+        def construct(self):
+            grid = ...
+            self.camera.enable_culling(grid)
+            self.camera.enable_batching(grid, shadow)
+"""
+
+import hashlib
+import itertools as it
+import os
+import zipfile
+
+import cairo
+import numpy as np
+from manim import *
+from manim.camera.camera import CAP_STYLE_MAP, LINE_JOIN_MAP, Camera
+
+from .depth_sort import DepthSortCamera
+from .paths import evict_oldest, get_cache_dir
+from .polyline import Polyline
+from .state_hash import hash_mobject_state
+
+# Tamaño máximo de la caché de frames en disco
+FRAME_CACHE_MAX_BYTES = 2 * 1024**3
+
+# Opacidad efectiva mínima (opacidad por ancho del trazo en píxeles, hasta 1)
+# para dibujar un mobject recortable
+CULLING_MIN_OPACITY = 0.01
+
+# Tramos que proyectados miden menos que esto (en píxeles) se dibujan como rectas
+CULLING_LOD_PIXELS = 1.5
+
+# Niveles de opacidad y paso de grosor (stroke_width) de los lotes de trazos
+BATCH_OPACITY_LEVELS = 16
+BATCH_WIDTH_STEP = 0.1
+
+
+class SegmentCacheCamera(DepthSortCamera):
+    def __init__(self, use_frame_cache=True, frame_cache_max_bytes=FRAME_CACHE_MAX_BYTES, **kwargs):
+        super().__init__(**kwargs)
+        self.use_frame_cache = use_frame_cache
+        self.frame_cache_max_bytes = frame_cache_max_bytes
+        self._last_digest = None
+        self._geometry = None
+        self._background_is_clear = True
+        self._frames_saved = 0
+        # Grupos recortables -> (opacidad mínima, píxeles de nivel de detalle)
+        self.culling_groups = {}
+        self._culled = {}
+        # Grupos dibujados en lotes -> (niveles de opacidad, paso de grosor)
+        self.batching_groups = {}
+        self._batched = {}
+
+    # -----------------------------------------------------------------
+    # El pixel_array parte del fondo limpio o de una imagen estática
+    # -----------------------------------------------------------------
+    def reset(self):
+        self._background_is_clear = True
+        return super().reset()
+
+    def set_frame_to_background(self, background):
+        self._background_is_clear = False
+        super().set_frame_to_background(background)
+
+    # -----------------------------------------------------------------
+    # Digest del contenido (independiente de la cámara)
+    # -----------------------------------------------------------------
+    def content_digest(self, mobjects):
+        hasher = hashlib.blake2b(digest_size=16)
+        for mob in mobjects:
+            hasher.update(repr((
+                mob in self.fixed_in_frame_mobjects,
+                mob in self.fixed_orientation_mobjects,
+            )).encode())
+            hash_mobject_state(hasher, mob)
+        return hasher.digest()
+
+    def camera_state(self):
+        return (
+            self.get_phi(), self.get_theta(), self.get_gamma(),
+            self.get_focal_distance(), self.get_zoom(),
+            *np.asarray(self.frame_center, dtype=float),
+            self.pixel_width, self.pixel_height,
+            self.frame_width, self.frame_height,
+            str(self.background_color), self.background_opacity,
+        )
+
+    # -----------------------------------------------------------------
+    # Recorte por encuadre y nivel de detalle
+    # -----------------------------------------------------------------
+    def enable_culling(self, *mobjects, min_opacity=CULLING_MIN_OPACITY, lod_pixels=CULLING_LOD_PIXELS):
+        """Los VMobjects de la familia de ``mobjects`` se recortan al dibujarse"""
+        for mob in mobjects:
+            self.culling_groups[mob] = (min_opacity, lod_pixels)
+
+    def disable_culling(self, *mobjects):
+        for mob in mobjects:
+            self.culling_groups.pop(mob, None)
+
+    def _update_culled(self):
+        # Se recalcula por frame: become() o add() pueden cambiar la familia
+        self._culled = {
+            id(member): settings
+            for group, settings in self.culling_groups.items()
+            for member in group.get_family()
+        }
+
+    def _is_visible(self, mob):
+        settings = self._culled.get(id(mob))
+        if settings is None or not isinstance(mob, VMobject):
+            return True
+        min_opacity = settings[0]
+        # Ancho en píxeles de un trazo de stroke_width 1 (como en apply_stroke)
+        pixels_per_width = self.cairo_line_width_multiple * self.pixel_width / self.frame_width
+
+        def stroke_alpha(background):
+            coverage = min(mob.get_stroke_width(background) * pixels_per_width, 1.0)
+            return mob.get_stroke_opacity(background) * coverage
+
+        return (
+            stroke_alpha(False) >= min_opacity
+            or mob.get_fill_opacity() >= min_opacity
+            or stroke_alpha(True) >= min_opacity
+        )
+
+    def visible_rect(self, margin=0.0):
+        """Rectángulo visible (x0, x1, y0, y1) en coordenadas proyectadas"""
+        x, y = self.frame_center[:2]
+        half_w = self.frame_width / 2 + margin
+        half_h = self.frame_height / 2 + margin
+        return x - half_w, x + half_w, y - half_h, y + half_h
+
+    def _culled_path_args(self, mob):
+        """(rectángulo, tamaño mínimo en unidades del frame) para un mobject recortado"""
+        units_per_pixel = self.frame_width / self.pixel_width
+        # Margen del grosor del trazo para no cortar bordes visibles
+        margin = max(mob.get_stroke_width(), mob.get_stroke_width(background=True)) * 0.01
+        lod_pixels = self._culled[id(mob)][1]
+        return self.visible_rect(margin), lod_pixels * units_per_pixel
+
+    # -----------------------------------------------------------------
+    # Lotes de trazos del mismo estilo
+    # -----------------------------------------------------------------
+    def enable_batching(self, *mobjects, opacity_levels=BATCH_OPACITY_LEVELS, width_step=BATCH_WIDTH_STEP):
+        """Los VMobjects de la familia de cada grupo se dibujan en lotes por estilo"""
+        for mob in mobjects:
+            self.batching_groups[mob] = (opacity_levels, width_step)
+
+    def disable_batching(self, *mobjects):
+        for mob in mobjects:
+            self.batching_groups.pop(mob, None)
+
+    def _update_batched(self):
+        self._batched = {
+            id(member): (id(group), settings)
+            for group, settings in self.batching_groups.items()
+            for member in group.get_family()
+        }
+
+    def _batch_group(self, mob):
+        entry = self._batched.get(id(mob))
+        return None if entry is None else entry[0]
+
+    def display_multiple_non_background_colored_vmobjects(self, vmobjects, pixel_array):
+        self.draw_vmobjects(self.get_cairo_context(pixel_array), vmobjects)
+
+    def draw_vmobjects(self, ctx, vmobjects, set_path=None):
+        """
+        Dibuja ``vmobjects`` en orden. Los miembros consecutivos de un mismo
+        grupo de lotes se juntan por estilo; set_path(ctx, mob) arma el camino
+        de cada mobject (por defecto, set_cairo_context_path).
+        """
+        set_path = set_path or self.set_cairo_context_path
+        for group, run in it.groupby(vmobjects, self._batch_group):
+            if group is None:
+                for mob in run:
+                    set_path(ctx, mob)
+                    self.apply_styles(ctx, mob)
+            else:
+                self._draw_batches(ctx, list(run), set_path)
+
+    def apply_styles(self, ctx, mob):
+        self.apply_stroke(ctx, mob, background=True)
+        self.apply_fill(ctx, mob)
+        self.apply_stroke(ctx, mob)
+
+    def _draw_batches(self, ctx, mobjects, set_path):
+        opacity_levels, width_step = self._batched[id(mobjects[0])][1]
+        batches = {}
+        for mob in mobjects:
+            key = batch_style_key(mob, opacity_levels, width_step)
+            if key is None:
+                set_path(ctx, mob)
+                self.apply_styles(ctx, mob)
+                continue
+            # Los caminos vacíos no reinician ctx: se limpia antes
+            ctx.new_path()
+            set_path(ctx, mob)
+            path = ctx.copy_path()
+            if key[2][3] > 0:
+                # Con la regla de relleno de Cairo (winding) dos caras superpuestas con
+                # orientación opuesta se cancelarían: se separan por orientación
+                key += (path_orientation(path),)
+            batches.setdefault(key, []).append(path)
+
+        for (stroke_rgba, width, fill_rgba, joint_type, cap_style, *_), paths in batches.items():
+            ctx.new_path()
+            for path in paths:
+                ctx.append_path(path)
+            if fill_rgba[3] > 0:
+                ctx.set_source_rgba(*fill_rgba[2::-1], fill_rgba[3])
+                ctx.fill_preserve()
+            if width > 0 and stroke_rgba[3] > 0:
+                ctx.set_source_rgba(*stroke_rgba[2::-1], stroke_rgba[3])
+                ctx.set_line_width(width * self.cairo_line_width_multiple)
+                if joint_type != LineJointType.AUTO:
+                    ctx.set_line_join(LINE_JOIN_MAP[joint_type])
+                if cap_style != CapStyleType.AUTO:
+                    ctx.set_line_cap(CAP_STYLE_MAP[cap_style])
+                ctx.stroke_preserve()
+
+    def set_cairo_context_path(self, ctx, vmobject):
+        culled = id(vmobject) in self._culled
+        is_polyline = isinstance(vmobject, Polyline)
+        if not (culled or is_polyline):
+            return super().set_cairo_context_path(ctx, vmobject)
+
+        if is_polyline:
+            points = vmobject.points
+        else:
+            nppc = vmobject.n_points_per_cubic_curve
+            points = vmobject.points[: len(vmobject.points) // nppc * nppc]
+        if len(points) == 0:
+            return
+        projected = self.transform_points_pre_display(vmobject, points)
+        if not np.all(np.isfinite(projected)):
+            return super().set_cairo_context_path(ctx, vmobject)
+        projected = projected[:, :2]
+
+        if is_polyline and not culled:
+            add_polyline_path(ctx, vmobject, projected.tolist())
+        elif is_polyline:
+            add_culled_path(
+                ctx, vmobject, polyline_segments(projected), [(0, len(projected) - 1)],
+                *self._culled_path_args(vmobject), straight=True,
+            )
+        else:
+            curves = points.reshape(-1, nppc, 3)
+            add_culled_path(
+                ctx, vmobject, projected.reshape(-1, nppc, 2), subpath_ranges(vmobject, curves),
+                *self._culled_path_args(vmobject),
+            )
+
+    # -----------------------------------------------------------------
+    # Captura
+    # -----------------------------------------------------------------
+    def sort_for_display(self, mobjects):
+        """Mismo orden de profundidad que ThreeDCamera.get_mobjects_to_display (incremental)"""
+        return self.depth_sorter.sort(mobjects, self.get_rotation_matrix())
+
+    def capture_mobjects(self, mobjects, **kwargs):
+        self.reset_rotation_matrix()
+        # Orden canónico (sin ordenar por profundidad) para el digest
+        mobjects = Camera.get_mobjects_to_display(self, mobjects, **kwargs)
+        digest = self.content_digest(mobjects)
+        is_static = digest == self._last_digest
+        if not is_static:
+            self._last_digest = digest
+            self._geometry = None
+
+        self._update_culled()
+        if self._culled:
+            mobjects = [m for m in mobjects if self._is_visible(m)]
+        self._update_batched()
+
+        frame_file = None
+        if self.use_frame_cache and not config.disable_caching and self._background_is_clear:
+            state = (
+                self.camera_state(),
+                sorted(set(self._culled.values())),
+                sorted({settings for _, settings in self._batched.values()}),
+            )
+            key = hashlib.blake2b(digest + repr(state).encode(), digest_size=20)
+            frame_file = get_cache_dir("frames") / (key.hexdigest() + ".npz")
+            if self._load_frame(frame_file):
+                return
+
+        display_list = self.sort_for_display(mobjects)
+        if is_static and self._geometry is None:
+            self._geometry = StaticGeometry.build(self, mobjects)
+
+        if is_static and self._geometry is not None:
+            self._geometry.display(self, display_list)
+        else:
+            for group_type, group in it.groupby(display_list, self.type_or_raise):
+                self.display_funcs[group_type](list(group), self.pixel_array)
+
+        # Solo se guardan frames de segmentos estáticos (los que se repiten)
+        if frame_file is not None and is_static:
+            self._save_frame(frame_file)
+
+    # -----------------------------------------------------------------
+    # Caché de frames en disco
+    # -----------------------------------------------------------------
+    def _load_frame(self, frame_file):
+        if not frame_file.exists():
+            return False
+        try:
+            with np.load(frame_file) as data:
+                frame = data["frame"]
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            return False
+        if frame.shape != self.pixel_array.shape:
+            return False
+        self.pixel_array[:] = frame
+        return True
+
+    def _save_frame(self, frame_file):
+        # Comprimido: un frame 1080p crudo ocupa 8 MB, y un segmento de cámara
+        # de 10 s a 60 fps llenaría la caché entera
+        tmp_file = frame_file.with_name(f"{frame_file.stem}.{os.getpid()}.tmp.npz")
+        np.savez_compressed(tmp_file, frame=self.pixel_array)
+        os.replace(tmp_file, frame_file)
+        self._frames_saved += 1
+        if self._frames_saved % 100 == 0:
+            evict_oldest(frame_file.parent, self.frame_cache_max_bytes)
+
+
+def subpath_ranges(mob, curves):
+    """Rangos [inicio, fin) de curvas de cada subtrayectoria de un VMobject"""
+    gaps = np.abs(curves[1:, 0] - curves[:-1, -1]).max(axis=1) > mob.tolerance_for_point_equality
+    starts = np.concatenate([[0], np.flatnonzero(gaps) + 1])
+    ends = np.append(starts[1:], len(curves))
+    return list(zip(starts.tolist(), ends.tolist()))
+
+
+def polyline_segments(corners):
+    """Segmentos de una poligonal como curvas degeneradas (M, 4, d)"""
+    return np.stack([corners[:-1], corners[:-1], corners[1:], corners[1:]], axis=1)
+
+
+def add_polyline_path(ctx, mob, corners):
+    """Poligonal ya proyectada (lista de puntos 2D) como segmentos rectos"""
+    ctx.new_path()
+    if len(corners) < 2:
+        return
+    ctx.new_sub_path()
+    ctx.move_to(*corners[0])
+    for point in corners[1:]:
+        ctx.line_to(*point)
+    if mob.consider_points_equals_2d(corners[0], corners[-1]):
+        ctx.close_path()
+
+
+def add_bezier_path(ctx, mob, curves, subpaths):
+    """Curvas ya proyectadas (lista de (4, 2)) agrupadas en subtrayectorias"""
+    ctx.new_path()
+    for start, end in subpaths:
+        ctx.new_sub_path()
+        ctx.move_to(*curves[start][0])
+        for _, p1, p2, p3 in curves[start:end]:
+            ctx.curve_to(*p1, *p2, *p3)
+        first, last = curves[start][0], curves[end - 1][-1]
+        if mob.consider_points_equals_2d(first, last):
+            ctx.close_path()
+
+
+def batch_style_key(mob, opacity_levels, width_step):
+    """
+    Estilo redondeado de ``mob`` (trazo, grosor, relleno, unión, extremo) o
+    None si no se puede dibujar en lote: degradés, trazo de fondo o sombreado 3D.
+    """
+    if getattr(mob, "shade_in_3d", False) or mob.get_stroke_width(background=True) > 0:
+        return None
+    stroke = mob.get_stroke_rgbas()
+    fill = mob.get_fill_rgbas()
+    if not ((stroke == stroke[0]).all() and (fill == fill[0]).all()):
+        return None
+    width = mob.get_stroke_width()
+    if width > 0 and width_step:
+        width = max(round(width / width_step), 1) * width_step
+    return (
+        quantize_rgba(stroke[0], opacity_levels),
+        float(width),
+        quantize_rgba(fill[0], opacity_levels),
+        mob.joint_type,
+        mob.cap_style,
+    )
+
+
+def path_orientation(path):
+    """Orientación (signo del área, fórmula de Gauss) del camino de Cairo ya armado"""
+    area = 0.0
+    start = last = None
+    for kind, coords in path:
+        if kind == cairo.PATH_CLOSE_PATH:
+            continue
+        point = coords[-2:]
+        if kind == cairo.PATH_MOVE_TO:
+            if start is not None:
+                area += last[0] * start[1] - start[0] * last[1]
+            start = point
+        else:
+            area += last[0] * point[1] - point[0] * last[1]
+        last = point
+    if start is not None:
+        area += last[0] * start[1] - start[0] * last[1]
+    return (area > 0) - (area < 0)
+
+
+def quantize_rgba(rgba, opacity_levels):
+    r, g, b, a = (float(c) for c in rgba)
+    return round(r, 3), round(g, 3), round(b, 3), round(a * opacity_levels) / opacity_levels
+
+
+def add_culled_path(ctx, mob, curves, subpaths, rect, min_size, straight=False):
+    """
+    Arma en ctx el camino de ``mob`` solo con los tramos visibles.
+
+    curves: curvas ya proyectadas (M, 4, 2). Se descartan las curvas cuya caja
+    no toca ``rect``; las que miden menos de ``min_size`` se dibujan como
+    rectas y las consecutivas se unen hasta acumular ``min_size``. Con
+    straight=True (poligonales) todas se dibujan como rectas.
+    """
+    x0, x1, y0, y1 = rect
+    low = curves.min(axis=1)
+    high = curves.max(axis=1)
+    visible = (high[:, 0] >= x0) & (low[:, 0] <= x1) & (high[:, 1] >= y0) & (low[:, 1] <= y1)
+    small = ((high - low).max(axis=1) < min_size).tolist()
+
+    ctx.new_path()
+    for start, end in subpaths:
+        flags = visible[start:end]
+        if not flags.any():
+            continue
+        # Tramos contiguos de curvas visibles
+        edges = np.diff(np.concatenate([[0], flags.astype(np.int8), [0]]))
+        run_starts = (np.flatnonzero(edges == 1) + start).tolist()
+        run_ends = (np.flatnonzero(edges == -1) + start).tolist()
+        for a, b in zip(run_starts, run_ends):
+            run = curves[a:b].tolist()
+            ctx.new_sub_path()
+            ctx.move_to(*run[0][0])
+            last = run[0][0]
+            pending = None
+            for (_, p1, p2, p3), is_small in zip(run, small[a:b]):
+                if is_small:
+                    pending = p3
+                    if abs(p3[0] - last[0]) + abs(p3[1] - last[1]) >= min_size:
+                        ctx.line_to(*p3)
+                        last, pending = p3, None
+                    continue
+                if pending is not None:
+                    ctx.line_to(*pending)
+                    pending = None
+                if straight:
+                    ctx.line_to(*p3)
+                else:
+                    ctx.curve_to(*p1, *p2, *p3)
+                last = p3
+            if pending is not None:
+                ctx.line_to(*pending)
+        if flags.all() and mob.consider_points_equals_2d(curves[start][0], curves[end - 1][-1]):
+            ctx.close_path()
+
+
+class StaticGeometry:
+    """
+    Geometría preparada de un segmento estático: todas las curvas de los
+    VMobjects proyectables en un solo arreglo (M, 4, 3), las esquinas de las
+    poligonales en otro (K, 3) y, por mobject, dónde están sus datos.
+    """
+
+    def __init__(self, curves, corners, records):
+        self.curves = curves
+        self.corners = corners
+        self.records = records
+
+    @classmethod
+    def build(cls, camera, mobjects):
+        # Solo VMobjects sin imagen de fondo; con otros tipos se usa el camino normal
+        if not all(isinstance(m, VMobject) and not m.get_background_image() for m in mobjects):
+            return None
+
+        curve_chunks, corner_chunks = [], []
+        records = {}
+        curve_offset = corner_offset = 0
+        for mob in mobjects:
+            if mob in camera.fixed_orientation_mobjects:
+                continue
+            fixed = mob in camera.fixed_in_frame_mobjects
+
+            # Cada registro: (es poligonal, rango en el arreglo, datos fijos en el frame, subtrayectorias)
+            if isinstance(mob, Polyline):
+                corners = mob.points
+                if len(corners) == 0:
+                    continue
+                if fixed:
+                    records[id(mob)] = (True, None, corners[:, :2].tolist(), None)
+                else:
+                    records[id(mob)] = (True, (corner_offset, corner_offset + len(corners)), None, None)
+                    corner_chunks.append(corners)
+                    corner_offset += len(corners)
+                continue
+
+            nppc = mob.n_points_per_cubic_curve
+            points = mob.points[: len(mob.points) // nppc * nppc]
+            if len(points) == 0:
+                continue
+            curves = points.reshape(-1, nppc, 3)
+            subpaths = subpath_ranges(mob, curves)
+
+            if fixed:
+                records[id(mob)] = (False, None, curves[:, :, :2].tolist(), subpaths)
+            else:
+                records[id(mob)] = (False, (curve_offset, curve_offset + len(curves)), None, subpaths)
+                curve_chunks.append(curves)
+                curve_offset += len(curves)
+
+        all_curves = np.concatenate(curve_chunks) if curve_chunks else np.zeros((0, 4, 3))
+        all_corners = np.concatenate(corner_chunks) if corner_chunks else np.zeros((0, 3))
+        return cls(all_curves, all_corners, records)
+
+    def display(self, camera, display_list):
+        # Una sola proyección para todas las curvas y esquinas del segmento
+        num_curve_points = len(self.curves) * 4
+        points = np.concatenate([self.curves.reshape(-1, 3), self.corners])
+        projected_points = camera.project_points(points)[:, :2] if len(points) else np.zeros((0, 2))
+        projected_curves = projected_points[:num_curve_points].reshape(-1, 4, 2)
+        projected_corners = projected_points[num_curve_points:]
+        curves_list = projected_curves.tolist()
+        corners_list = projected_corners.tolist()
+
+        def set_path(ctx, mob):
+            record = self.records.get(id(mob))
+            if record is None:
+                camera.set_cairo_context_path(ctx, mob)
+                return
+            is_polyline, span, fixed_data, subpaths = record
+            culled = span is not None and id(mob) in camera._culled
+
+            if is_polyline and culled:
+                corners = projected_corners[span[0]:span[1]]
+                add_culled_path(
+                    ctx, mob, polyline_segments(corners), [(0, len(corners) - 1)],
+                    *camera._culled_path_args(mob), straight=True,
+                )
+            elif is_polyline:
+                add_polyline_path(ctx, mob, fixed_data if span is None else corners_list[span[0]:span[1]])
+            elif culled:
+                add_culled_path(
+                    ctx, mob, projected_curves[span[0]:span[1]], subpaths, *camera._culled_path_args(mob),
+                )
+            else:
+                add_bezier_path(ctx, mob, fixed_data if span is None else curves_list[span[0]:span[1]], subpaths)
+
+        camera.draw_vmobjects(camera.get_cairo_context(camera.pixel_array), display_list, set_path)
@@ -0,0 +1,77 @@
+"""
+Política central de resolución de la geometría.
+
+Los valores de referencia son los que usaban las escenas (pensados para el
+render final a 1080p). ``GeometryResolution`` los escala según la altura en
+píxeles del render activo, así un preview ``-ql`` (480p) construye menos
+geometría y un ``-qk`` (2160p) más:
+
+    valor = base * escala ** exponente,   escala = pixel_height / 1080
+
+Los conteos (muestras, caras) usan exponente 1; los espaciados, -0.5 (la
+cantidad de líneas por área crece con la resolución). Cada escena puede
+cambiar la base de cualquier valor:
+
+    res = GeometryResolution(shadow_resolution=35)
+    Sphere(resolution=res["sphere_resolution"])
+"""
+
+from manim import *
+
+# Altura en píxeles a la que corresponden los valores base
+REFERENCE_PIXEL_HEIGHT = 1080
+
+# Límites de la escala (evitan geometría degenerada o desproporcionada)
+MIN_SCALE = 0.25
+MAX_SCALE = 2.0
+
+# nombre -> (valor base, exponente, mínimo)
+PRESETS = {
+    # Muestras por línea de la grilla deformada
+    "grid_samples": (120, 1, 24),
+    # Celdas por lado de la sombra bajo la grilla
+    "shadow_resolution": (30, 1, 10),
+    # Resolución (u, v) de las esferas
+    "sphere_resolution": ((24, 48), 1, (8, 16)),
+    # Puntos por revolución de las órbitas
+    "orbit_points_per_rev": (300, 1, 60),
+    # Separación entre las semillas de StreamLines
+    "stream_lines_spacing": (0.35, -0.5, None),
+}
+
+
+def quality_scale():
+    """Escala de la geometría para la calidad del render activo"""
+    return min(max(config.pixel_height / REFERENCE_PIXEL_HEIGHT, MIN_SCALE), MAX_SCALE)
+
+
+class GeometryResolution:
+    """
+    Resolución de la geometría de una escena.
+
+    overrides cambia el valor base de los presets (sigue escalándose); scale
+    fija la escala, p. ej. ``scale=1`` para usar siempre los valores base.
+    """
+
+    def __init__(self, scale=None, **overrides):
+        unknown = set(overrides) - set(PRESETS)
+        if unknown:
+            raise KeyError(f"Presets de resolución desconocidos: {', '.join(sorted(unknown))}")
+        self.fixed_scale = scale
+        self.overrides = overrides
+
+    @property
+    def scale(self):
+        return quality_scale() if self.fixed_scale is None else self.fixed_scale
+
+    def get(self, name):
+        base, exponent, minimum = PRESETS[name]
+        base = self.overrides.get(name, base)
+        factor = self.scale ** exponent
+        if isinstance(base, tuple):
+            return tuple(max(lo, round(b * factor)) for b, lo in zip(base, minimum))
+        if isinstance(base, int):
+            return max(minimum, round(base * factor))
+        return round(base * factor, 4)
+
+    __getitem__ = get
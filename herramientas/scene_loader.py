@@ -0,0 +1,65 @@
+"""
+Carga de los módulos de escenas fuera de la línea de comandos de manim.
+
+Se imitan los pasos de ``manim render``: la carpeta del archivo se agrega a
+``sys.path`` y el módulo se ejecuta con un nombre propio, así los scripts de
+``Cods/`` importan ``herramientas`` igual que al renderizar normalmente.
+"""
+
+import importlib.util
+import inspect
+import sys
+from pathlib import Path
+
+from manim import *
+
+from .paths import REPO_ROOT, iter_scene_files
+
+
+def load_scene_module(path):
+    path = Path(path).resolve()
+    folder = str(path.parent)
+    if folder not in sys.path:
+        sys.path.insert(0, folder)
+    module_name = "escena_" + path.stem.replace("-", "_")
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def find_scene_classes(module):
+    """Clases de escenas definidas en el módulo (no las importadas de manim)"""
+    return [
+        obj for _, obj in inspect.getmembers(module, inspect.isclass)
+        if issubclass(obj, Scene) and obj.__module__ == module.__name__
+    ]
+
+
+def scene_id(path, scene_name):
+    """Identificador estable ``archivo::Escena`` relativo a la raíz del repositorio"""
+    path = Path(path).resolve()
+    try:
+        path = path.relative_to(REPO_ROOT)
+    except ValueError:
+        pass
+    return f"{path.as_posix()}::{scene_name}"
+
+
+def iter_scenes(paths=None, names=None):
+    """
+    Recorre (archivo, nombre de la escena) de los archivos dados o de todas
+    las escenas del repositorio. ``names`` filtra por nombre de clase.
+    """
+    paths = list(paths) if paths else list(iter_scene_files())
+    for path in paths:
+        try:
+            module = load_scene_module(path)
+        except Exception as error:  # un script roto no detiene el recorrido
+            logger.warning(f"No se pudo importar {path}: {error}")
+            continue
+        for scene_class in find_scene_classes(module):
+            if names and scene_class.__name__ not in names:
+                continue
+            yield Path(path), scene_class.__name__
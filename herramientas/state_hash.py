@@ -0,0 +1,304 @@
+"""
+Caché de partial movies direccionada por el estado de la escena.
+
+El hash que usa manim para cada ``play``/``wait`` serializa los mobjects y
+animaciones con su código fuente y, recursivamente, todas las variables de
+los closures. En escenas con helpers anidados en ``construct`` (como
+``create_deformed_grid``) cambiar una línea de un helper cambia el hash de
+todos los segmentos, aunque el segmento no lo use.
+
+``StateHashRenderer`` reemplaza ese hash por uno calculado a partir de:
+
+  * el estado de la cámara (ángulos, zoom, centro, resolución, fps),
+  * los digests de los arreglos de puntos y estilos de cada mobject en
+    pantalla (no su identidad ni el orden de las llamadas),
+  * los parámetros de cada animación (tipo, run_time, rate_func, mobjects
+    de inicio y destino),
+  * el bytecode de los updaters activos y de las funciones que alcanzan
+    (helpers del closure o del módulo), sin números de línea, junto con los
+    valores de su closure y las constantes del módulo que leen (números,
+    cadenas, arreglos, tuplas, listas y diccionarios).
+
+Los objetos de otras clases que aparecen en un closure (``SurfaceDistance``,
+``EllipticTable``, ``LensingRenderer``, ...) se describen por sus atributos
+públicos, o por lo que devuelva su método ``cache_state()`` si lo tienen.
+Si un valor no se puede describir (sin atributos, o más profundo que
+``_MAX_DEPTH``) el segmento no recibe clave y se renderiza en lugar de
+reutilizar una partial movie que podría estar desactualizada.
+
+Así un segmento se reutiliza siempre que empiece desde el mismo estado y
+anime lo mismo, aunque se hayan editado otros segmentos o helpers que no
+participan en él.
+
+Uso en una escena:
+
+    class MiEscena(ThreeDScene):
+        def __init__(self, **kwargs):
+            super().__init__(
+                renderer=StateHashRenderer(camera_class=SegmentCacheCamera), **kwargs
+            )
+"""
+
+import hashlib
+import types
+import uuid
+from contextlib import contextmanager
+from enum import Enum
+
+import numpy as np
+from manim import *
+from manim.renderer import cairo_renderer
+from manim.renderer.cairo_renderer import CairoRenderer
+
+# Atributos de las animaciones que no describen lo que se anima
+_SKIPPED_ANIMATION_ATTRS = {"mobject", "starting_mobject", "buffer"}
+
+# Profundidad máxima al recorrer listas, diccionarios y objetos de los closures
+_MAX_DEPTH = 4
+
+# Constantes del módulo que se hashean cuando una función las lee
+_GLOBAL_TYPES = (bool, int, float, complex, str, bytes, np.generic, np.ndarray, ManimColor, tuple, list, dict)
+
+# Digests de imágenes ya calculados: id(arreglo) -> (arreglo, digest)
+_IMAGE_DIGESTS = {}
+
+
+class UnhashableState(Exception):
+    """Un valor alcanzado desde un updater o una animación no se puede describir"""
+
+
+def _hash_array(hasher, array):
+    hasher.update(np.ascontiguousarray(array).tobytes())
+
+
+def image_digest(pixel_array):
+    """Las imágenes no cambian de un frame a otro: se hashean una sola vez"""
+    cached = _IMAGE_DIGESTS.get(id(pixel_array))
+    if cached is None or cached[0] is not pixel_array:
+        cached = (pixel_array, hashlib.blake2b(pixel_array.tobytes(), digest_size=16).digest())
+        _IMAGE_DIGESTS[id(pixel_array)] = cached
+    return cached[1]
+
+
+def hash_mobject_state(hasher, mob):
+    """Agrega al hasher los puntos y el estilo de un mobject (sin su familia)"""
+    hasher.update(type(mob).__name__.encode())
+    hasher.update(repr((getattr(mob, "shade_in_3d", False), mob.z_index)).encode())
+    _hash_array(hasher, mob.points)
+    if isinstance(mob, VMobject):
+        _hash_array(hasher, mob.get_fill_rgbas())
+        _hash_array(hasher, mob.get_stroke_rgbas())
+        _hash_array(hasher, mob.get_stroke_rgbas(background=True))
+        hasher.update(repr((
+            mob.get_stroke_width(),
+            mob.get_stroke_width(background=True),
+            mob.get_sheen_factor(),
+            mob.get_background_image(),
+        )).encode())
+    elif isinstance(mob, AbstractImageMobject):
+        hasher.update(image_digest(mob.get_pixel_array()))
+    elif hasattr(mob, "rgbas"):
+        _hash_array(hasher, mob.rgbas)
+
+
+def hash_family(hasher, mob, seen):
+    """Estado de un mobject y su familia, más el código de sus updaters"""
+    for member in mob.get_family():
+        hash_mobject_state(hasher, member)
+        hasher.update(repr((len(member.submobjects), member.updating_suspended)).encode())
+        for updater in member.updaters:
+            hash_callable(hasher, updater, seen)
+
+
+# ---------------------------------------------------------------------------
+# Código de funciones (sin números de línea ni nombres de archivo)
+# ---------------------------------------------------------------------------
+
+def _hash_code(hasher, code):
+    hasher.update(code.co_code)
+    hasher.update(repr(code.co_names).encode())
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            _hash_code(hasher, const)
+        else:
+            hasher.update(repr(const).encode())
+
+
+def _iter_names(code):
+    yield from code.co_names
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            yield from _iter_names(const)
+
+
+def hash_callable(hasher, func, seen):
+    """
+    Bytecode de una función y de lo que alcanza: valores del closure,
+    funciones del mismo módulo a las que llama y constantes del módulo que
+    lee (las privadas, con ``_``, son estado interno y no entran). Los
+    helpers que la función no usa no entran en el hash.
+    """
+    if id(func) in seen:
+        hasher.update(b"<seen>")
+        return
+    seen.add(id(func))
+
+    if isinstance(func, types.MethodType):
+        hash_callable(hasher, func.__func__, seen)
+        return
+    code = getattr(func, "__code__", None)
+    if code is None:
+        # Builtins, ufuncs y objetos invocables: basta con su nombre
+        hasher.update(repr(getattr(func, "__qualname__", type(func).__qualname__)).encode())
+        return
+
+    _hash_code(hasher, code)
+    hasher.update(repr(func.__defaults__).encode())
+    for cell in func.__closure__ or ():
+        try:
+            value = cell.cell_contents
+        except ValueError:  # variable del closure aún sin asignar
+            continue
+        hash_value(hasher, value, seen, depth=1)
+
+    module_globals = getattr(func, "__globals__", {})
+    for name in _iter_names(code):
+        value = module_globals.get(name)
+        if isinstance(value, types.FunctionType) and value.__module__ == func.__module__:
+            hash_callable(hasher, value, seen)
+        elif not name.startswith("_") and isinstance(value, _GLOBAL_TYPES):
+            hasher.update(name.encode())
+            hash_value(hasher, value, seen, depth=1)
+
+
+def hash_value(hasher, value, seen, depth=0):
+    """Valor de un closure o atributo de animación"""
+    if isinstance(value, (bool, int, float, complex, str, bytes, type(None))):
+        hasher.update(repr(value).encode())
+    elif isinstance(value, np.generic):
+        hasher.update(repr(value.item()).encode())
+    elif isinstance(value, np.ndarray):
+        hasher.update(repr((value.dtype.str, value.shape)).encode())
+        _hash_array(hasher, value)
+    elif isinstance(value, ManimColor):
+        hasher.update(value.to_hex(with_alpha=True).encode())
+    elif isinstance(value, Mobject):
+        if id(value) in seen:
+            hasher.update(b"<seen>")
+            return
+        seen.add(id(value))
+        hash_family(hasher, value, seen)
+    elif isinstance(value, (Scene, Camera, types.ModuleType, type)):
+        # La escena y la cámara se describen aparte
+        hasher.update(repr(type(value).__name__).encode())
+    elif isinstance(value, Enum):
+        hasher.update(repr(value).encode())
+    elif callable(value):
+        hash_callable(hasher, value, seen)
+    elif depth < _MAX_DEPTH and isinstance(value, (list, tuple)):
+        hasher.update(f"[{len(value)}".encode())
+        for item in value:
+            hash_value(hasher, item, seen, depth + 1)
+    elif depth < _MAX_DEPTH and isinstance(value, dict):
+        hasher.update(f"{{{len(value)}".encode())
+        for key, item in value.items():
+            hasher.update(repr(key).encode())
+            hash_value(hasher, item, seen, depth + 1)
+    elif depth < _MAX_DEPTH and hasattr(value, "__dict__"):
+        if id(value) in seen:
+            hasher.update(b"<seen>")
+            return
+        seen.add(id(value))
+        # Atributos públicos: los privados suelen ser búferes de trabajo
+        if hasattr(value, "cache_state"):
+            state = value.cache_state()
+        else:
+            state = {key: item for key, item in vars(value).items() if not key.startswith("_")}
+        hasher.update(repr(type(value).__qualname__).encode())
+        # El objeto y su estado cuentan como un solo nivel
+        hash_value(hasher, state, seen, depth)
+    else:
+        raise UnhashableState(f"no se puede describir un valor de tipo {type(value).__name__}")
+
+
+def hash_animation(hasher, animation, seen):
+    hasher.update(type(animation).__name__.encode())
+    hash_value(hasher, animation.mobject, seen)
+    if isinstance(animation, AnimationGroup):
+        for sub_animation in animation.animations:
+            hash_animation(hasher, sub_animation, seen)
+    for key, value in sorted(vars(animation).items(), key=lambda kv: kv[0]):
+        if key in _SKIPPED_ANIMATION_ATTRS or key == "animations":
+            continue
+        hasher.update(key.encode())
+        hash_value(hasher, value, seen, depth=1)
+
+
+def camera_state(camera):
+    if isinstance(camera, ThreeDCamera):
+        angles = (
+            camera.get_phi(), camera.get_theta(), camera.get_gamma(),
+            camera.get_focal_distance(), camera.get_zoom(),
+        )
+    else:
+        angles = ()
+    return (
+        *angles,
+        *np.asarray(camera.frame_center, dtype=float),
+        camera.pixel_width, camera.pixel_height,
+        camera.frame_width, camera.frame_height,
+        str(camera.background_color), camera.background_opacity,
+        config.frame_rate,
+    )
+
+
+def get_state_hash_from_play_call(scene, camera, animations, mobjects):
+    """
+    Reemplazo de manim.utils.hashing.get_hash_from_play_call. Si algún valor
+    no se puede describir, devuelve una clave nueva: el segmento se renderiza.
+    """
+    try:
+        return _state_hash(scene, camera, animations, mobjects)
+    except UnhashableState as error:
+        logger.debug(f"StateHashRenderer: segmento sin clave ({error})")
+        return f"uncached_{uuid.uuid4().hex}"
+
+
+def _state_hash(scene, camera, animations, mobjects):
+    hasher = hashlib.blake2b(digest_size=16)
+    seen = set()
+    hasher.update(repr(camera_state(camera)).encode())
+    if isinstance(camera, ThreeDCamera):
+        fixed = camera.fixed_in_frame_mobjects | camera.fixed_orientation_mobjects
+        hasher.update(repr(sorted(
+            i for i, m in enumerate(scene.get_mobject_family_members()) if m in fixed
+        )).encode())
+
+    for animation in animations:
+        hash_animation(hasher, animation, seen)
+    hasher.update(b"|mobjects|")
+    for mob in mobjects:
+        hash_value(hasher, mob, seen)
+    hasher.update(b"|scene|")
+    for updater in scene.updaters:
+        hash_callable(hasher, updater, seen)
+    return "state_" + hasher.hexdigest()
+
+
+@contextmanager
+def _use_hash_function(func):
+    original = cairo_renderer.get_hash_from_play_call
+    cairo_renderer.get_hash_from_play_call = func
+    try:
+        yield
+    finally:
+        cairo_renderer.get_hash_from_play_call = original
+
+
+class StateHashRenderer(CairoRenderer):
+    """CairoRenderer que decide qué partial movies reutilizar por estado"""
+
+    def play(self, scene, *args, **kwargs):
+        # Mismo flujo de CairoRenderer.play, solo cambia el hash del segmento
+        with _use_hash_function(get_state_hash_from_play_call):
+            super().play(scene, *args, **kwargs)
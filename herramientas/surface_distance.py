@@ -0,0 +1,88 @@
+"""
+Distancias medidas sobre la superficie deformada del espacio-tiempo.
+
+En las escenas de deformación la superficie es z = depth * h(r): la forma
+h(r) es fija y la profundidad la da un tracker. Una curva sobre la
+superficie (la geodésica radial entre r_V y r_T) ya está muestreada, así
+que su longitud es una suma sobre esas muestras:
+
+    L(depth) = Σ sqrt(Δx² + Δy² + depth² Δh²)
+
+``SurfaceDistance`` precalcula Δx² + Δy² y Δh una vez y, cuando cambia la
+profundidad, recalcula la longitud acumulada en búferes reservados de
+antemano (sin crear arreglos en cada frame). Si la profundidad no cambió
+devuelve el valor anterior.
+
+``schwarzschild_proper_distance`` da la distancia radial propia de
+Schwarzschild, ∫ dr / sqrt(1 - r_s / r), acumulada sobre las mismas muestras
+de r. Es la longitud sobre el paraboloide de Flamm; la superficie de las
+escenas no es ese paraboloide, así que las dos distancias se pueden comparar.
+
+Uso:
+
+    distance = SurfaceDistance(plane_points, heights_at_depth_1)
+    readout = LiveNumberLabel("d =", lambda: distance.length(depth.get_value()))
+"""
+
+import numpy as np
+
+
+class SurfaceDistance:
+    """
+    Longitud de una curva sobre la superficie z = depth * h.
+
+    plane_points: muestras (N, 2) o (N, 3) de la curva en el plano (se
+    ignora z); unit_heights: (N,) alturas h de esas muestras con depth = 1.
+    """
+
+    def __init__(self, plane_points, unit_heights):
+        plane = np.asarray(plane_points, dtype=float)[:, :2]
+        self._plane_squared = np.sum(np.diff(plane, axis=0) ** 2, axis=1)
+        self._height_steps = np.diff(np.asarray(unit_heights, dtype=float))
+        self._segments = np.empty_like(self._height_steps)
+        self._cumulative = np.zeros(len(plane))
+        self._depth = None
+
+    def cache_state(self):
+        """Lo que define la curva (para las claves de caché de state_hash)"""
+        return self._plane_squared, self._height_steps
+
+    def update(self, depth):
+        """Recalcula la longitud acumulada solo si la profundidad cambió"""
+        depth = float(depth)
+        if depth == self._depth:
+            return self
+        segments = self._segments
+        np.multiply(self._height_steps, depth, out=segments)
+        np.square(segments, out=segments)
+        segments += self._plane_squared
+        np.sqrt(segments, out=segments)
+        np.cumsum(segments, out=self._cumulative[1:])
+        self._depth = depth
+        return self
+
+    def cumulative(self, depth):
+        """Longitud (N,) desde la primera muestra hasta cada una (búfer compartido)"""
+        return self.update(depth)._cumulative
+
+    def length(self, depth):
+        """Longitud total de la curva con la profundidad dada"""
+        return self.update(depth)._cumulative[-1]
+
+
+def schwarzschild_proper_distance(radii, r_s):
+    """
+    Distancia radial propia (N,) desde radii[0] hasta cada radio, con
+    radii crecientes y radii[0] >= r_s.
+
+    El integrando diverge (de forma integrable) en el horizonte; con
+    r = r_s + s² queda dl = 2 sqrt(r) ds, suave, y se integra con trapecios
+    sobre las mismas muestras.
+    """
+    radii = np.asarray(radii, dtype=float)
+    if radii[0] < r_s:
+        raise ValueError(f"schwarzschild_proper_distance: r = {radii[0]} está dentro del horizonte r_s = {r_s}")
+    s = np.sqrt(radii - r_s)
+    integrand = 2 * np.sqrt(radii)
+    steps = np.diff(s) * (integrand[1:] + integrand[:-1]) / 2
+    return np.concatenate([[0.0], np.cumsum(steps)])
@@ -0,0 +1,213 @@
+"""
+Caché persistente de LaTeX compartida por todas las escenas del repositorio.
+
+Dos niveles, ambos direccionados por contenido:
+  1. ``.manim_cache/tex``: archivos .tex/.svg de manim (el nombre es el hash
+     del código TeX), compartidos sin importar desde dónde se renderice.
+     ``install_tex_cache`` (que corre al importar ``herramientas``) apunta
+     ``config.tex_dir`` ahí, anclado en la raíz del repositorio.
+  2. ``.manim_cache/tex_paths``: los puntos y estilos ya extraídos de cada SVG,
+     así otra escena u otro proceso se salta también el parseo del SVG.
+
+Precalentar la caché antes de renderizar (compila en paralelo lo que falte):
+
+    python -m herramientas.tex_cache            # todas las escenas
+    python -m herramientas.tex_cache Cods/text_eq_lines_colors.py -j 4
+"""
+
+import argparse
+import ast
+import hashlib
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import numpy as np
+from manim import *
+from manim.mobject.svg.svg_mobject import SVGMobject
+from manim.utils.tex_file_writing import delete_nonsvg_files
+
+from .paths import get_cache_dir, iter_scene_files
+
+TEX_CLASSES = {"MathTex": MathTex, "Tex": Tex}
+
+# Argumentos que cambian el código TeX compilado (el resto, como color, no)
+TEX_KWARGS = ("arg_separator", "substrings_to_isolate", "tex_to_color_map", "tex_environment")
+
+_original_generate_mobject = SVGMobject.generate_mobject
+
+
+def install_tex_cache():
+    """
+    Apunta ``config.tex_dir`` a la caché compartida y activa la caché de
+    puntos de los SVG de LaTeX. Se puede llamar varias veces.
+    """
+    config.tex_dir = str(get_cache_dir("tex"))
+    get_cache_dir("tex_paths")
+    SVGMobject.generate_mobject = _cached_generate_mobject
+
+
+def _path_cache_file(svg_mob):
+    """Archivo .npz para un SVG de LaTeX, o None si no aplica la caché"""
+    if not isinstance(svg_mob, SingleStringMathTex):
+        return None
+    svg_path = svg_mob.get_file_path()
+    hasher = hashlib.sha256(svg_path.read_bytes())
+    hasher.update(repr((svg_mob.svg_default, svg_mob.path_string_config)).encode())
+    return get_cache_dir("tex_paths") / (hasher.hexdigest()[:32] + ".npz")
+
+
+def _cached_generate_mobject(self):
+    cache_file = _path_cache_file(self)
+    if cache_file is None:
+        return _original_generate_mobject(self)
+
+    if cache_file.exists():
+        try:
+            self.add(*_load_path_data(cache_file))
+            return
+        except (OSError, ValueError, KeyError):
+            # Archivo corrupto o de un formato anterior: se regenera abajo
+            pass
+
+    _original_generate_mobject(self)
+    _save_path_data(cache_file, self.submobjects)
+
+
+def _save_path_data(cache_file, mobjects):
+    arrays = {f"points_{i}": mob.points for i, mob in enumerate(mobjects)}
+    arrays["style"] = np.array([
+        [*mob.get_fill_rgbas()[0], *mob.get_stroke_rgbas()[0], mob.get_stroke_width()]
+        for mob in mobjects
+    ]).reshape(len(mobjects), 9)
+
+    # Escritura atómica: otros procesos pueden estar leyendo la misma caché
+    tmp_file = cache_file.with_name(f"{cache_file.stem}.{os.getpid()}.tmp")
+    with open(tmp_file, "wb") as f:
+        np.savez(f, **arrays)
+    os.replace(tmp_file, cache_file)
+
+
+def _load_path_data(cache_file):
+    mobjects = []
+    with np.load(cache_file) as data:
+        for i, row in enumerate(data["style"]):
+            mob = VMobject()
+            mob.set_points(data[f"points_{i}"])
+            mob.set_style(
+                fill_color=ManimColor.from_rgba(row[:4]),
+                fill_opacity=row[3],
+                stroke_color=ManimColor.from_rgba(row[4:8]),
+                stroke_opacity=row[7],
+                stroke_width=row[8],
+            )
+            mobjects.append(mob)
+    return mobjects
+
+
+# ---------------------------------------------------------------------------
+# Extracción estática de las fórmulas de las escenas
+# ---------------------------------------------------------------------------
+
+def _literal_kwarg(node):
+    """Evalúa un argumento con nombre; tex_to_color_map solo importa por sus claves"""
+    if node.arg == "tex_to_color_map" and isinstance(node.value, ast.Dict):
+        return tuple(ast.literal_eval(k) for k in node.value.keys)
+    return ast.literal_eval(node.value)
+
+
+def extract_tex_calls(path):
+    """
+    Devuelve las llamadas ``MathTex(...)``/``Tex(...)`` de un archivo cuyos
+    textos son literales, como tuplas (clase, textos, kwargs). Las fórmulas
+    dinámicas (f-strings con valores) o con plantilla propia se ignoran.
+    """
+    tree = ast.parse(Path(path).read_text(encoding="utf-8"), filename=str(path))
+    calls = set()
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call):
+            continue
+        func = node.func
+        name = func.id if isinstance(func, ast.Name) else getattr(func, "attr", None)
+        if name not in TEX_CLASSES or not node.args:
+            continue
+        if not all(isinstance(a, ast.Constant) and isinstance(a.value, str) for a in node.args):
+            continue
+
+        kwargs = {}
+        try:
+            for kw in node.keywords:
+                if kw.arg == "tex_template" or kw.arg is None:
+                    raise ValueError(kw.arg)
+                if kw.arg in TEX_KWARGS:
+                    kwargs[kw.arg] = _literal_kwarg(kw)
+        except ValueError:
+            continue
+
+        strings = tuple(a.value for a in node.args)
+        calls.add((name, strings, repr(sorted(kwargs.items(), key=lambda kv: kv[0]))))
+    return calls
+
+
+def _init_worker():
+    install_tex_cache()
+    # La limpieza de .dvi/.log se hace al final desde el proceso principal,
+    # para que un proceso no borre los archivos intermedios de otro
+    config.no_latex_cleanup = True
+
+
+def _compile_call(call):
+    name, strings, kwargs_repr = call
+    kwargs = dict(ast.literal_eval(kwargs_repr))
+    if "tex_to_color_map" in kwargs:
+        kwargs["tex_to_color_map"] = {k: WHITE for k in kwargs["tex_to_color_map"]}
+    try:
+        TEX_CLASSES[name](*strings, **kwargs)
+    except Exception as error:  # errores de LaTeX: se reportan, no detienen el resto
+        return call, str(error)
+    return call, None
+
+
+def prewarm(paths=None, jobs=None):
+    """
+    Compila en paralelo todas las fórmulas estáticas de las escenas y llena
+    ambos niveles de la caché. Devuelve la lista de (llamada, error) fallidas.
+    """
+    install_tex_cache()
+    paths = list(paths) if paths else list(iter_scene_files())
+
+    calls = set()
+    for path in paths:
+        try:
+            calls |= extract_tex_calls(path)
+        except SyntaxError as error:
+            logger.warning(f"No se pudo analizar {path}: {error}")
+    calls = sorted(calls)
+
+    failures = []
+    with ProcessPoolExecutor(max_workers=jobs or os.cpu_count(), initializer=_init_worker) as pool:
+        futures = [pool.submit(_compile_call, call) for call in calls]
+        for future in as_completed(futures):
+            call, error = future.result()
+            if error is not None:
+                failures.append((call, error))
+
+    delete_nonsvg_files()
+    print(f"{len(calls)} fórmulas en caché ({len(failures)} con error) en {config.tex_dir}")
+    for (name, strings, _), error in failures:
+        print(f"  {name}{strings}: {error}")
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Precalienta la caché compartida de LaTeX")
+    parser.add_argument("paths", nargs="*", help="archivos de escenas (por defecto, todos)")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="procesos en paralelo")
+    args = parser.parse_args(argv)
+    failures = prewarm(args.paths, args.jobs)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,36 @@
 from manim import *
 import numpy as np
+from herramientas import (
+    BillboardLabels,
+    GeometryResolution,
+    LiveNumberLabel,
+    PipelinedFileWriter,
+    Polyline,
+    SegmentCacheCamera,
+    StateHashRenderer,
+    SurfaceDistance,
+    frame_parallel,
+    grid_line_field,
+    install_tex_cache,
+    schwarzschild_proper_distance,
+    split_lines,
+)
+
+# Fórmulas compiladas una sola vez y compartidas con las demás escenas
+install_tex_cache()
 # Deformación espacio tiempo para un agujero negro, con labels corregidos
 
 class SpacetimeDeformation_bh(ThreeDScene):
+    def __init__(self, **kwargs):
+        # Cámara que reutiliza geometría y frames cuando solo se mueve la cámara;
+        # los segmentos ya renderizados se reutilizan según el estado de la escena
+        # y la codificación se solapa con el render del segmento siguiente
+        super().__init__(
+            camera_class=SegmentCacheCamera,
+            renderer=StateHashRenderer(camera_class=SegmentCacheCamera, file_writer_class=PipelinedFileWriter),
+            **kwargs
+        )
+
     def construct(self):
         # Configurar la cámara en perspectiva inclinada
         self.set_camera_orientation(phi=80 * DEGREES, theta=-60 * DEGREES, distance=9)
@@ -11,6 +39,8 @@ class SpacetimeDeformation_bh(ThreeDScene):
         r_V = 2.5  # Radio de Schwarzschild (rojo)
         r_T = 4.5  # Radio exterior (amarillo)
         grid_size = 20
+        # Densidad de muestreo según la calidad del render (herramientas/resolution.py)
+        res = GeometryResolution()
 
         # GROSOR MUY DELGADO desde el inicio
         GRID_STROKE_WIDTH = 2.9
@@ -35,36 +65,36 @@ class SpacetimeDeformation_bh(ThreeDScene):
                 z = -depth_factor * 6.0 * (1 - normalized**2)**1.5 / (normalized**0.7 + 0.15)
                 return z
         
+        # Campo de la grilla con profundidad 1 para cada radio de deformación: la
+        # deformación es proporcional a depth_factor, así que cada frame solo escala
+        # las alturas. El campo queda en la caché de arreglos (herramientas/grid.py)
+        grid_offsets = np.linspace(-grid_size, grid_size, 60)
+        grid_lines = {}
+        
+        def get_grid_lines(deformation_radius):
+            if deformation_radius not in grid_lines:
+                field = grid_line_field(
+                    lambda r: deformation_function(r, 1.0, deformation_radius),
+                    grid_size, len(grid_offsets), res["grid_samples"], deformation_radius
+                )
+                grid_lines[deformation_radius] = split_lines(field)
+            return grid_lines[deformation_radius]
+        
         # CREAR GRILLA DEFORMADA con parámetro de profundidad y radio de deformación
         def create_deformed_grid(depth_factor=0.0, deformation_radius=r_V):
             lines = VGroup()
-            for i in np.linspace(-grid_size, grid_size, 60):
-                points1 = []
-                points2 = []
-                
-                dist_from_center_i = abs(i) / grid_size
+            # Líneas 2k en dirección y y 2k + 1 en dirección x, ambas a distancia grid_offsets[k]
+            for k, field in enumerate(get_grid_lines(deformation_radius)):
+                dist_from_center_i = abs(grid_offsets[k // 2]) / grid_size
                 opacity_i = 1.0 - (dist_from_center_i ** 1.5) * 0.7
                 
-                for j in np.linspace(-grid_size, grid_size, 120):
-                    # Líneas en dirección x
-                    r = np.sqrt(i**2 + j**2)
-                    z = deformation_function(r, depth_factor, deformation_radius)
-                    points1.append([i, j, z])
-                    
-                    # Líneas en dirección y
-                    r = np.sqrt(j**2 + i**2)
-                    z = deformation_function(r, depth_factor, deformation_radius)
-                    points2.append([j, i, z])
-                
-                line1 = VMobject(color=GRID_COLOR, stroke_width=GRID_STROKE_WIDTH)
-                line1.set_points_as_corners(points1)
-                line1.set_stroke(opacity=opacity_i)
-                
-                line2 = VMobject(color=GRID_COLOR, stroke_width=GRID_STROKE_WIDTH)
-                line2.set_points_as_corners(points2)
-                line2.set_stroke(opacity=opacity_i)
+                # Muestras densas solo dentro del pozo; cada tramo plano es un solo segmento
+                points = field[:, :3] * [1, 1, depth_factor]
                 
-                lines.add(line1, line2)
+                line = Polyline(color=GRID_COLOR, stroke_width=GRID_STROKE_WIDTH)
+                line.set_points_as_corners(points)
+                line.set_stroke(opacity=opacity_i)
+                lines.add(line)
             return lines
         
         # CREAR SOMBRA con radio de deformación ajustable
@@ -74,7 +104,7 @@ class SpacetimeDeformation_bh(ThreeDScene):
                 return VGroup()
             
             surfaces = VGroup()
-            resolution = 30
+            resolution = res["shadow_resolution"]
             
             for i in range(resolution):
                 for j in range(resolution):
@@ -127,14 +157,18 @@ class SpacetimeDeformation_bh(ThreeDScene):
                 z = deformation_function(r, depth_factor, deformation_radius)
                 points.append([x, y, z])
             
-            circle = VMobject(color=color, stroke_width=CIRCLE_STROKE_WIDTH)
+            circle = Polyline(color=color, stroke_width=CIRCLE_STROKE_WIDTH)
             circle.set_points_as_corners(points)
             circle.set_stroke(opacity=1.0)
             return circle
         
         # Crear grilla inicial (plana, depth_factor=0)
         grid = create_deformed_grid(depth_factor=0.0)
+        # Solo se dibujan los tramos de la grilla que caen dentro del encuadre
+        self.camera.enable_culling(grid)
         shadow = create_grid_shadow(depth_factor=0.0)
+        # Líneas de la grilla y caras de la sombra: un trazo/relleno por estilo en lugar de uno por mobject
+        self.camera.enable_batching(grid, shadow)
         circle_rV = create_deformed_circle(r_V, RED, depth_factor=0.0)
         circle_rT = create_deformed_circle(r_T, YELLOW, depth_factor=0.0)
         
@@ -156,23 +190,23 @@ class SpacetimeDeformation_bh(ThreeDScene):
         label_rV = MathTex("r_V", color=RED, font_size=60).set_stroke(BLACK, width=3, background=True)
         label_rT = MathTex("r_T", color=YELLOW, font_size=60).set_stroke(BLACK, width=3, background=True)
         
-        # Función para actualizar labels mirando a la cámara
-        def update_label_rV(mob):
+        # Anclajes 3D de los labels: todos se proyectan juntos una vez por frame
+        def anchor_label_rV():
             z_pos = deformation_function(r_V, current_depth.get_value(), r_T)
-            point_3d = np.array([r_V + 0.7, 0.5, z_pos + 0.5])
-            point_2d = self.camera.project_point(point_3d)
-            mob.move_to(point_2d)
+            return [r_V + 0.7, 0.5, z_pos + 0.5]
         
-        def update_label_rT(mob):
+        def anchor_label_rT():
             z_pos = deformation_function(r_T, current_depth.get_value(), r_T)
-            point_3d = np.array([r_T + 0.7, 0.8, z_pos + 0.5])
-            point_2d = self.camera.project_point(point_3d)
-            mob.move_to(point_2d)
+            return [r_T + 0.7, 0.8, z_pos + 0.5]
         
-        # Fijar labels al frame y agregar updaters
+        # Se agrega al frente para actualizarse después de los demás updaters
+        billboards = BillboardLabels(self.camera)
+        self.add_foreground_mobject(billboards)
+        
+        # Fijar labels al frame y registrarlos
         self.add_fixed_in_frame_mobjects(label_rV, label_rT)
-        label_rV.add_updater(update_label_rV)
-        label_rT.add_updater(update_label_rT)
+        billboards.register(label_rV, anchor_label_rV)
+        billboards.register(label_rT, anchor_label_rT)
         
         self.play(
             Create(circle_rT),
@@ -205,38 +239,48 @@ class SpacetimeDeformation_bh(ThreeDScene):
         )
         dot_rT.set(glow_factor=1.2)
         
+        # Muestras de la geodésica entre r_V y r_T: las mismas para dibujarla y para medirla
+        geodesic_radii = r_V + np.linspace(0, 1, 51) * (r_T - r_V)
+        geodesic_plane = np.stack([geodesic_radii * np.cos(angle_ref), geodesic_radii * np.sin(angle_ref)], axis=1)
+        
         # Crear línea geodésica que seguirá la curvatura del espacio-tiempo
         def create_geodesic_line(depth_factor=0.0, deformation_radius=r_V):
             """Crea una línea que sigue la curvatura del espacio-tiempo"""
             points = []
-            num_points = 50
-            for i in range(num_points + 1):
-                t = i / num_points
-                x = (r_V + t * (r_T - r_V)) * np.cos(angle_ref)
-                y = (r_V + t * (r_T - r_V)) * np.sin(angle_ref)
-                r = np.sqrt(x**2 + y**2)
+            for (x, y), r in zip(geodesic_plane, geodesic_radii):
                 z = deformation_function(r, depth_factor, deformation_radius)
                 points.append([x, y, z])
             
-            line = VMobject(color=WHITE, stroke_width=4)
+            line = Polyline(color=WHITE, stroke_width=4)
             line.set_points_as_corners(points)
             return line
         
         geodesic_line = create_geodesic_line(depth_factor=0.0, deformation_radius=r_V)
         
-        # Label de distancia en espacio 3D (arriba de la línea geodésica)
-        distance_label = MathTex("d", color=WHITE, font_size=65).set_stroke(BLACK, width=3, background=True)
+        # Longitud de la geodésica sobre la superficie (deformada hasta r_T, como en la FASE 4A):
+        # la deformación es proporcional a la profundidad, así que basta la forma con depth = 1
+        geodesic_length = SurfaceDistance(
+            geodesic_plane,
+            [deformation_function(r, 1.0, r_T) for r in geodesic_radii]
+        )
+        # Distancia radial propia de Schwarzschild entre r_V (r_s) y r_T, para comparar
+        proper_distance = schwarzschild_proper_distance(geodesic_radii, r_V)[-1]
+        
+        def measured_distance():
+            return geodesic_length.length(current_depth.get_value())
         
-        def update_distance_label(mob):
+        # Label de distancia en espacio 3D (arriba de la línea geodésica), con su valor medido
+        distance_label = LiveNumberLabel("d =", measured_distance, color=WHITE, font_size=50)
+        distance_label.set_stroke(BLACK, width=3, background=True)
+        
+        def anchor_distance_label():
             # Posición 3D en el punto medio de la geodésica
             mid_r = (r_V + r_T) / 2
             z_pos = deformation_function(mid_r, 0.0, r_V)
-            point_3d = np.array([mid_r * np.cos(angle_ref), mid_r * np.sin(angle_ref), z_pos + 0.8])
-            point_2d = self.camera.project_point(point_3d)
-            mob.move_to(point_2d)
+            return [mid_r * np.cos(angle_ref), mid_r * np.sin(angle_ref), z_pos + 0.8]
         
         self.add_fixed_in_frame_mobjects(distance_label)
-        distance_label.add_updater(update_distance_label)
+        billboards.register(distance_label, anchor_distance_label)
         
         self.play(
             FadeIn(dot_rV, scale=0.3),
@@ -256,6 +300,7 @@ class SpacetimeDeformation_bh(ThreeDScene):
             FadeOut(distance_label),
             run_time=0.5
         )
+        billboards.unregister(distance_label)
         self.wait(0.3)
         
         # FASE 4A: DEFORMACIÓN LEVE hasta r_T (circunferencia amarilla)
@@ -306,12 +351,24 @@ class SpacetimeDeformation_bh(ThreeDScene):
         dummy.add_updater(update_current_depth)
         self.add(dummy)
         
+        # Lectura en vivo de la longitud de la geodésica mientras se deforma
+        distance_readout = LiveNumberLabel(
+            "d =",
+            lambda: geodesic_length.length(depth_tracker_1.get_value()),
+            color=WHITE,
+            font_size=40
+        ).to_corner(UR).shift(LEFT * 0.5 + DOWN * 0.5)
+        self.add_fixed_in_frame_mobjects(distance_readout)
+        self.play(FadeIn(distance_readout), run_time=0.5)
+        
         # Deformación leve (30% de intensidad) hasta r_T
-        self.play(
-            depth_tracker_1.animate.set_value(0.3),
-            run_time=2.5,
-            rate_func=linear
-        )
+        # Cada frame depende solo de la profundidad: se renderiza en paralelo
+        with frame_parallel(self):
+            self.play(
+                depth_tracker_1.animate.set_value(0.3),
+                run_time=2.5,
+                rate_func=linear
+            )
         
         # Remover updaters
         grid.clear_updaters()
@@ -324,47 +381,42 @@ class SpacetimeDeformation_bh(ThreeDScene):
         self.remove(dummy)
         
         self.wait(1)
+        self.play(FadeOut(distance_readout), run_time=0.5)
         
-        # Mostrar label de distancia después de primera deformación
-        distance_label_1 = MathTex("d_1", color=WHITE, font_size=65).set_stroke(BLACK, width=3, background=True)
+        # Mostrar label de distancia después de primera deformación: longitud sobre la superficie
+        distance_label_1 = LiveNumberLabel("d_1 =", measured_distance, color=WHITE, font_size=50)
+        distance_label_1.set_stroke(BLACK, width=3, background=True)
         
-        def update_distance_label_1(mob):
+        # d_1 y d_2 comparten el mismo anclaje (punto medio sobre la grilla deformada)
+        def anchor_distance_label_deformed():
             mid_r = (r_V + r_T) / 2
             z_pos = deformation_function(mid_r, current_depth.get_value(), r_T)
-            point_3d = np.array([mid_r * np.cos(angle_ref), mid_r * np.sin(angle_ref), z_pos + 0.8])
-            point_2d = self.camera.project_point(point_3d)
-            mob.move_to(point_2d)
+            return [mid_r * np.cos(angle_ref), mid_r * np.sin(angle_ref), z_pos + 0.8]
         
         self.add_fixed_in_frame_mobjects(distance_label_1)
-        distance_label_1.add_updater(update_distance_label_1)
+        billboards.register(distance_label_1, anchor_distance_label_deformed)
         
         self.play(Write(distance_label_1), run_time=0.8)
         self.wait(1.5)
         
         # Ocultar label
         self.play(FadeOut(distance_label_1), run_time=0.5)
-        distance_label_1.clear_updaters()
+        billboards.unregister(distance_label_1)
         self.wait(0.3)
         
-        # Mostrar label de distancia después de segunda deformación
-        distance_label_2 = MathTex("d_2", color=WHITE, font_size=65).set_stroke(BLACK, width=3, background=True)
-        
-        def update_distance_label_2(mob):
-            mid_r = (r_V + r_T) / 2
-            z_pos = deformation_function(mid_r, current_depth.get_value(), r_T)
-            point_3d = np.array([mid_r * np.cos(angle_ref), mid_r * np.sin(angle_ref), z_pos + 0.8])
-            point_2d = self.camera.project_point(point_3d)
-            mob.move_to(point_2d)
+        # Mostrar la distancia propia de Schwarzschild entre r_V y r_T para comparar con d_1
+        distance_label_2 = LiveNumberLabel("d_2 =", lambda: proper_distance, color=WHITE, font_size=50)
+        distance_label_2.set_stroke(BLACK, width=3, background=True)
         
         self.add_fixed_in_frame_mobjects(distance_label_2)
-        distance_label_2.add_updater(update_distance_label_2)
+        billboards.register(distance_label_2, anchor_distance_label_deformed)
         
         self.play(Write(distance_label_2), run_time=0.8)
         self.wait(1.5)
         
         # Ocultar label
         self.play(FadeOut(distance_label_2), run_time=0.5)
-        distance_label_2.clear_updaters()
+        billboards.unregister(distance_label_2)
         
         # Fade out de los puntos y la línea geodésica
         self.play(
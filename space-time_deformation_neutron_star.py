@@ -1,7 +1,18 @@
 from manim import *
 import numpy as np
+from herramientas import GeometryResolution, PipelinedFileWriter, Polyline, SegmentCacheCamera, StateHashRenderer, adaptive_line_samples, frame_parallel
 
 class SpacetimeDeformation_neutronstar(ThreeDScene):
+    def __init__(self, **kwargs):
+        # Cámara que reutiliza geometría y frames cuando solo se mueve la cámara;
+        # los segmentos ya renderizados se reutilizan según el estado de la escena
+        # y la codificación se solapa con el render del segmento siguiente
+        super().__init__(
+            camera_class=SegmentCacheCamera,
+            renderer=StateHashRenderer(camera_class=SegmentCacheCamera, file_writer_class=PipelinedFileWriter),
+            **kwargs
+        )
+
     def construct(self):
         # Configurar la cámara en perspectiva inclinada
         self.set_camera_orientation(phi=45 * DEGREES, theta=-45 * DEGREES, distance=13)
@@ -10,6 +21,8 @@ class SpacetimeDeformation_neutronstar(ThreeDScene):
         r_V = 2.5  # Radio de Schwarzschild (rojo)
         r_T = 4.5  # Radio exterior (amarillo)
         grid_size = 15
+        # Densidad de muestreo según la calidad del render (herramientas/resolution.py)
+        res = GeometryResolution(shadow_resolution=35)
         
         GRID_STROKE_WIDTH = 0.6
         CIRCLE_STROKE_WIDTH = 6
@@ -68,7 +81,8 @@ class SpacetimeDeformation_neutronstar(ThreeDScene):
                 dist_from_center_i = abs(i) / grid_size
                 opacity_i = 1.0 - (dist_from_center_i ** 1.5) * 0.7
                 
-                for j in np.linspace(-grid_size, grid_size, 120):
+                # Muestras densas solo dentro del pozo; cada tramo plano es un solo segmento
+                for j in adaptive_line_samples(i, grid_size, res["grid_samples"], r_T):
                     r = np.sqrt(i**2 + j**2)
                     z = deformation_function(r, depth_factor)
                     points1.append([i, j, z])
@@ -77,11 +91,11 @@ class SpacetimeDeformation_neutronstar(ThreeDScene):
                     z = deformation_function(r, depth_factor)
                     points2.append([j, i, z])
                 
-                line1 = VMobject(color=GRID_COLOR, stroke_width=GRID_STROKE_WIDTH)
+                line1 = Polyline(color=GRID_COLOR, stroke_width=GRID_STROKE_WIDTH)
                 line1.set_points_as_corners(points1)
                 line1.set_stroke(opacity=opacity_i)
                 
-                line2 = VMobject(color=GRID_COLOR, stroke_width=GRID_STROKE_WIDTH)
+                line2 = Polyline(color=GRID_COLOR, stroke_width=GRID_STROKE_WIDTH)
                 line2.set_points_as_corners(points2)
                 line2.set_stroke(opacity=opacity_i)
                 
@@ -94,7 +108,7 @@ class SpacetimeDeformation_neutronstar(ThreeDScene):
                 return VGroup()
             
             surfaces = VGroup()
-            resolution = 35
+            resolution = res["shadow_resolution"]
             
             for i in range(resolution):
                 for j in range(resolution):
@@ -145,14 +159,18 @@ class SpacetimeDeformation_neutronstar(ThreeDScene):
                 z = deformation_function(radius, depth_factor)
                 points.append([x, y, z])
             
-            circle = VMobject(color=color, stroke_width=CIRCLE_STROKE_WIDTH)
+            circle = Polyline(color=color, stroke_width=CIRCLE_STROKE_WIDTH)
             circle.set_points_as_corners(points)
             circle.set_stroke(opacity=1.0)
             return circle
         
         # Crear elementos iniciales
         grid = create_deformed_grid(depth_factor=0.0)
+        # Solo se dibujan los tramos de la grilla que caen dentro del encuadre
+        self.camera.enable_culling(grid)
         shadow = create_grid_shadow(depth_factor=0.0)
+        # Líneas de la grilla y caras de la sombra: un trazo/relleno por estilo en lugar de uno por mobject
+        self.camera.enable_batching(grid, shadow)
         circle_rV = create_deformed_circle(r_V, RED, depth_factor=0.0)
         circle_rT = create_deformed_circle(r_T, YELLOW, depth_factor=0.0)
         
@@ -205,7 +223,7 @@ class SpacetimeDeformation_neutronstar(ThreeDScene):
                 z = deformation_function(r, depth_factor)
                 points.append([x, y, z])
             
-            line = VMobject(color=WHITE, stroke_width=4)
+            line = Polyline(color=WHITE, stroke_width=4)
             line.set_points_as_corners(points)
             return line
         
@@ -276,11 +294,13 @@ class SpacetimeDeformation_neutronstar(ThreeDScene):
         center_dot.add_updater(update_center_dot)
         
         # Deformación
-        self.play(
-            depth_tracker.animate.set_value(1.0),
-            run_time=4.5,
-            rate_func=linear
-        )
+        # Cada frame depende solo de la profundidad: se renderiza en paralelo
+        with frame_parallel(self):
+            self.play(
+                depth_tracker.animate.set_value(1.0),
+                run_time=4.5,
+                rate_func=linear
+            )
         
         # Remover updaters
         grid.clear_updaters()